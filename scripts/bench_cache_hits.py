@@ -0,0 +1,138 @@
+"""
+Micro-benchmark of cache-hit latency for each financial data endpoint.
+
+Usage:
+    python scripts/bench_cache_hits.py [--repeat 200]
+
+This script will:
+  1. Fill an in-memory cache with synthetic rows for every endpoint
+  2. Time a cache hit through the async functions in src/tools/api.py (no request is ever sent)
+  3. Time the previous hit path, which looked up the same rows and re-validated each one with Model(**row)
+  4. Print the median latency of both and the speed-up per endpoint
+
+No API key or network access is needed.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import datetime
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.data.cache import Cache  # noqa: E402
+from src.data.cache_backends import MemoryCacheBackend  # noqa: E402
+from src.data.history import ALL_FIELDS  # noqa: E402
+from src.data.models import CompanyNews, FinancialMetrics, InsiderTrade, LineItem, Price  # noqa: E402
+from src.data.price_frame import PriceFrame  # noqa: E402
+from src.tools import api, financial_datasets  # noqa: E402
+
+TICKER = "AAPL"
+START_DATE = "2023-07-01"
+END_DATE = "2024-06-30"
+LINE_ITEMS = ["revenue", "net_income", "free_cash_flow", "total_debt", "outstanding_shares", "capital_expenditure"]
+
+
+def _report_periods(count: int) -> list[str]:
+    return [f"{2023 - i // 4}-{[12, 9, 6, 3][i % 4]:02d}-{[31, 30, 30, 31][i % 4]}" for i in range(count)]
+
+
+def _price_rows(bars: int) -> list[dict]:
+    start = datetime.date.fromisoformat(START_DATE)
+    days = [start + datetime.timedelta(days=i) for i in range(bars)]
+    return [{"open": 100.0 + i, "close": 101.0 + i, "high": 102.0 + i, "low": 99.0 + i, "volume": 1_000_000 + i, "time": f"{day.isoformat()}T04:00:00Z"} for i, day in enumerate(days)]
+
+
+def fill_cache(cache: Cache, rows: int, articles: int, bars: int) -> None:
+    cache.set_prices(TICKER, PriceFrame.from_records(_price_rows(bars)), covered=(START_DATE, END_DATE))
+
+    metric_fields = {name: 0.1 for name in FinancialMetrics.model_fields if name not in ("ticker", "report_period", "period", "currency")}
+    metrics = [{"ticker": TICKER, "report_period": rp, "period": "ttm", "currency": "USD", **metric_fields} for rp in _report_periods(rows)]
+    cache.set_financial_metrics(TICKER, "ttm", END_DATE, rows, metrics)
+
+    items = [{"ticker": TICKER, "report_period": rp, "period": "ttm", "currency": "USD", **{name: 1.0e9 for name in LINE_ITEMS}} for rp in _report_periods(rows)]
+    cache.set_line_items(TICKER, "ttm", LINE_ITEMS, END_DATE, rows, items)
+
+    trade_fields = {name: None for name in InsiderTrade.model_fields}
+    trades = [{**trade_fields, "ticker": TICKER, "filing_date": f"2024-06-{1 + i % 28:02d}T{i % 24:02d}:00:00", "transaction_shares": 100.0 + i} for i in range(articles)]
+    cache.record_insider_trades(TICKER, [InsiderTrade(**trade) for trade in trades], "2024-06-01", END_DATE, articles)
+
+    news = [{"ticker": TICKER, "title": f"Headline {i}", "author": "x", "source": "y", "date": f"2024-06-{1 + i % 28:02d}T{i % 24:02d}:{i % 60:02d}:00", "url": "https://example.com", "sentiment": "positive"} for i in range(articles)]
+    cache.record_company_news(TICKER, [CompanyNews(**item) for item in news], "2024-06-01", END_DATE, articles)
+
+
+async def _median_ms(fn, repeat: int) -> float:
+    await fn()  # warm up
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--repeat", type=int, default=200, help="timed hits per endpoint (default 200)")
+    parser.add_argument("--rows", type=int, default=10, help="report rows for metrics and line items (default 10)")
+    parser.add_argument("--articles", type=int, default=1000, help="news articles and insider trades (default 1000)")
+    parser.add_argument("--bars", type=int, default=366, help="daily price bars (default 366, one per day of the cached year)")
+    args = parser.parse_args()
+
+    cache = Cache(backend=MemoryCacheBackend())
+    fill_cache(cache, args.rows, args.articles, args.bars)
+    api._cache = cache
+
+    async def no_network(*_args, **_kwargs):
+        raise RuntimeError("cache miss - the benchmark must only measure hits")
+
+    financial_datasets._amake_api_request = no_network
+
+    # Previous hit path: cached dicts re-validated on every read
+    price_rows = _price_rows(args.bars)
+    trade_rows = [trade.model_dump() for trade in cache.get_insider_trades(TICKER).select(None, END_DATE, args.articles)]
+    news_rows = [item.model_dump() for item in cache.get_company_news(TICKER).select(None, END_DATE, args.articles)]
+
+    async def prices_before():
+        cache.get_prices(TICKER)
+        return [Price(**row) for row in price_rows if START_DATE <= row["time"][:10] <= END_DATE]
+
+    async def metrics_before():
+        return [FinancialMetrics(**row) for row in cache.get_financial_metrics(TICKER, "ttm").select(END_DATE, args.rows)]
+
+    async def line_items_before():
+        return [LineItem(**row) for row in cache.get_line_items(TICKER, "ttm").select(END_DATE, args.rows)]
+
+    async def insider_trades_before():
+        cache.get_insider_trades(TICKER)
+        return [InsiderTrade(**row) for row in trade_rows]
+
+    async def company_news_before():
+        cache.get_company_news(TICKER)
+        return [CompanyNews(**row) for row in news_rows]
+
+    cases = {
+        "prices": (prices_before, lambda: api.aget_price_frame(TICKER, START_DATE, END_DATE)),
+        "financial_metrics": (metrics_before, lambda: api.aget_financial_metrics(TICKER, END_DATE, limit=args.rows)),
+        "line_items": (line_items_before, lambda: api.asearch_line_items(TICKER, LINE_ITEMS, END_DATE, limit=args.rows)),
+        "insider_trades": (insider_trades_before, lambda: api.aget_insider_trades(TICKER, END_DATE, limit=args.articles)),
+        "company_news": (company_news_before, lambda: api.aget_company_news(TICKER, END_DATE, limit=args.articles)),
+    }
+    assert cache.get_financial_metrics(TICKER, "ttm").covers(ALL_FIELDS, END_DATE, args.rows)
+
+    async def run():
+        print(f"{'endpoint':<20}{'validated (ms)':>16}{'cache hit (ms)':>16}{'speed-up':>10}")
+        for name, (before_fn, after_fn) in cases.items():
+            before = await _median_ms(before_fn, args.repeat)
+            after = await _median_ms(after_fn, args.repeat)
+            print(f"{name:<20}{before:>16.3f}{after:>16.3f}{before / after:>9.1f}x")
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
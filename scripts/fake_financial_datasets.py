@@ -0,0 +1,341 @@
+"""
+A local stand-in for the Financial Datasets API, serving synthetic data for load tests.
+
+Usage:
+    python scripts/fake_financial_datasets.py [--port 8001] [--latency-ms 80] [--jitter-ms 40]
+        [--rate-limit-probability 0.05] [--requests-per-minute 600] [--news-per-day 5]
+        [--trades-per-day 1] [--padding-bytes 0] [--missing-ticker ZZZZ ...]
+
+Then point the client at it:
+    FINANCIAL_DATASETS_BASE_URL=http://127.0.0.1:8001 poetry run python src/main.py --tickers AAPL,MSFT,NVDA
+
+Every endpoint src/tools/financial_datasets.py calls is served with responses that
+validate against the models in src/data/models.py and honour the same query
+parameters (date bounds, period, limit), so the client, cache, rate limiter and agent
+fan-out run exactly as they would against the real API - with no network or quota.
+Data is deterministic per ticker and date, so repeated runs see the same values.
+
+Knobs:
+  --latency-ms / --jitter-ms        delay added to every response
+  --rate-limit-probability          share of requests answered with 429 (and Retry-After)
+  --requests-per-minute             also answer 429 once this many requests hit one minute (0 = no quota)
+  --news-per-day / --trades-per-day how many items each day holds (response size of the event endpoints)
+  --padding-bytes                   extra text per news article and insider trade, for larger payloads
+  --missing-ticker                  tickers answered with 404, as unknown tickers are
+
+Remember the client's own limiter: raise FINANCIAL_DATASETS_RATE_LIMIT (and
+FINANCIAL_DATASETS_MAX_CONCURRENCY) to load-test beyond the default plan quota.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import datetime
+import math
+import random
+import sys
+import time
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.data.models import FinancialMetrics, InsiderTrade  # noqa: E402
+
+# Nothing is generated before this day
+EARLIEST_DATE = datetime.date(2000, 1, 1)
+
+_REPORT_FIELDS = ("ticker", "report_period", "period", "currency")
+_SENTIMENTS = ("positive", "negative", "neutral")
+
+
+@dataclass
+class FakeApiConfig:
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    rate_limit_probability: float = 0.0
+    retry_after: float = 1.0
+    requests_per_minute: int = 0
+    news_per_day: int = 5
+    trades_per_day: int = 1
+    padding_bytes: int = 0
+    missing_tickers: frozenset[str] = field(default_factory=frozenset)
+
+
+class LineItemSearch(BaseModel):
+    tickers: list[str]
+    line_items: list[str]
+    end_date: str
+    period: str = "ttm"
+    limit: int = 10
+
+
+def create_app(config: FakeApiConfig | None = None) -> FastAPI:
+    """The stand-in API as an ASGI app (serve it with uvicorn, or test it with TestClient)."""
+    config = config or FakeApiConfig()
+    app = FastAPI(title="Fake Financial Datasets API")
+    window = {"minute": 0, "count": 0}
+
+    @app.middleware("http")
+    async def simulate_network(request: Request, call_next):
+        delay = config.latency_ms + random.uniform(0, config.jitter_ms)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+
+        minute = int(time.monotonic() // 60)
+        if window["minute"] != minute:
+            window["minute"], window["count"] = minute, 0
+        window["count"] += 1
+        over_quota = config.requests_per_minute and window["count"] > config.requests_per_minute
+        if over_quota or random.random() < config.rate_limit_probability:
+            return JSONResponse({"error": "Rate limit exceeded"}, status_code=429, headers={"Retry-After": f"{config.retry_after:g}"})
+
+        ticker = request.query_params.get("ticker")
+        if ticker and ticker.upper() in config.missing_tickers:
+            return JSONResponse({"error": f"No data for {ticker}"}, status_code=404)
+        return await call_next(request)
+
+    @app.get("/prices/")
+    async def prices(ticker: str, start_date: str, end_date: str, interval: str = "day", interval_multiplier: int = 1):
+        return {"ticker": ticker, "prices": synthetic_prices(ticker, start_date, end_date)}
+
+    @app.get("/financial-metrics/")
+    async def financial_metrics(ticker: str, report_period_lte: str, period: str = "ttm", limit: int = 10):
+        return {"financial_metrics": synthetic_financial_metrics(ticker, report_period_lte, period, limit)}
+
+    @app.post("/financials/search/line-items")
+    async def search_line_items(search: LineItemSearch):
+        # The limit covers the whole response, shared evenly between the tickers
+        tickers = [ticker for ticker in search.tickers if ticker.upper() not in config.missing_tickers]
+        per_ticker = -(-search.limit // max(len(search.tickers), 1))
+        results = [row for ticker in tickers for row in synthetic_line_items(ticker, search.line_items, search.end_date, search.period, per_ticker)]
+        return {"search_results": results[: search.limit]}
+
+    @app.get("/insider-trades/")
+    async def insider_trades(ticker: str, filing_date_lte: str, filing_date_gte: str | None = None, limit: int = 100):
+        return {"insider_trades": synthetic_insider_trades(ticker, filing_date_gte, filing_date_lte, limit, config.trades_per_day, config.padding_bytes)}
+
+    @app.get("/news/")
+    async def news(ticker: str, end_date: str, start_date: str | None = None, limit: int = 100):
+        return {"news": synthetic_company_news(ticker, start_date, end_date, limit, config.news_per_day, config.padding_bytes)}
+
+    @app.get("/company/facts/")
+    async def company_facts(ticker: str):
+        return {"company_facts": synthetic_company_facts(ticker)}
+
+    return app
+
+
+def synthetic_prices(ticker: str, start_date: str, end_date: str) -> list[dict]:
+    """Daily bars for the weekdays in [start_date, end_date], oldest first."""
+    base = _base_price(ticker)
+    bars = []
+    day = datetime.date.fromisoformat(start_date)
+    last = datetime.date.fromisoformat(end_date)
+    while day <= last:
+        if day.weekday() < 5:
+            rng = _rng(ticker, "price", day)
+            close = base * (1 + 0.25 * math.sin(day.toordinal() / 45)) * (1 + rng.gauss(0, 0.01))
+            open_ = close * (1 + rng.gauss(0, 0.005))
+            bars.append(
+                {
+                    "open": round(open_, 2),
+                    "close": round(close, 2),
+                    "high": round(max(open_, close) * (1 + abs(rng.gauss(0, 0.004))), 2),
+                    "low": round(min(open_, close) * (1 - abs(rng.gauss(0, 0.004))), 2),
+                    "volume": rng.randint(1_000_000, 50_000_000),
+                    "time": f"{day.isoformat()}T00:00:00Z",
+                }
+            )
+        day += datetime.timedelta(days=1)
+    return bars
+
+
+def synthetic_financial_metrics(ticker: str, end_date: str, period: str, limit: int) -> list[dict]:
+    """The latest `limit` reports of the period up to end_date, newest first, with every FinancialMetrics field."""
+    rows = []
+    for report_period in _report_periods(end_date, period, limit):
+        rng = _rng(ticker, "metrics", period, report_period)
+        row = {"ticker": ticker, "report_period": report_period, "period": period, "currency": "USD"}
+        row.update({name: _metric_value(name, rng) for name in FinancialMetrics.model_fields if name not in _REPORT_FIELDS})
+        rows.append(row)
+    return rows
+
+
+def synthetic_line_items(ticker: str, line_items: list[str], end_date: str, period: str, limit: int) -> list[dict]:
+    """Like synthetic_financial_metrics for arbitrary line item names."""
+    rows = []
+    for report_period in _report_periods(end_date, period, limit):
+        rng = _rng(ticker, "line_items", period, report_period)
+        row = {"ticker": ticker, "report_period": report_period, "period": period, "currency": "USD"}
+        row.update({name: round(rng.uniform(1e8, 5e10), 2) for name in line_items if name not in _REPORT_FIELDS})
+        rows.append(row)
+    return rows
+
+
+def synthetic_insider_trades(ticker: str, start_date: str | None, end_date: str, limit: int, per_day: int = 1, padding_bytes: int = 0) -> list[dict]:
+    """Trades filed in [start_date, end_date] (or the latest `limit` up to end_date), newest first, at most `limit`."""
+    fields = list(InsiderTrade.model_fields)
+    trades = []
+    for day in _days_back(start_date, end_date, limit, per_day):
+        for i in range(per_day):
+            rng = _rng(ticker, "insider", day, i)
+            shares = float(rng.randint(100, 100_000)) * rng.choice((1, -1))
+            price = round(_base_price(ticker) * rng.uniform(0.8, 1.2), 2)
+            owned_before = float(rng.randint(100_000, 5_000_000))
+            trade = dict.fromkeys(fields)
+            trade.update(
+                {
+                    "ticker": ticker,
+                    "issuer": f"{ticker} Inc.",
+                    "name": f"Insider {i} {_padding(padding_bytes)}".rstrip(),
+                    "title": rng.choice(("CEO", "CFO", "Director", "General Counsel")),
+                    "is_board_director": rng.random() < 0.3,
+                    "transaction_date": day.isoformat(),
+                    "transaction_shares": shares,
+                    "transaction_price_per_share": price,
+                    "transaction_value": round(shares * price, 2),
+                    "shares_owned_before_transaction": owned_before,
+                    "shares_owned_after_transaction": owned_before + shares,
+                    "security_title": "Common Stock",
+                    "filing_date": day.isoformat(),
+                }
+            )
+            trades.append(trade)
+    return trades[:limit]
+
+
+def synthetic_company_news(ticker: str, start_date: str | None, end_date: str, limit: int, per_day: int = 5, padding_bytes: int = 0) -> list[dict]:
+    """Articles published in [start_date, end_date] (or the latest `limit` up to end_date), newest first, at most `limit`."""
+    articles = []
+    for day in _days_back(start_date, end_date, limit, per_day):
+        for i in range(per_day):
+            rng = _rng(ticker, "news", day, i)
+            seconds = 86399 - i * (86400 // per_day)
+            articles.append(
+                {
+                    "ticker": ticker,
+                    "title": f"{ticker} headline {day.isoformat()} #{i} {_padding(padding_bytes)}".rstrip(),
+                    "author": rng.choice(("Staff", "Newswire", "Markets Desk")),
+                    "source": rng.choice(("Reuters", "Bloomberg", "MarketWatch")),
+                    "date": f"{day.isoformat()}T{seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}Z",
+                    "url": f"https://example.com/{ticker.lower()}/{day.isoformat()}/{i}",
+                    "sentiment": rng.choice(_SENTIMENTS),
+                }
+            )
+    return articles[:limit]
+
+
+def synthetic_company_facts(ticker: str) -> dict:
+    rng = _rng(ticker, "facts")
+    shares = rng.randint(100_000_000, 10_000_000_000)
+    return {
+        "ticker": ticker,
+        "name": f"{ticker} Inc.",
+        "cik": f"{zlib.crc32(ticker.encode()) % 10_000_000:010d}",
+        "industry": "Technology Hardware",
+        "sector": "Information Technology",
+        "category": "Common Stock",
+        "exchange": "NASDAQ",
+        "is_active": True,
+        "listing_date": "2000-01-03",
+        "location": "Cupertino, CA",
+        "market_cap": round(shares * _base_price(ticker), 2),
+        "number_of_employees": rng.randint(1_000, 200_000),
+        "sec_filings_url": f"https://www.sec.gov/cgi-bin/browse-edgar?action=getcompany&CIK={ticker}",
+        "sic_code": "3571",
+        "sic_industry": "Electronic Computers",
+        "sic_sector": "Manufacturing",
+        "website_url": f"https://www.{ticker.lower()}.example.com",
+        "weighted_average_shares": shares,
+    }
+
+
+def _rng(*key) -> random.Random:
+    # String seeds are hashed deterministically, unlike hash() of a tuple
+    return random.Random("|".join(str(part) for part in key))
+
+
+def _base_price(ticker: str) -> float:
+    return 20.0 + zlib.crc32(ticker.encode()) % 480
+
+
+def _padding(size: int) -> str:
+    return "x" * size
+
+
+def _metric_value(name: str, rng: random.Random) -> float:
+    if name in ("market_cap", "enterprise_value"):
+        return round(rng.uniform(1e10, 3e12), 2)
+    if any(part in name for part in ("margin", "return_on", "growth", "yield", "payout")):
+        return round(rng.uniform(-0.2, 0.6), 4)
+    return round(rng.uniform(0.5, 40.0), 4)
+
+
+def _report_periods(end_date: str, period: str, limit: int) -> list[str]:
+    """The latest `limit` period ends up to end_date, newest first: Dec 31 for annual reports, quarter ends otherwise."""
+    end = datetime.date.fromisoformat(end_date)
+    months = (12,) if period == "annual" else (3, 6, 9, 12)
+    periods = []
+    year = end.year
+    while len(periods) < limit and year >= EARLIEST_DATE.year:
+        for month in reversed(months):
+            last_day = datetime.date(year + month // 12, month % 12 + 1, 1) - datetime.timedelta(days=1)
+            if last_day <= end and len(periods) < limit:
+                periods.append(last_day.isoformat())
+        year -= 1
+    return periods
+
+
+def _days_back(start_date: str | None, end_date: str, limit: int, per_day: int):
+    """Days from end_date back to start_date, or back far enough to fill `limit` items without one."""
+    if per_day <= 0:
+        return
+    day = datetime.date.fromisoformat(end_date)
+    first = datetime.date.fromisoformat(start_date) if start_date else EARLIEST_DATE
+    produced = 0
+    while day >= first and produced < limit:
+        yield day
+        produced += per_day
+        day -= datetime.timedelta(days=1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve synthetic Financial Datasets API responses for load tests")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Delay added to every response")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Extra random delay, uniform in [0, jitter]")
+    parser.add_argument("--rate-limit-probability", type=float, default=0.0, help="Share of requests answered with 429")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After seconds sent with each 429")
+    parser.add_argument("--requests-per-minute", type=int, default=0, help="Quota after which every request in the minute gets 429 (0 = none)")
+    parser.add_argument("--news-per-day", type=int, default=5)
+    parser.add_argument("--trades-per-day", type=int, default=1)
+    parser.add_argument("--padding-bytes", type=int, default=0, help="Extra text per news article and insider trade")
+    parser.add_argument("--missing-ticker", action="append", default=[], help="Ticker answered with 404 (repeatable)")
+    args = parser.parse_args()
+
+    config = FakeApiConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        rate_limit_probability=args.rate_limit_probability,
+        retry_after=args.retry_after,
+        requests_per_minute=args.requests_per_minute,
+        news_per_day=args.news_per_day,
+        trades_per_day=args.trades_per_day,
+        padding_bytes=args.padding_bytes,
+        missing_tickers=frozenset(ticker.upper() for ticker in args.missing_ticker),
+    )
+
+    import uvicorn
+
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,14 +8,17 @@ from src.graph.state import AgentState, show_agent_reasoning
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.messages import HumanMessage
 
+from src.data.needs import FinancialMetricsNeed, LineItemsNeed, MarketCapNeed
 from src.tools.api import (
-    get_financial_metrics,
-    get_market_cap,
-    search_line_items,
+    aget_financial_metrics,
+    aget_market_cap,
+    asearch_line_items,
 )
+from src.tools.http_client import run_isolated
 from src.utils.api_key import get_api_key_from_state
-from src.utils.llm import call_llm
+from src.utils.llm import acall_llm
 from src.utils.progress import progress
+from src.utils.parallel import amap_tickers
 
 
 class AswathDamodaranSignal(BaseModel):
@@ -24,7 +27,26 @@ class AswathDamodaranSignal(BaseModel):
     reasoning: str
 
 
-def aswath_damodaran_agent(state: AgentState, agent_id: str = "aswath_damodaran_agent"):
+LINE_ITEMS = [
+    "free_cash_flow",
+    "ebit",
+    "interest_expense",
+    "capital_expenditure",
+    "depreciation_and_amortization",
+    "outstanding_shares",
+    "net_income",
+    "total_debt",
+]
+
+# Data read for every ticker, declared so it can be prefetched before the agent runs
+DATA_NEEDS = [
+    FinancialMetricsNeed(period="ttm", limit=5),
+    LineItemsNeed(LINE_ITEMS, period="ttm", limit=10),
+    MarketCapNeed(),
+]
+
+
+async def aaswath_damodaran_agent(state: AgentState, agent_id: str = "aswath_damodaran_agent"):
     """
     Analyze US equities through Aswath Damodaran's intrinsic-value lens:
       • Cost of Equity via CAPM (risk-free + β·ERP)
@@ -38,33 +60,24 @@ def aswath_damodaran_agent(state: AgentState, agent_id: str = "aswath_damodaran_
     tickers   = data["tickers"]
     api_key  = get_api_key_from_state(state, "FINANCIAL_DATASETS_API_KEY")
 
-    analysis_data: dict[str, dict] = {}
-    damodaran_signals: dict[str, dict] = {}
+    async def analyze_ticker(ticker: str) -> dict:
+        # This ticker's analysis only, so the prompt carries no other tickers
+        analysis_data = {}
 
-    for ticker in tickers:
         # ─── Fetch core data ────────────────────────────────────────────────────
         progress.update_status(agent_id, ticker, "Fetching financial metrics")
-        metrics = get_financial_metrics(ticker, end_date, period="ttm", limit=5, api_key=api_key)
+        metrics = await aget_financial_metrics(ticker, end_date, period="ttm", limit=5, api_key=api_key)
 
         progress.update_status(agent_id, ticker, "Fetching financial line items")
-        line_items = search_line_items(
+        line_items = await asearch_line_items(
             ticker,
-            [
-                "free_cash_flow",
-                "ebit",
-                "interest_expense",
-                "capital_expenditure",
-                "depreciation_and_amortization",
-                "outstanding_shares",
-                "net_income",
-                "total_debt",
-            ],
+            LINE_ITEMS,
             end_date,
             api_key=api_key,
         )
 
         progress.update_status(agent_id, ticker, "Getting market cap")
-        market_cap = get_market_cap(ticker, end_date, api_key=api_key)
+        market_cap = await aget_market_cap(ticker, end_date, api_key=api_key)
 
         # ─── Analyses ───────────────────────────────────────────────────────────
         progress.update_status(agent_id, ticker, "Analyzing growth and reinvestment")
@@ -114,27 +127,33 @@ def aswath_damodaran_agent(state: AgentState, agent_id: str = "aswath_damodaran_
 
         # ─── LLM: craft Damodaran-style narrative ──────────────────────────────
         progress.update_status(agent_id, ticker, "Generating Damodaran analysis")
-        damodaran_output = generate_damodaran_output(
+        damodaran_output = await generate_damodaran_output(
             ticker=ticker,
             analysis_data=analysis_data,
             state=state,
             agent_id=agent_id,
         )
 
-        damodaran_signals[ticker] = damodaran_output.model_dump()
-
         progress.update_status(agent_id, ticker, "Done", analysis=damodaran_output.reasoning)
 
+        return damodaran_output.model_dump()
+
+    damodaran_signals = await amap_tickers(agent_id, tickers, analyze_ticker)
+
     # ─── Push message back to graph state ──────────────────────────────────────
     message = HumanMessage(content=json.dumps(damodaran_signals), name=agent_id)
 
     if state["metadata"]["show_reasoning"]:
         show_agent_reasoning(damodaran_signals, "Aswath Damodaran Agent")
 
-    state["data"]["analyst_signals"][agent_id] = damodaran_signals
     progress.update_status(agent_id, None, "Done")
 
-    return {"messages": [message], "data": state["data"]}
+    return {"messages": [message], "data": {"analyst_signals": {agent_id: damodaran_signals}}}
+
+
+def aswath_damodaran_agent(state: AgentState, agent_id: str = "aswath_damodaran_agent"):
+    """Synchronous version of aaswath_damodaran_agent."""
+    return run_isolated(aaswath_damodaran_agent(state, agent_id))
 
 
 # ────────────────────────────────────────────────────────────────────────────────
@@ -358,7 +377,7 @@ def estimate_cost_of_equity(beta: float | None) -> float:
 # ────────────────────────────────────────────────────────────────────────────────
 # LLM generation
 # ────────────────────────────────────────────────────────────────────────────────
-def generate_damodaran_output(
+async def generate_damodaran_output(
     ticker: str,
     analysis_data: dict[str, any],
     state: AgentState,
@@ -410,7 +429,7 @@ def generate_damodaran_output(
             reasoning="Parsing error; defaulting to neutral",
         )
 
-    return call_llm(
+    return await acall_llm(
         prompt=prompt,
         pydantic_model=AswathDamodaranSignal,
         agent_name=agent_id,
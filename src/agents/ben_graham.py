@@ -1,12 +1,15 @@
 from src.graph.state import AgentState, show_agent_reasoning
-from src.tools.api import get_financial_metrics, get_market_cap, search_line_items
+from src.data.needs import FinancialMetricsNeed, LineItemsNeed, MarketCapNeed
+from src.tools.api import aget_financial_metrics, aget_market_cap, asearch_line_items
+from src.tools.http_client import run_isolated
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.messages import HumanMessage
 from pydantic import BaseModel
 import json
 from typing_extensions import Literal
 from src.utils.progress import progress
-from src.utils.llm import call_llm
+from src.utils.parallel import amap_tickers
+from src.utils.llm import acall_llm
 import math
 from src.utils.api_key import get_api_key_from_state
 
@@ -17,7 +20,17 @@ class BenGrahamSignal(BaseModel):
     reasoning: str
 
 
-def ben_graham_agent(state: AgentState, agent_id: str = "ben_graham_agent"):
+LINE_ITEMS = ["earnings_per_share", "revenue", "net_income", "book_value_per_share", "total_assets", "total_liabilities", "current_assets", "current_liabilities", "dividends_and_other_cash_distributions", "outstanding_shares"]
+
+# Data read for every ticker, declared so it can be prefetched before the agent runs
+DATA_NEEDS = [
+    FinancialMetricsNeed(period="annual", limit=10),
+    LineItemsNeed(LINE_ITEMS, period="annual", limit=10),
+    MarketCapNeed(),
+]
+
+
+async def aben_graham_agent(state: AgentState, agent_id: str = "ben_graham_agent"):
     """
     Analyzes stocks using Benjamin Graham's classic value-investing principles:
     1. Earnings stability over multiple years.
@@ -29,19 +42,19 @@ def ben_graham_agent(state: AgentState, agent_id: str = "ben_graham_agent"):
     end_date = data["end_date"]
     tickers = data["tickers"]
     api_key = get_api_key_from_state(state, "FINANCIAL_DATASETS_API_KEY")
-    
-    analysis_data = {}
-    graham_analysis = {}
 
-    for ticker in tickers:
+    async def analyze_ticker(ticker: str) -> dict:
+        # This ticker's analysis only, so the prompt carries no other tickers
+        analysis_data = {}
+
         progress.update_status(agent_id, ticker, "Fetching financial metrics")
-        metrics = get_financial_metrics(ticker, end_date, period="annual", limit=10, api_key=api_key)
+        metrics = await aget_financial_metrics(ticker, end_date, period="annual", limit=10, api_key=api_key)
 
         progress.update_status(agent_id, ticker, "Gathering financial line items")
-        financial_line_items = search_line_items(ticker, ["earnings_per_share", "revenue", "net_income", "book_value_per_share", "total_assets", "total_liabilities", "current_assets", "current_liabilities", "dividends_and_other_cash_distributions", "outstanding_shares"], end_date, period="annual", limit=10, api_key=api_key)
+        financial_line_items = await asearch_line_items(ticker, LINE_ITEMS, end_date, period="annual", limit=10, api_key=api_key)
 
         progress.update_status(agent_id, ticker, "Getting market cap")
-        market_cap = get_market_cap(ticker, end_date, api_key=api_key)
+        market_cap = await aget_market_cap(ticker, end_date, api_key=api_key)
 
         # Perform sub-analyses
         progress.update_status(agent_id, ticker, "Analyzing earnings stability")
@@ -68,17 +81,19 @@ def ben_graham_agent(state: AgentState, agent_id: str = "ben_graham_agent"):
         analysis_data[ticker] = {"signal": signal, "score": total_score, "max_score": max_possible_score, "earnings_analysis": earnings_analysis, "strength_analysis": strength_analysis, "valuation_analysis": valuation_analysis}
 
         progress.update_status(agent_id, ticker, "Generating Ben Graham analysis")
-        graham_output = generate_graham_output(
+        graham_output = await generate_graham_output(
             ticker=ticker,
             analysis_data=analysis_data,
             state=state,
             agent_id=agent_id,
         )
 
-        graham_analysis[ticker] = {"signal": graham_output.signal, "confidence": graham_output.confidence, "reasoning": graham_output.reasoning}
-
         progress.update_status(agent_id, ticker, "Done", analysis=graham_output.reasoning)
 
+        return {"signal": graham_output.signal, "confidence": graham_output.confidence, "reasoning": graham_output.reasoning}
+
+    graham_analysis = await amap_tickers(agent_id, tickers, analyze_ticker)
+
     # Wrap results in a single message for the chain
     message = HumanMessage(content=json.dumps(graham_analysis), name=agent_id)
 
@@ -86,12 +101,14 @@ def ben_graham_agent(state: AgentState, agent_id: str = "ben_graham_agent"):
     if state["metadata"]["show_reasoning"]:
         show_agent_reasoning(graham_analysis, "Ben Graham Agent")
 
-    # Store signals in the overall state
-    state["data"]["analyst_signals"][agent_id] = graham_analysis
-
     progress.update_status(agent_id, None, "Done")
 
-    return {"messages": [message], "data": state["data"]}
+    return {"messages": [message], "data": {"analyst_signals": {agent_id: graham_analysis}}}
+
+
+def ben_graham_agent(state: AgentState, agent_id: str = "ben_graham_agent"):
+    """Synchronous version of aben_graham_agent."""
+    return run_isolated(aben_graham_agent(state, agent_id))
 
 
 def analyze_earnings_stability(metrics: list, financial_line_items: list) -> dict:
@@ -279,7 +296,7 @@ def analyze_valuation_graham(financial_line_items: list, market_cap: float) -> d
     return {"score": score, "details": "; ".join(details)}
 
 
-def generate_graham_output(
+async def generate_graham_output(
     ticker: str,
     analysis_data: dict[str, any],
     state: AgentState,
@@ -339,7 +356,7 @@ def generate_graham_output(
     def create_default_ben_graham_signal():
         return BenGrahamSignal(signal="neutral", confidence=0.0, reasoning="Error in generating analysis; defaulting to neutral.")
 
-    return call_llm(
+    return await acall_llm(
         prompt=prompt,
         pydantic_model=BenGrahamSignal,
         agent_name=agent_id,
@@ -1,12 +1,15 @@
 from src.graph.state import AgentState, show_agent_reasoning
-from src.tools.api import get_financial_metrics, get_market_cap, search_line_items
+from src.data.needs import FinancialMetricsNeed, LineItemsNeed, MarketCapNeed
+from src.tools.api import aget_financial_metrics, aget_market_cap, asearch_line_items
+from src.tools.http_client import run_isolated
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.messages import HumanMessage
 from pydantic import BaseModel
 import json
 from typing_extensions import Literal
 from src.utils.progress import progress
-from src.utils.llm import call_llm
+from src.utils.parallel import amap_tickers
+from src.utils.llm import acall_llm
 from src.utils.api_key import get_api_key_from_state
 
 
@@ -16,7 +19,28 @@ class BillAckmanSignal(BaseModel):
     reasoning: str
 
 
-def bill_ackman_agent(state: AgentState, agent_id: str = "bill_ackman_agent"):
+LINE_ITEMS = [
+    "revenue",
+    "operating_margin",
+    "debt_to_equity",
+    "free_cash_flow",
+    "total_assets",
+    "total_liabilities",
+    "dividends_and_other_cash_distributions",
+    "outstanding_shares",
+    # Optional: intangible_assets if available
+    # "intangible_assets"
+]
+
+# Data read for every ticker, declared so it can be prefetched before the agent runs
+DATA_NEEDS = [
+    FinancialMetricsNeed(period="annual", limit=5),
+    LineItemsNeed(LINE_ITEMS, period="annual", limit=5),
+    MarketCapNeed(),
+]
+
+
+async def abill_ackman_agent(state: AgentState, agent_id: str = "bill_ackman_agent"):
     """
     Analyzes stocks using Bill Ackman's investing principles and LLM reasoning.
     Fetches multiple periods of data for a more robust long-term view.
@@ -26,29 +50,19 @@ def bill_ackman_agent(state: AgentState, agent_id: str = "bill_ackman_agent"):
     end_date = data["end_date"]
     tickers = data["tickers"]
     api_key = get_api_key_from_state(state, "FINANCIAL_DATASETS_API_KEY")
-    analysis_data = {}
-    ackman_analysis = {}
     
-    for ticker in tickers:
+    async def analyze_ticker(ticker: str) -> dict:
+        # This ticker's analysis only, so the prompt carries no other tickers
+        analysis_data = {}
+
         progress.update_status(agent_id, ticker, "Fetching financial metrics")
-        metrics = get_financial_metrics(ticker, end_date, period="annual", limit=5, api_key=api_key)
+        metrics = await aget_financial_metrics(ticker, end_date, period="annual", limit=5, api_key=api_key)
         
         progress.update_status(agent_id, ticker, "Gathering financial line items")
         # Request multiple periods of data (annual or TTM) for a more robust long-term view.
-        financial_line_items = search_line_items(
+        financial_line_items = await asearch_line_items(
             ticker,
-            [
-                "revenue",
-                "operating_margin",
-                "debt_to_equity",
-                "free_cash_flow",
-                "total_assets",
-                "total_liabilities",
-                "dividends_and_other_cash_distributions",
-                "outstanding_shares",
-                # Optional: intangible_assets if available
-                # "intangible_assets"
-            ],
+            LINE_ITEMS,
             end_date,
             period="annual",
             limit=5,
@@ -56,7 +70,7 @@ def bill_ackman_agent(state: AgentState, agent_id: str = "bill_ackman_agent"):
         )
         
         progress.update_status(agent_id, ticker, "Getting market cap")
-        market_cap = get_market_cap(ticker, end_date, api_key=api_key)
+        market_cap = await aget_market_cap(ticker, end_date, api_key=api_key)
         
         progress.update_status(agent_id, ticker, "Analyzing business quality")
         quality_analysis = analyze_business_quality(metrics, financial_line_items)
@@ -98,21 +112,23 @@ def bill_ackman_agent(state: AgentState, agent_id: str = "bill_ackman_agent"):
         }
         
         progress.update_status(agent_id, ticker, "Generating Bill Ackman analysis")
-        ackman_output = generate_ackman_output(
+        ackman_output = await generate_ackman_output(
             ticker=ticker, 
             analysis_data=analysis_data,
             state=state,
             agent_id=agent_id,
         )
         
-        ackman_analysis[ticker] = {
+        progress.update_status(agent_id, ticker, "Done", analysis=ackman_output.reasoning)
+
+        return {
             "signal": ackman_output.signal,
             "confidence": ackman_output.confidence,
             "reasoning": ackman_output.reasoning
         }
-        
-        progress.update_status(agent_id, ticker, "Done", analysis=ackman_output.reasoning)
-    
+
+    ackman_analysis = await amap_tickers(agent_id, tickers, analyze_ticker)
+
     # Wrap results in a single message for the chain
     message = HumanMessage(
         content=json.dumps(ackman_analysis),
@@ -123,17 +139,19 @@ def bill_ackman_agent(state: AgentState, agent_id: str = "bill_ackman_agent"):
     if state["metadata"]["show_reasoning"]:
         show_agent_reasoning(ackman_analysis, "Bill Ackman Agent")
     
-    # Add signals to the overall state
-    state["data"]["analyst_signals"][agent_id] = ackman_analysis
-
     progress.update_status(agent_id, None, "Done")
 
     return {
         "messages": [message],
-        "data": state["data"]
+        "data": {"analyst_signals": {agent_id: ackman_analysis}}
     }
 
 
+def bill_ackman_agent(state: AgentState, agent_id: str = "bill_ackman_agent"):
+    """Synchronous version of abill_ackman_agent."""
+    return run_isolated(abill_ackman_agent(state, agent_id))
+
+
 def analyze_business_quality(metrics: list, financial_line_items: list) -> dict:
     """
     Analyze whether the company has a high-quality business with stable or growing cash flows,
@@ -396,7 +414,7 @@ def analyze_valuation(financial_line_items: list, market_cap: float) -> dict:
     }
 
 
-def generate_ackman_output(
+async def generate_ackman_output(
     ticker: str,
     analysis_data: dict[str, any],
     state: AgentState,
@@ -459,7 +477,7 @@ def generate_ackman_output(
             reasoning="Error in analysis, defaulting to neutral"
         )
 
-    return call_llm(
+    return await acall_llm(
         prompt=prompt, 
         pydantic_model=BillAckmanSignal, 
         agent_name=agent_id, 
@@ -1,12 +1,15 @@
 from src.graph.state import AgentState, show_agent_reasoning
-from src.tools.api import get_financial_metrics, get_market_cap, search_line_items
+from src.data.needs import FinancialMetricsNeed, LineItemsNeed, MarketCapNeed
+from src.tools.api import aget_financial_metrics, aget_market_cap, asearch_line_items
+from src.tools.http_client import run_isolated
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.messages import HumanMessage
 from pydantic import BaseModel
 import json
 from typing_extensions import Literal
 from src.utils.progress import progress
-from src.utils.llm import call_llm
+from src.utils.parallel import amap_tickers
+from src.utils.llm import acall_llm
 from src.utils.api_key import get_api_key_from_state
 
 
@@ -16,7 +19,30 @@ class CathieWoodSignal(BaseModel):
     reasoning: str
 
 
-def cathie_wood_agent(state: AgentState, agent_id: str = "cathie_wood_agent"):
+LINE_ITEMS = [
+    "revenue",
+    "gross_margin",
+    "operating_margin",
+    "debt_to_equity",
+    "free_cash_flow",
+    "total_assets",
+    "total_liabilities",
+    "dividends_and_other_cash_distributions",
+    "outstanding_shares",
+    "research_and_development",
+    "capital_expenditure",
+    "operating_expense",
+]
+
+# Data read for every ticker, declared so it can be prefetched before the agent runs
+DATA_NEEDS = [
+    FinancialMetricsNeed(period="annual", limit=5),
+    LineItemsNeed(LINE_ITEMS, period="annual", limit=5),
+    MarketCapNeed(),
+]
+
+
+async def acathie_wood_agent(state: AgentState, agent_id: str = "cathie_wood_agent"):
     """
     Analyzes stocks using Cathie Wood's investing principles and LLM reasoning.
     1. Prioritizes companies with breakthrough technologies or business models
@@ -28,31 +54,19 @@ def cathie_wood_agent(state: AgentState, agent_id: str = "cathie_wood_agent"):
     end_date = data["end_date"]
     tickers = data["tickers"]
     api_key = get_api_key_from_state(state, "FINANCIAL_DATASETS_API_KEY")
-    analysis_data = {}
-    cw_analysis = {}
 
-    for ticker in tickers:
+    async def analyze_ticker(ticker: str) -> dict:
+        # This ticker's analysis only, so the prompt carries no other tickers
+        analysis_data = {}
+
         progress.update_status(agent_id, ticker, "Fetching financial metrics")
-        metrics = get_financial_metrics(ticker, end_date, period="annual", limit=5, api_key=api_key)
+        metrics = await aget_financial_metrics(ticker, end_date, period="annual", limit=5, api_key=api_key)
 
         progress.update_status(agent_id, ticker, "Gathering financial line items")
         # Request multiple periods of data (annual or TTM) for a more robust view.
-        financial_line_items = search_line_items(
+        financial_line_items = await asearch_line_items(
             ticker,
-            [
-                "revenue",
-                "gross_margin",
-                "operating_margin",
-                "debt_to_equity",
-                "free_cash_flow",
-                "total_assets",
-                "total_liabilities",
-                "dividends_and_other_cash_distributions",
-                "outstanding_shares",
-                "research_and_development",
-                "capital_expenditure",
-                "operating_expense",
-            ],
+            LINE_ITEMS,
             end_date,
             period="annual",
             limit=5,
@@ -60,7 +74,7 @@ def cathie_wood_agent(state: AgentState, agent_id: str = "cathie_wood_agent"):
         )
 
         progress.update_status(agent_id, ticker, "Getting market cap")
-        market_cap = get_market_cap(ticker, end_date, api_key=api_key)
+        market_cap = await aget_market_cap(ticker, end_date, api_key=api_key)
 
         progress.update_status(agent_id, ticker, "Analyzing disruptive potential")
         disruptive_analysis = analyze_disruptive_potential(metrics, financial_line_items)
@@ -85,27 +99,32 @@ def cathie_wood_agent(state: AgentState, agent_id: str = "cathie_wood_agent"):
         analysis_data[ticker] = {"signal": signal, "score": total_score, "max_score": max_possible_score, "disruptive_analysis": disruptive_analysis, "innovation_analysis": innovation_analysis, "valuation_analysis": valuation_analysis}
 
         progress.update_status(agent_id, ticker, "Generating Cathie Wood analysis")
-        cw_output = generate_cathie_wood_output(
+        cw_output = await generate_cathie_wood_output(
             ticker=ticker,
             analysis_data=analysis_data,
             state=state,
             agent_id=agent_id,
         )
 
-        cw_analysis[ticker] = {"signal": cw_output.signal, "confidence": cw_output.confidence, "reasoning": cw_output.reasoning}
-
         progress.update_status(agent_id, ticker, "Done", analysis=cw_output.reasoning)
 
+        return {"signal": cw_output.signal, "confidence": cw_output.confidence, "reasoning": cw_output.reasoning}
+
+    cw_analysis = await amap_tickers(agent_id, tickers, analyze_ticker)
+
     message = HumanMessage(content=json.dumps(cw_analysis), name=agent_id)
 
     if state["metadata"].get("show_reasoning"):
         show_agent_reasoning(cw_analysis, agent_id)
 
-    state["data"]["analyst_signals"][agent_id] = cw_analysis
-
     progress.update_status(agent_id, None, "Done")
 
-    return {"messages": [message], "data": state["data"]}
+    return {"messages": [message], "data": {"analyst_signals": {agent_id: cw_analysis}}}
+
+
+def cathie_wood_agent(state: AgentState, agent_id: str = "cathie_wood_agent"):
+    """Synchronous version of acathie_wood_agent."""
+    return run_isolated(acathie_wood_agent(state, agent_id))
 
 
 def analyze_disruptive_potential(metrics: list, financial_line_items: list) -> dict:
@@ -360,7 +379,7 @@ def analyze_cathie_wood_valuation(financial_line_items: list, market_cap: float)
     return {"score": score, "details": "; ".join(details), "intrinsic_value": intrinsic_value, "margin_of_safety": margin_of_safety}
 
 
-def generate_cathie_wood_output(
+async def generate_cathie_wood_output(
     ticker: str,
     analysis_data: dict[str, any],
     state: AgentState,
@@ -424,7 +443,7 @@ def generate_cathie_wood_output(
     def create_default_cathie_wood_signal():
         return CathieWoodSignal(signal="neutral", confidence=0.0, reasoning="Error in analysis, defaulting to neutral")
 
-    return call_llm(
+    return await acall_llm(
         prompt=prompt,
         pydantic_model=CathieWoodSignal,
         agent_name=agent_id,
@@ -1,12 +1,15 @@
 from src.graph.state import AgentState, show_agent_reasoning
-from src.tools.api import get_financial_metrics, get_market_cap, search_line_items, get_insider_trades, get_company_news
+from src.data.needs import CompanyNewsNeed, FinancialMetricsNeed, InsiderTradesNeed, LineItemsNeed, MarketCapNeed
+from src.tools.api import aget_financial_metrics, aget_market_cap, asearch_line_items, aget_insider_trades, aget_company_news
+from src.tools.http_client import run_isolated
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.messages import HumanMessage
 from pydantic import BaseModel
 import json
 from typing_extensions import Literal
 from src.utils.progress import progress
-from src.utils.llm import call_llm
+from src.utils.parallel import amap_tickers
+from src.utils.llm import acall_llm
 from src.utils.api_key import get_api_key_from_state
 
 class CharlieMungerSignal(BaseModel):
@@ -15,7 +18,34 @@ class CharlieMungerSignal(BaseModel):
     reasoning: str
 
 
-def charlie_munger_agent(state: AgentState, agent_id: str = "charlie_munger_agent"):
+LINE_ITEMS = [
+    "revenue",
+    "net_income",
+    "operating_income",
+    "return_on_invested_capital",
+    "gross_margin",
+    "operating_margin",
+    "free_cash_flow",
+    "capital_expenditure",
+    "cash_and_equivalents",
+    "total_debt",
+    "shareholders_equity",
+    "outstanding_shares",
+    "research_and_development",
+    "goodwill_and_intangible_assets",
+]
+
+# Data read for every ticker, declared so it can be prefetched before the agent runs
+DATA_NEEDS = [
+    FinancialMetricsNeed(period="annual", limit=10),
+    LineItemsNeed(LINE_ITEMS, period="annual", limit=10),
+    MarketCapNeed(),
+    InsiderTradesNeed(limit=100),
+    CompanyNewsNeed(limit=10),
+]
+
+
+async def acharlie_munger_agent(state: AgentState, agent_id: str = "charlie_munger_agent"):
     """
     Analyzes stocks using Charlie Munger's investing principles and mental models.
     Focuses on moat strength, management quality, predictability, and valuation.
@@ -24,32 +54,18 @@ def charlie_munger_agent(state: AgentState, agent_id: str = "charlie_munger_agen
     end_date = data["end_date"]
     tickers = data["tickers"]
     api_key = get_api_key_from_state(state, "FINANCIAL_DATASETS_API_KEY")
-    analysis_data = {}
-    munger_analysis = {}
     
-    for ticker in tickers:
+    async def analyze_ticker(ticker: str) -> dict:
+        # This ticker's analysis only, so the prompt carries no other tickers
+        analysis_data = {}
+
         progress.update_status(agent_id, ticker, "Fetching financial metrics")
-        metrics = get_financial_metrics(ticker, end_date, period="annual", limit=10, api_key=api_key)  # Munger looks at longer periods
+        metrics = await aget_financial_metrics(ticker, end_date, period="annual", limit=10, api_key=api_key)  # Munger looks at longer periods
         
         progress.update_status(agent_id, ticker, "Gathering financial line items")
-        financial_line_items = search_line_items(
+        financial_line_items = await asearch_line_items(
             ticker,
-            [
-                "revenue",
-                "net_income",
-                "operating_income",
-                "return_on_invested_capital",
-                "gross_margin",
-                "operating_margin",
-                "free_cash_flow",
-                "capital_expenditure",
-                "cash_and_equivalents",
-                "total_debt",
-                "shareholders_equity",
-                "outstanding_shares",
-                "research_and_development",
-                "goodwill_and_intangible_assets",
-            ],
+            LINE_ITEMS,
             end_date,
             period="annual",
             limit=10,  # Munger examines long-term trends
@@ -57,11 +73,11 @@ def charlie_munger_agent(state: AgentState, agent_id: str = "charlie_munger_agen
         )
         
         progress.update_status(agent_id, ticker, "Getting market cap")
-        market_cap = get_market_cap(ticker, end_date, api_key=api_key)
+        market_cap = await aget_market_cap(ticker, end_date, api_key=api_key)
         
         progress.update_status(agent_id, ticker, "Fetching insider trades")
         # Munger values management with skin in the game
-        insider_trades = get_insider_trades(
+        insider_trades = await aget_insider_trades(
             ticker,
             end_date,
             limit=100,
@@ -70,7 +86,7 @@ def charlie_munger_agent(state: AgentState, agent_id: str = "charlie_munger_agen
         
         progress.update_status(agent_id, ticker, "Fetching company news")
         # Munger avoids businesses with frequent negative press
-        company_news = get_company_news(
+        company_news = await aget_company_news(
             ticker,
             end_date,
             limit=10,
@@ -121,7 +137,7 @@ def charlie_munger_agent(state: AgentState, agent_id: str = "charlie_munger_agen
         }
         
         progress.update_status(agent_id, ticker, "Generating Charlie Munger analysis")
-        munger_output = generate_munger_output(
+        munger_output = await generate_munger_output(
             ticker=ticker, 
             analysis_data=analysis_data[ticker],
             state=state,
@@ -129,14 +145,16 @@ def charlie_munger_agent(state: AgentState, agent_id: str = "charlie_munger_agen
             confidence_hint=compute_confidence(analysis_data[ticker], signal)
         )
         
-        munger_analysis[ticker] = {
+        progress.update_status(agent_id, ticker, "Done", analysis=munger_output.reasoning)
+
+        return {
             "signal": munger_output.signal,
             "confidence": munger_output.confidence,
             "reasoning": munger_output.reasoning
         }
-        
-        progress.update_status(agent_id, ticker, "Done", analysis=munger_output.reasoning)
-    
+
+    munger_analysis = await amap_tickers(agent_id, tickers, analyze_ticker)
+
     # Wrap results in a single message for the chain
     message = HumanMessage(
         content=json.dumps(munger_analysis),
@@ -149,15 +167,17 @@ def charlie_munger_agent(state: AgentState, agent_id: str = "charlie_munger_agen
 
     progress.update_status(agent_id, None, "Done")
     
-    # Add signals to the overall state
-    state["data"]["analyst_signals"][agent_id] = munger_analysis
-
     return {
         "messages": [message],
-        "data": state["data"]
+        "data": {"analyst_signals": {agent_id: munger_analysis}}
     }
 
 
+def charlie_munger_agent(state: AgentState, agent_id: str = "charlie_munger_agent"):
+    """Synchronous version of acharlie_munger_agent."""
+    return run_isolated(acharlie_munger_agent(state, agent_id))
+
+
 def analyze_moat_strength(metrics: list, financial_line_items: list) -> dict:
     """
     Analyze the business's competitive advantage using Munger's approach:
@@ -813,7 +833,7 @@ def compute_confidence(analysis: dict, signal: str) -> int:
     return max(10, min(100, conf))
 
 
-def generate_munger_output(
+async def generate_munger_output(
     ticker: str,
     analysis_data: dict[str, any],
     state: AgentState,
@@ -847,7 +867,7 @@ def generate_munger_output(
     def _default():
         return CharlieMungerSignal(signal="neutral", confidence=confidence_hint, reasoning="Insufficient data")
 
-    return call_llm(
+    return await acall_llm(
         prompt=prompt,
         pydantic_model=CharlieMungerSignal,
         agent_name=agent_id,
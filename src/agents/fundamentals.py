@@ -2,26 +2,33 @@ from langchain_core.messages import HumanMessage
 from src.graph.state import AgentState, show_agent_reasoning
 from src.utils.api_key import get_api_key_from_state
 from src.utils.progress import progress
+from src.utils.parallel import amap_tickers
 import json
 
-from src.tools.api import get_financial_metrics
+from src.data.needs import FinancialMetricsNeed
+from src.tools.api import aget_financial_metrics
+from src.tools.http_client import run_isolated
 
 
 ##### Fundamental Agent #####
-def fundamentals_analyst_agent(state: AgentState, agent_id: str = "fundamentals_analyst_agent"):
+# Data read for every ticker, declared so it can be prefetched before the agent runs
+DATA_NEEDS = [
+    FinancialMetricsNeed(period="ttm", limit=10),
+]
+
+
+async def afundamentals_analyst_agent(state: AgentState, agent_id: str = "fundamentals_analyst_agent"):
     """Analyzes fundamental data and generates trading signals for multiple tickers."""
     data = state["data"]
     end_date = data["end_date"]
     tickers = data["tickers"]
     api_key = get_api_key_from_state(state, "FINANCIAL_DATASETS_API_KEY")
-    # Initialize fundamental analysis for each ticker
-    fundamental_analysis = {}
 
-    for ticker in tickers:
+    async def analyze_ticker(ticker: str) -> dict | None:
         progress.update_status(agent_id, ticker, "Fetching financial metrics")
 
         # Get the financial metrics
-        financial_metrics = get_financial_metrics(
+        financial_metrics = await aget_financial_metrics(
             ticker=ticker,
             end_date=end_date,
             period="ttm",
@@ -31,7 +38,7 @@ def fundamentals_analyst_agent(state: AgentState, agent_id: str = "fundamentals_
 
         if not financial_metrics:
             progress.update_status(agent_id, ticker, "Failed: No financial metrics found")
-            continue
+            return None
 
         # Pull the most recent financial metrics
         metrics = financial_metrics[0]
@@ -134,13 +141,15 @@ def fundamentals_analyst_agent(state: AgentState, agent_id: str = "fundamentals_
         total_signals = len(signals)
         confidence = round(max(bullish_signals, bearish_signals) / total_signals, 2) * 100
 
-        fundamental_analysis[ticker] = {
+        progress.update_status(agent_id, ticker, "Done", analysis=json.dumps(reasoning, indent=4))
+
+        return {
             "signal": overall_signal,
             "confidence": confidence,
             "reasoning": reasoning,
         }
 
-        progress.update_status(agent_id, ticker, "Done", analysis=json.dumps(reasoning, indent=4))
+    fundamental_analysis = await amap_tickers(agent_id, tickers, analyze_ticker)
 
     # Create the fundamental analysis message
     message = HumanMessage(
@@ -152,12 +161,14 @@ def fundamentals_analyst_agent(state: AgentState, agent_id: str = "fundamentals_
     if state["metadata"]["show_reasoning"]:
         show_agent_reasoning(fundamental_analysis, "Fundamental Analysis Agent")
 
-    # Add the signal to the analyst_signals list
-    state["data"]["analyst_signals"][agent_id] = fundamental_analysis
-
     progress.update_status(agent_id, None, "Done")
     
     return {
         "messages": [message],
-        "data": data,
+        "data": {"analyst_signals": {agent_id: fundamental_analysis}},
     }
+
+
+def fundamentals_analyst_agent(state: AgentState, agent_id: str = "fundamentals_analyst_agent"):
+    """Synchronous version of afundamentals_analyst_agent."""
+    return run_isolated(afundamentals_analyst_agent(state, agent_id))
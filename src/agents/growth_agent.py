@@ -10,26 +10,35 @@ import statistics
 from langchain_core.messages import HumanMessage
 from src.graph.state import AgentState, show_agent_reasoning
 from src.utils.progress import progress
+from src.utils.parallel import amap_tickers
 from src.utils.api_key import get_api_key_from_state
+from src.data.needs import FinancialMetricsNeed, InsiderTradesNeed
 from src.tools.api import (
-    get_financial_metrics,
-    get_insider_trades,
+    aget_financial_metrics,
+    aget_insider_trades,
 )
+from src.tools.http_client import run_isolated
 
-def growth_analyst_agent(state: AgentState, agent_id: str = "growth_analyst_agent"):
+# Data read for every ticker, declared so it can be prefetched before the agent runs
+DATA_NEEDS = [
+    FinancialMetricsNeed(period="ttm", limit=12),
+    InsiderTradesNeed(limit=1000),
+]
+
+
+async def agrowth_analyst_agent(state: AgentState, agent_id: str = "growth_analyst_agent"):
     """Run growth analysis across tickers and write signals back to `state`."""
 
     data = state["data"]
     end_date = data["end_date"]
     tickers = data["tickers"]
     api_key = get_api_key_from_state(state, "FINANCIAL_DATASETS_API_KEY")
-    growth_analysis: dict[str, dict] = {}
 
-    for ticker in tickers:
+    async def analyze_ticker(ticker: str) -> dict | None:
         progress.update_status(agent_id, ticker, "Fetching financial data")
 
         # --- Historical financial metrics ---
-        financial_metrics = get_financial_metrics(
+        financial_metrics = await aget_financial_metrics(
             ticker=ticker,
             end_date=end_date,
             period="ttm",
@@ -38,12 +47,12 @@ def growth_analyst_agent(state: AgentState, agent_id: str = "growth_analyst_agen
         )
         if not financial_metrics or len(financial_metrics) < 4:
             progress.update_status(agent_id, ticker, "Failed: Not enough financial metrics")
-            continue
+            return None
         
         most_recent_metrics = financial_metrics[0]
 
         # --- Insider Trades ---
-        insider_trades = get_insider_trades(
+        insider_trades = await aget_insider_trades(
             ticker=ticker,
             end_date=end_date,
             limit=1000,
@@ -112,24 +121,29 @@ def growth_analyst_agent(state: AgentState, agent_id: str = "growth_analyst_agen
             }
         }
 
-        growth_analysis[ticker] = {
+        progress.update_status(agent_id, ticker, "Done", analysis=json.dumps(reasoning, indent=4))
+
+        return {
             "signal": signal,
             "confidence": confidence,
             "reasoning": reasoning,
         }
-        progress.update_status(agent_id, ticker, "Done", analysis=json.dumps(reasoning, indent=4))
+
+    growth_analysis = await amap_tickers(agent_id, tickers, analyze_ticker)
 
     # ---- Emit message (for LLM tool chain) ----
     msg = HumanMessage(content=json.dumps(growth_analysis), name=agent_id)
     if state["metadata"].get("show_reasoning"):
         show_agent_reasoning(growth_analysis, "Growth Analysis Agent")
 
-    # Add the signal to the analyst_signals list
-    state["data"]["analyst_signals"][agent_id] = growth_analysis
-
     progress.update_status(agent_id, None, "Done")
     
-    return {"messages": [msg], "data": data}
+    return {"messages": [msg], "data": {"analyst_signals": {agent_id: growth_analysis}}}
+
+
+def growth_analyst_agent(state: AgentState, agent_id: str = "growth_analyst_agent"):
+    """Synchronous version of agrowth_analyst_agent."""
+    return run_isolated(agrowth_analyst_agent(state, agent_id))
 
 #############################
 # Helper Functions
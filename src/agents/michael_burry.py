@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta
 import json
 from typing_extensions import Literal
 
@@ -9,15 +8,18 @@ from langchain_core.messages import HumanMessage
 from langchain_core.prompts import ChatPromptTemplate
 from pydantic import BaseModel
 
+from src.data.needs import CompanyNewsNeed, FinancialMetricsNeed, InsiderTradesNeed, LineItemsNeed, MarketCapNeed, lookback_start_date
 from src.tools.api import (
-    get_company_news,
-    get_financial_metrics,
-    get_insider_trades,
-    get_market_cap,
-    search_line_items,
+    aget_company_news,
+    aget_financial_metrics,
+    aget_insider_trades,
+    aget_market_cap,
+    asearch_line_items,
 )
-from src.utils.llm import call_llm
+from src.tools.http_client import run_isolated
+from src.utils.llm import acall_llm
 from src.utils.progress import progress
+from src.utils.parallel import amap_tickers
 from src.utils.api_key import get_api_key_from_state
 
 
@@ -29,7 +31,28 @@ class MichaelBurrySignal(BaseModel):
     reasoning: str
 
 
-def michael_burry_agent(state: AgentState, agent_id: str = "michael_burry_agent"):
+LINE_ITEMS = [
+    "free_cash_flow",
+    "net_income",
+    "total_debt",
+    "cash_and_equivalents",
+    "total_assets",
+    "total_liabilities",
+    "outstanding_shares",
+    "issuance_or_purchase_of_equity_shares",
+]
+
+# Data read for every ticker, declared so it can be prefetched before the agent runs
+DATA_NEEDS = [
+    FinancialMetricsNeed(period="ttm", limit=5),
+    LineItemsNeed(LINE_ITEMS, period="ttm", limit=10),
+    InsiderTradesNeed(lookback_days=365),
+    CompanyNewsNeed(limit=250, lookback_days=365),
+    MarketCapNeed(),
+]
+
+
+async def amichael_burry_agent(state: AgentState, agent_id: str = "michael_burry_agent"):
     """Analyse stocks using Michael Burry's deep‑value, contrarian framework."""
     api_key = get_api_key_from_state(state, "FINANCIAL_DATASETS_API_KEY")
     data = state["data"]
@@ -37,43 +60,34 @@ def michael_burry_agent(state: AgentState, agent_id: str = "michael_burry_agent"
     tickers: list[str] = data["tickers"]
 
     # We look one year back for insider trades / news flow
-    start_date = (datetime.fromisoformat(end_date) - timedelta(days=365)).date().isoformat()
+    start_date = lookback_start_date(end_date, 365)
 
-    analysis_data: dict[str, dict] = {}
-    burry_analysis: dict[str, dict] = {}
+    async def analyze_ticker(ticker: str) -> dict:
+        # This ticker's analysis only, so the prompt carries no other tickers
+        analysis_data = {}
 
-    for ticker in tickers:
         # ------------------------------------------------------------------
         # Fetch raw data
         # ------------------------------------------------------------------
         progress.update_status(agent_id, ticker, "Fetching financial metrics")
-        metrics = get_financial_metrics(ticker, end_date, period="ttm", limit=5, api_key=api_key)
+        metrics = await aget_financial_metrics(ticker, end_date, period="ttm", limit=5, api_key=api_key)
 
         progress.update_status(agent_id, ticker, "Fetching line items")
-        line_items = search_line_items(
+        line_items = await asearch_line_items(
             ticker,
-            [
-                "free_cash_flow",
-                "net_income",
-                "total_debt",
-                "cash_and_equivalents",
-                "total_assets",
-                "total_liabilities",
-                "outstanding_shares",
-                "issuance_or_purchase_of_equity_shares",
-            ],
+            LINE_ITEMS,
             end_date,
             api_key=api_key,
         )
 
         progress.update_status(agent_id, ticker, "Fetching insider trades")
-        insider_trades = get_insider_trades(ticker, end_date=end_date, start_date=start_date)
+        insider_trades = await aget_insider_trades(ticker, end_date=end_date, start_date=start_date)
 
         progress.update_status(agent_id, ticker, "Fetching company news")
-        news = get_company_news(ticker, end_date=end_date, start_date=start_date, limit=250)
+        news = await aget_company_news(ticker, end_date=end_date, start_date=start_date, limit=250)
 
         progress.update_status(agent_id, ticker, "Fetching market cap")
-        market_cap = get_market_cap(ticker, end_date, api_key=api_key)
+        market_cap = await aget_market_cap(ticker, end_date, api_key=api_key)
 
         # ------------------------------------------------------------------
         # Run sub‑analyses
@@ -128,20 +142,22 @@ def michael_burry_agent(state: AgentState, agent_id: str = "michael_burry_agent"
         }
 
         progress.update_status(agent_id, ticker, "Generating LLM output")
-        burry_output = _generate_burry_output(
+        burry_output = await _generate_burry_output(
             ticker=ticker,
             analysis_data=analysis_data,
             state=state,
             agent_id=agent_id,
         )
 
-        burry_analysis[ticker] = {
+        progress.update_status(agent_id, ticker, "Done", analysis=burry_output.reasoning)
+
+        return {
             "signal": burry_output.signal,
             "confidence": burry_output.confidence,
             "reasoning": burry_output.reasoning,
         }
 
-        progress.update_status(agent_id, ticker, "Done", analysis=burry_output.reasoning)
+    burry_analysis = await amap_tickers(agent_id, tickers, analyze_ticker)
 
     # ----------------------------------------------------------------------
     # Return to the graph
@@ -151,11 +167,14 @@ def michael_burry_agent(state: AgentState, agent_id: str = "michael_burry_agent"
     if state["metadata"].get("show_reasoning"):
         show_agent_reasoning(burry_analysis, "Michael Burry Agent")
 
-    state["data"]["analyst_signals"][agent_id] = burry_analysis
-
     progress.update_status(agent_id, None, "Done")
 
-    return {"messages": [message], "data": state["data"]}
+    return {"messages": [message], "data": {"analyst_signals": {agent_id: burry_analysis}}}
+
+
+def michael_burry_agent(state: AgentState, agent_id: str = "michael_burry_agent"):
+    """Synchronous version of amichael_burry_agent."""
+    return run_isolated(amichael_burry_agent(state, agent_id))
 
 
 ###############################################################################
@@ -313,7 +332,7 @@ def _analyze_contrarian_sentiment(news):
 # LLM generation
 ###############################################################################
 
-def _generate_burry_output(
+async def _generate_burry_output(
     ticker: str,
     analysis_data: dict,
     state: AgentState,
@@ -367,7 +386,7 @@ def _generate_burry_output(
     def create_default_michael_burry_signal():
         return MichaelBurrySignal(signal="neutral", confidence=0.0, reasoning="Parsing error – defaulting to neutral")
 
-    return call_llm(
+    return await acall_llm(
         prompt=prompt,
         pydantic_model=MichaelBurrySignal,
         agent_name=agent_id,
@@ -1,12 +1,15 @@
 from src.graph.state import AgentState, show_agent_reasoning
-from src.tools.api import get_financial_metrics, get_market_cap, search_line_items
+from src.data.needs import FinancialMetricsNeed, LineItemsNeed, MarketCapNeed
+from src.tools.api import aget_financial_metrics, aget_market_cap, asearch_line_items
+from src.tools.http_client import run_isolated
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.messages import HumanMessage
 from pydantic import BaseModel
 import json
 from typing_extensions import Literal
 from src.utils.progress import progress
-from src.utils.llm import call_llm
+from src.utils.parallel import amap_tickers
+from src.utils.llm import acall_llm
 from src.utils.api_key import get_api_key_from_state
 
 
@@ -16,46 +19,56 @@ class MohnishPabraiSignal(BaseModel):
     reasoning: str
 
 
-def mohnish_pabrai_agent(state: AgentState, agent_id: str = "mohnish_pabrai_agent"):
+LINE_ITEMS = [
+    # Profitability and cash generation
+    "revenue",
+    "gross_profit",
+    "gross_margin",
+    "operating_income",
+    "operating_margin",
+    "net_income",
+    "free_cash_flow",
+    # Balance sheet - debt and liquidity
+    "total_debt",
+    "cash_and_equivalents",
+    "current_assets",
+    "current_liabilities",
+    "shareholders_equity",
+    # Capital intensity
+    "capital_expenditure",
+    "depreciation_and_amortization",
+    # Shares outstanding for per-share context
+    "outstanding_shares",
+]
+
+# Data read for every ticker, declared so it can be prefetched before the agent runs
+DATA_NEEDS = [
+    FinancialMetricsNeed(period="annual", limit=8),
+    LineItemsNeed(LINE_ITEMS, period="annual", limit=8),
+    MarketCapNeed(),
+]
+
+
+async def amohnish_pabrai_agent(state: AgentState, agent_id: str = "mohnish_pabrai_agent"):
     """Evaluate stocks using Mohnish Pabrai's checklist and 'heads I win, tails I don't lose much' approach."""
     data = state["data"]
     end_date = data["end_date"]
     tickers = data["tickers"]
     api_key = get_api_key_from_state(state, "FINANCIAL_DATASETS_API_KEY")
 
-    analysis_data: dict[str, any] = {}
-    pabrai_analysis: dict[str, any] = {}
-
     # Pabrai focuses on: downside protection, simple business, moat via unit economics, FCF yield vs alternatives,
     # and potential for doubling in 2-3 years at low risk.
-    for ticker in tickers:
+    async def analyze_ticker(ticker: str) -> dict:
+        # This ticker's analysis only, so the prompt carries no other tickers
+        analysis_data = {}
+
         progress.update_status(agent_id, ticker, "Fetching financial metrics")
-        metrics = get_financial_metrics(ticker, end_date, period="annual", limit=8, api_key=api_key)
+        metrics = await aget_financial_metrics(ticker, end_date, period="annual", limit=8, api_key=api_key)
 
         progress.update_status(agent_id, ticker, "Gathering financial line items")
-        line_items = search_line_items(
+        line_items = await asearch_line_items(
             ticker,
-            [
-                # Profitability and cash generation
-                "revenue",
-                "gross_profit",
-                "gross_margin",
-                "operating_income",
-                "operating_margin",
-                "net_income",
-                "free_cash_flow",
-                # Balance sheet - debt and liquidity
-                "total_debt",
-                "cash_and_equivalents",
-                "current_assets",
-                "current_liabilities",
-                "shareholders_equity",
-                # Capital intensity
-                "capital_expenditure",
-                "depreciation_and_amortization",
-                # Shares outstanding for per-share context
-                "outstanding_shares",
-            ],
+            LINE_ITEMS,
             end_date,
             period="annual",
             limit=8,
@@ -63,7 +76,7 @@ def mohnish_pabrai_agent(state: AgentState, agent_id: str = "mohnish_pabrai_agen
         )
 
         progress.update_status(agent_id, ticker, "Getting market cap")
-        market_cap = get_market_cap(ticker, end_date, api_key=api_key)
+        market_cap = await aget_market_cap(ticker, end_date, api_key=api_key)
 
         progress.update_status(agent_id, ticker, "Analyzing downside protection")
         downside = analyze_downside_protection(line_items)
@@ -100,20 +113,22 @@ def mohnish_pabrai_agent(state: AgentState, agent_id: str = "mohnish_pabrai_agen
         }
 
         progress.update_status(agent_id, ticker, "Generating Pabrai analysis")
-        pabrai_output = generate_pabrai_output(
+        pabrai_output = await generate_pabrai_output(
             ticker=ticker,
             analysis_data=analysis_data,
             state=state,
             agent_id=agent_id,
         )
 
-        pabrai_analysis[ticker] = {
+        progress.update_status(agent_id, ticker, "Done", analysis=pabrai_output.reasoning)
+
+        return {
             "signal": pabrai_output.signal,
             "confidence": pabrai_output.confidence,
             "reasoning": pabrai_output.reasoning,
         }
 
-        progress.update_status(agent_id, ticker, "Done", analysis=pabrai_output.reasoning)
+    pabrai_analysis = await amap_tickers(agent_id, tickers, analyze_ticker)
 
     message = HumanMessage(content=json.dumps(pabrai_analysis), name=agent_id)
 
@@ -122,9 +137,12 @@ def mohnish_pabrai_agent(state: AgentState, agent_id: str = "mohnish_pabrai_agen
 
     progress.update_status(agent_id, None, "Done")
 
-    state["data"]["analyst_signals"][agent_id] = pabrai_analysis
+    return {"messages": [message], "data": {"analyst_signals": {agent_id: pabrai_analysis}}}
 
-    return {"messages": [message], "data": state["data"]}
+
+def mohnish_pabrai_agent(state: AgentState, agent_id: str = "mohnish_pabrai_agent"):
+    """Synchronous version of amohnish_pabrai_agent."""
+    return run_isolated(amohnish_pabrai_agent(state, agent_id))
 
 
 def analyze_downside_protection(financial_line_items: list) -> dict[str, any]:
@@ -303,7 +321,7 @@ def analyze_double_potential(financial_line_items: list, market_cap: float | Non
     return {"score": min(10, score), "details": "; ".join(details)}
 
 
-def generate_pabrai_output(
+async def generate_pabrai_output(
     ticker: str,
     analysis_data: dict[str, any],
     state: AgentState,
@@ -351,7 +369,7 @@ def generate_pabrai_output(
     def create_default_pabrai_signal():
         return MohnishPabraiSignal(signal="neutral", confidence=0.0, reasoning="Error in analysis, defaulting to neutral")
 
-    return call_llm(
+    return await acall_llm(
         prompt=prompt,
         state=state,
         pydantic_model=MohnishPabraiSignal,
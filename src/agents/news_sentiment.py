@@ -5,13 +5,17 @@ from pydantic import BaseModel, Field
 from src.data.models import CompanyNews
 import pandas as pd
 import numpy as np
+import asyncio
 import json
 
 from src.graph.state import AgentState, show_agent_reasoning
-from src.tools.api import get_company_news
+from src.data.needs import CompanyNewsNeed
+from src.tools.api import aget_company_news
+from src.tools.http_client import run_isolated
 from src.utils.api_key import get_api_key_from_state
-from src.utils.llm import call_llm
+from src.utils.llm import acall_llm
 from src.utils.progress import progress
+from src.utils.parallel import amap_tickers
 from typing_extensions import Literal
 
 
@@ -22,7 +26,13 @@ class Sentiment(BaseModel):
     confidence: int = Field(description="Confidence 0-100")
 
 
-def news_sentiment_agent(state: AgentState, agent_id: str = "news_sentiment_agent"):
+# Data read for every ticker, declared so it can be prefetched before the agent runs
+DATA_NEEDS = [
+    CompanyNewsNeed(limit=100),
+]
+
+
+async def anews_sentiment_agent(state: AgentState, agent_id: str = "news_sentiment_agent"):
     """
     Analyzes news sentiment for a list of tickers and generates trading signals.
 
@@ -41,11 +51,10 @@ def news_sentiment_agent(state: AgentState, agent_id: str = "news_sentiment_agen
     end_date = data.get("end_date")
     tickers = data.get("tickers")
     api_key = get_api_key_from_state(state, "FINANCIAL_DATASETS_API_KEY")
-    sentiment_analysis = {}
 
-    for ticker in tickers:
+    async def analyze_ticker(ticker: str) -> dict:
         progress.update_status(agent_id, ticker, "Fetching company news")
-        company_news = get_company_news(
+        company_news = await aget_company_news(
             ticker=ticker,
             end_date=end_date,
             limit=100,
@@ -62,18 +71,18 @@ def news_sentiment_agent(state: AgentState, agent_id: str = "news_sentiment_agen
             
             # Analyze only the 5 most recent articles without sentiment to reduce LLM calls
             sentiments_classified_by_llm = 0
+            classified_articles = {}
             if articles_without_sentiment:
               # We only take the first 5 articles, but this is configurable
               num_articles_to_analyze = 5
               articles_to_analyze = articles_without_sentiment[:num_articles_to_analyze]
               progress.update_status(agent_id, ticker, f"Analyzing sentiment for {len(articles_to_analyze)} articles")
               
-              for idx, news in enumerate(articles_to_analyze):
+              def headline_prompt(news: CompanyNews) -> str:
                 # We analyze based on title, but can also pass in the entire article text,
                 # but this is more expensive and requires extracting the text from the article.
                 # Note: this is an opportunity for improvement!
-                progress.update_status(agent_id, ticker, f"Analyzing sentiment for article {idx + 1} of {len(articles_to_analyze)}")
-                prompt = (
+                return (
                     f"Please analyze the sentiment of the following news headline "
                     f"with the following context: "
                     f"The stock is {ticker}. "
@@ -82,15 +91,22 @@ def news_sentiment_agent(state: AgentState, agent_id: str = "news_sentiment_agen
                     f"Respond in JSON format.\n\n"
                     f"Headline: {news.title}"
                 )
-                response = call_llm(prompt, Sentiment, agent_name=agent_id, state=state)
+
+              # The headlines are independent, so their LLM calls are in flight together
+              responses = await asyncio.gather(*(acall_llm(headline_prompt(news), Sentiment, agent_name=agent_id, state=state) for news in articles_to_analyze))
+              for news, response in zip(articles_to_analyze, responses):
+                # Cached articles are shared and immutable, so the classification goes on a copy
                 if response:
-                    news.sentiment = response.sentiment.lower()
-                    sentiment_confidences[id(news)] = response.confidence
+                    classified = news.model_copy(update={"sentiment": response.sentiment.lower()})
+                    sentiment_confidences[id(classified)] = response.confidence
                 else:
-                    news.sentiment = "neutral"
-                    sentiment_confidences[id(news)] = 0
+                    classified = news.model_copy(update={"sentiment": "neutral"})
+                    sentiment_confidences[id(classified)] = 0
+                classified_articles[id(news)] = classified
                 sentiments_classified_by_llm += 1
 
+            company_news = [classified_articles.get(id(news), news) for news in company_news]
+
             # Aggregate sentiment across all articles
             sentiment = pd.Series([n.sentiment for n in company_news]).dropna()
             news_signals = np.where(sentiment == "negative","bearish", np.where(sentiment == "positive", "bullish", "neutral")).tolist()
@@ -134,14 +150,16 @@ def news_sentiment_agent(state: AgentState, agent_id: str = "news_sentiment_agen
             }
         }
 
+        progress.update_status(agent_id, ticker, "Done", analysis=json.dumps(reasoning, indent=4))
+
         # Create the sentiment analysis
-        sentiment_analysis[ticker] = {
+        return {
             "signal": overall_signal,
             "confidence": confidence,
             "reasoning": reasoning,
         }
 
-        progress.update_status(agent_id, ticker, "Done", analysis=json.dumps(reasoning, indent=4))
+    sentiment_analysis = await amap_tickers(agent_id, tickers, analyze_ticker)
 
     message = HumanMessage(
         content=json.dumps(sentiment_analysis),
@@ -151,18 +169,19 @@ def news_sentiment_agent(state: AgentState, agent_id: str = "news_sentiment_agen
     if state.get("metadata", {}).get("show_reasoning"):
         show_agent_reasoning(sentiment_analysis, "News Sentiment Analysis Agent")
 
-    if "analyst_signals" not in state["data"]:
-        state["data"]["analyst_signals"] = {}
-    state["data"]["analyst_signals"][agent_id] = sentiment_analysis
-
     progress.update_status(agent_id, None, "Done")
 
     return {
         "messages": [message],
-        "data": state["data"],
+        "data": {"analyst_signals": {agent_id: sentiment_analysis}},
     }
 
 
+def news_sentiment_agent(state: AgentState, agent_id: str = "news_sentiment_agent"):
+    """Synchronous version of anews_sentiment_agent."""
+    return run_isolated(anews_sentiment_agent(state, agent_id))
+
+
 def _calculate_confidence_score(
     sentiment_confidences: dict,
     company_news: list,
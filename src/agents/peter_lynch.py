@@ -1,17 +1,20 @@
 from src.graph.state import AgentState, show_agent_reasoning
+from src.data.needs import CompanyNewsNeed, InsiderTradesNeed, LineItemsNeed, MarketCapNeed
 from src.tools.api import (
-    get_market_cap,
-    search_line_items,
-    get_insider_trades,
-    get_company_news,
+    aget_market_cap,
+    asearch_line_items,
+    aget_insider_trades,
+    aget_company_news,
 )
+from src.tools.http_client import run_isolated
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.messages import HumanMessage
 from pydantic import BaseModel
 import json
 from typing_extensions import Literal
 from src.utils.progress import progress
-from src.utils.llm import call_llm
+from src.utils.parallel import amap_tickers
+from src.utils.llm import acall_llm
 from src.utils.api_key import get_api_key_from_state
 
 
@@ -24,7 +27,31 @@ class PeterLynchSignal(BaseModel):
     reasoning: str
 
 
-def peter_lynch_agent(state: AgentState, agent_id: str = "peter_lynch_agent"):
+LINE_ITEMS = [
+    "revenue",
+    "earnings_per_share",
+    "net_income",
+    "operating_income",
+    "gross_margin",
+    "operating_margin",
+    "free_cash_flow",
+    "capital_expenditure",
+    "cash_and_equivalents",
+    "total_debt",
+    "shareholders_equity",
+    "outstanding_shares",
+]
+
+# Data read for every ticker, declared so it can be prefetched before the agent runs
+DATA_NEEDS = [
+    LineItemsNeed(LINE_ITEMS, period="annual", limit=5),
+    MarketCapNeed(),
+    InsiderTradesNeed(limit=50),
+    CompanyNewsNeed(limit=50),
+]
+
+
+async def apeter_lynch_agent(state: AgentState, agent_id: str = "peter_lynch_agent"):
     """
     Analyzes stocks using Peter Lynch's investing principles:
       - Invest in what you know (clear, understandable businesses).
@@ -43,28 +70,16 @@ def peter_lynch_agent(state: AgentState, agent_id: str = "peter_lynch_agent"):
     end_date = data["end_date"]
     tickers = data["tickers"]
     api_key = get_api_key_from_state(state, "FINANCIAL_DATASETS_API_KEY")
-    analysis_data = {}
-    lynch_analysis = {}
 
-    for ticker in tickers:
+    async def analyze_ticker(ticker: str) -> dict:
+        # This ticker's analysis only, so the prompt carries no other tickers
+        analysis_data = {}
+
         progress.update_status(agent_id, ticker, "Gathering financial line items")
         # Relevant line items for Peter Lynch's approach
-        financial_line_items = search_line_items(
+        financial_line_items = await asearch_line_items(
             ticker,
-            [
-                "revenue",
-                "earnings_per_share",
-                "net_income",
-                "operating_income",
-                "gross_margin",
-                "operating_margin",
-                "free_cash_flow",
-                "capital_expenditure",
-                "cash_and_equivalents",
-                "total_debt",
-                "shareholders_equity",
-                "outstanding_shares",
-            ],
+            LINE_ITEMS,
             end_date,
             period="annual",
             limit=5,
@@ -72,13 +87,13 @@ def peter_lynch_agent(state: AgentState, agent_id: str = "peter_lynch_agent"):
         )
 
         progress.update_status(agent_id, ticker, "Getting market cap")
-        market_cap = get_market_cap(ticker, end_date, api_key=api_key)
+        market_cap = await aget_market_cap(ticker, end_date, api_key=api_key)
 
         progress.update_status(agent_id, ticker, "Fetching insider trades")
-        insider_trades = get_insider_trades(ticker, end_date, limit=50, api_key=api_key)
+        insider_trades = await aget_insider_trades(ticker, end_date, limit=50, api_key=api_key)
 
         progress.update_status(agent_id, ticker, "Fetching company news")
-        company_news = get_company_news(ticker, end_date, limit=50, api_key=api_key)
+        company_news = await aget_company_news(ticker, end_date, limit=50, api_key=api_key)
 
         # Perform sub-analyses:
         progress.update_status(agent_id, ticker, "Analyzing growth")
@@ -129,20 +144,22 @@ def peter_lynch_agent(state: AgentState, agent_id: str = "peter_lynch_agent"):
         }
 
         progress.update_status(agent_id, ticker, "Generating Peter Lynch analysis")
-        lynch_output = generate_lynch_output(
+        lynch_output = await generate_lynch_output(
             ticker=ticker,
             analysis_data=analysis_data[ticker],
             state=state,
             agent_id=agent_id,
         )
 
-        lynch_analysis[ticker] = {
+        progress.update_status(agent_id, ticker, "Done", analysis=lynch_output.reasoning)
+
+        return {
             "signal": lynch_output.signal,
             "confidence": lynch_output.confidence,
             "reasoning": lynch_output.reasoning,
         }
 
-        progress.update_status(agent_id, ticker, "Done", analysis=lynch_output.reasoning)
+    lynch_analysis = await amap_tickers(agent_id, tickers, analyze_ticker)
 
     # Wrap up results
     message = HumanMessage(content=json.dumps(lynch_analysis), name=agent_id)
@@ -150,12 +167,14 @@ def peter_lynch_agent(state: AgentState, agent_id: str = "peter_lynch_agent"):
     if state["metadata"].get("show_reasoning"):
         show_agent_reasoning(lynch_analysis, "Peter Lynch Agent")
 
-    # Save signals to state
-    state["data"]["analyst_signals"][agent_id] = lynch_analysis
-
     progress.update_status(agent_id, None, "Done")
 
-    return {"messages": [message], "data": state["data"]}
+    return {"messages": [message], "data": {"analyst_signals": {agent_id: lynch_analysis}}}
+
+
+def peter_lynch_agent(state: AgentState, agent_id: str = "peter_lynch_agent"):
+    """Synchronous version of apeter_lynch_agent."""
+    return run_isolated(apeter_lynch_agent(state, agent_id))
 
 
 def analyze_lynch_growth(financial_line_items: list) -> dict:
@@ -438,7 +457,7 @@ def analyze_insider_activity(insider_trades: list) -> dict:
     return {"score": score, "details": "; ".join(details)}
 
 
-def generate_lynch_output(
+async def generate_lynch_output(
     ticker: str,
     analysis_data: dict[str, any],
     state: AgentState,
@@ -498,7 +517,7 @@ def generate_lynch_output(
             reasoning="Error in analysis; defaulting to neutral"
         )
 
-    return call_llm(
+    return await acall_llm(
         prompt=prompt,
         pydantic_model=PeterLynchSignal,
         agent_name=agent_id,
@@ -1,17 +1,20 @@
 from src.graph.state import AgentState, show_agent_reasoning
+from src.data.needs import CompanyNewsNeed, InsiderTradesNeed, LineItemsNeed, MarketCapNeed
 from src.tools.api import (
-    get_market_cap,
-    search_line_items,
-    get_insider_trades,
-    get_company_news,
+    aget_market_cap,
+    asearch_line_items,
+    aget_insider_trades,
+    aget_company_news,
 )
+from src.tools.http_client import run_isolated
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.messages import HumanMessage
 from pydantic import BaseModel
 import json
 from typing_extensions import Literal
 from src.utils.progress import progress
-from src.utils.llm import call_llm
+from src.utils.parallel import amap_tickers
+from src.utils.llm import acall_llm
 import statistics
 from src.utils.api_key import get_api_key_from_state
 
@@ -21,7 +24,32 @@ class PhilFisherSignal(BaseModel):
     reasoning: str
 
 
-def phil_fisher_agent(state: AgentState, agent_id: str = "phil_fisher_agent"):
+LINE_ITEMS = [
+    "revenue",
+    "net_income",
+    "earnings_per_share",
+    "free_cash_flow",
+    "research_and_development",
+    "operating_income",
+    "operating_margin",
+    "gross_margin",
+    "total_debt",
+    "shareholders_equity",
+    "cash_and_equivalents",
+    "ebit",
+    "ebitda",
+]
+
+# Data read for every ticker, declared so it can be prefetched before the agent runs
+DATA_NEEDS = [
+    LineItemsNeed(LINE_ITEMS, period="annual", limit=5),
+    MarketCapNeed(),
+    InsiderTradesNeed(limit=50),
+    CompanyNewsNeed(limit=50),
+]
+
+
+async def aphil_fisher_agent(state: AgentState, agent_id: str = "phil_fisher_agent"):
     """
     Analyzes stocks using Phil Fisher's investing principles:
       - Seek companies with long-term above-average growth potential
@@ -37,33 +65,20 @@ def phil_fisher_agent(state: AgentState, agent_id: str = "phil_fisher_agent"):
     end_date = data["end_date"]
     tickers = data["tickers"]
     api_key = get_api_key_from_state(state, "FINANCIAL_DATASETS_API_KEY")
-    analysis_data = {}
-    fisher_analysis = {}
 
-    for ticker in tickers:
+    async def analyze_ticker(ticker: str) -> dict:
+        # This ticker's analysis only, so the prompt carries no other tickers
+        analysis_data = {}
+
         progress.update_status(agent_id, ticker, "Gathering financial line items")
         # Include relevant line items for Phil Fisher's approach:
         #   - Growth & Quality: revenue, net_income, earnings_per_share, R&D expense
         #   - Margins & Stability: operating_income, operating_margin, gross_margin
         #   - Management Efficiency & Leverage: total_debt, shareholders_equity, free_cash_flow
         #   - Valuation: net_income, free_cash_flow (for P/E, P/FCF), ebit, ebitda
-        financial_line_items = search_line_items(
+        financial_line_items = await asearch_line_items(
             ticker,
-            [
-                "revenue",
-                "net_income",
-                "earnings_per_share",
-                "free_cash_flow",
-                "research_and_development",
-                "operating_income",
-                "operating_margin",
-                "gross_margin",
-                "total_debt",
-                "shareholders_equity",
-                "cash_and_equivalents",
-                "ebit",
-                "ebitda",
-            ],
+            LINE_ITEMS,
             end_date,
             period="annual",
             limit=5,
@@ -71,13 +86,13 @@ def phil_fisher_agent(state: AgentState, agent_id: str = "phil_fisher_agent"):
         )
 
         progress.update_status(agent_id, ticker, "Getting market cap")
-        market_cap = get_market_cap(ticker, end_date, api_key=api_key)
+        market_cap = await aget_market_cap(ticker, end_date, api_key=api_key)
 
         progress.update_status(agent_id, ticker, "Fetching insider trades")
-        insider_trades = get_insider_trades(ticker, end_date, limit=50, api_key=api_key)
+        insider_trades = await aget_insider_trades(ticker, end_date, limit=50, api_key=api_key)
 
         progress.update_status(agent_id, ticker, "Fetching company news")
-        company_news = get_company_news(ticker, end_date, limit=50, api_key=api_key)
+        company_news = await aget_company_news(ticker, end_date, limit=50, api_key=api_key)
 
         progress.update_status(agent_id, ticker, "Analyzing growth & quality")
         growth_quality = analyze_fisher_growth_quality(financial_line_items)
@@ -136,20 +151,22 @@ def phil_fisher_agent(state: AgentState, agent_id: str = "phil_fisher_agent"):
         }
 
         progress.update_status(agent_id, ticker, "Generating Phil Fisher-style analysis")
-        fisher_output = generate_fisher_output(
+        fisher_output = await generate_fisher_output(
             ticker=ticker,
             analysis_data=analysis_data,
             state=state,
             agent_id=agent_id,
         )
 
-        fisher_analysis[ticker] = {
+        progress.update_status(agent_id, ticker, "Done", analysis=fisher_output.reasoning)
+
+        return {
             "signal": fisher_output.signal,
             "confidence": fisher_output.confidence,
             "reasoning": fisher_output.reasoning,
         }
 
-        progress.update_status(agent_id, ticker, "Done", analysis=fisher_output.reasoning)
+    fisher_analysis = await amap_tickers(agent_id, tickers, analyze_ticker)
 
     # Wrap results in a single message
     message = HumanMessage(content=json.dumps(fisher_analysis), name=agent_id)
@@ -157,11 +174,14 @@ def phil_fisher_agent(state: AgentState, agent_id: str = "phil_fisher_agent"):
     if state["metadata"].get("show_reasoning"):
         show_agent_reasoning(fisher_analysis, "Phil Fisher Agent")
 
-    state["data"]["analyst_signals"][agent_id] = fisher_analysis
-
     progress.update_status(agent_id, None, "Done")
     
-    return {"messages": [message], "data": state["data"]}
+    return {"messages": [message], "data": {"analyst_signals": {agent_id: fisher_analysis}}}
+
+
+def phil_fisher_agent(state: AgentState, agent_id: str = "phil_fisher_agent"):
+    """Synchronous version of aphil_fisher_agent."""
+    return run_isolated(aphil_fisher_agent(state, agent_id))
 
 
 def analyze_fisher_growth_quality(financial_line_items: list) -> dict:
@@ -528,7 +548,7 @@ def analyze_sentiment(news_items: list) -> dict:
     return {"score": score, "details": "; ".join(details)}
 
 
-def generate_fisher_output(
+async def generate_fisher_output(
     ticker: str,
     analysis_data: dict[str, any],
     state: AgentState,
@@ -594,7 +614,7 @@ def generate_fisher_output(
             reasoning="Error in analysis, defaulting to neutral"
         )
 
-    return call_llm(
+    return await acall_llm(
         prompt=prompt,
         pydantic_model=PhilFisherSignal,
         state=state,
@@ -7,7 +7,8 @@ from src.graph.state import AgentState, show_agent_reasoning
 from pydantic import BaseModel, Field
 from typing_extensions import Literal
 from src.utils.progress import progress
-from src.utils.llm import call_llm
+from src.utils.llm import acall_llm
+from src.tools.http_client import run_isolated
 
 
 class PortfolioDecision(BaseModel):
@@ -22,7 +23,7 @@ class PortfolioManagerOutput(BaseModel):
 
 
 ##### Portfolio Management Agent #####
-def portfolio_management_agent(state: AgentState, agent_id: str = "portfolio_manager"):
+async def aportfolio_management_agent(state: AgentState, agent_id: str = "portfolio_manager"):
     """Makes final trading decisions and generates orders for multiple tickers"""
 
     portfolio = state["data"]["portfolio"]
@@ -63,11 +64,9 @@ def portfolio_management_agent(state: AgentState, agent_id: str = "portfolio_man
                     ticker_signals[agent] = {"sig": sig, "conf": conf}
         signals_by_ticker[ticker] = ticker_signals
 
-    state["data"]["current_prices"] = current_prices
-
     progress.update_status(agent_id, None, "Generating trading decisions")
 
-    result = generate_trading_decision(
+    result = await generate_trading_decision(
         tickers=tickers,
         signals_by_ticker=signals_by_ticker,
         current_prices=current_prices,
@@ -89,10 +88,15 @@ def portfolio_management_agent(state: AgentState, agent_id: str = "portfolio_man
 
     return {
         "messages": state["messages"] + [message],
-        "data": state["data"],
+        "data": {"current_prices": current_prices},
     }
 
 
+def portfolio_management_agent(state: AgentState, agent_id: str = "portfolio_manager"):
+    """Synchronous version of aportfolio_management_agent."""
+    return run_isolated(aportfolio_management_agent(state, agent_id))
+
+
 def compute_allowed_actions(
         tickers: list[str],
         current_prices: dict[str, float],
@@ -174,7 +178,7 @@ def _compact_signals(signals_by_ticker: dict[str, dict]) -> dict[str, dict]:
     return out
 
 
-def generate_trading_decision(
+async def generate_trading_decision(
         tickers: list[str],
         signals_by_ticker: dict[str, dict],
         current_prices: dict[str, float],
@@ -248,7 +252,7 @@ def generate_trading_decision(
             )
         return PortfolioManagerOutput(decisions=decisions)
 
-    llm_out = call_llm(
+    llm_out = await acall_llm(
         prompt=prompt,
         pydantic_model=PortfolioManagerOutput,
         agent_name=agent_id,
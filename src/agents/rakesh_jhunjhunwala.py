@@ -4,9 +4,12 @@ from langchain_core.messages import HumanMessage
 from pydantic import BaseModel
 import json
 from typing_extensions import Literal
-from src.tools.api import get_financial_metrics, get_market_cap, search_line_items
-from src.utils.llm import call_llm
+from src.data.needs import FinancialMetricsNeed, LineItemsNeed, MarketCapNeed
+from src.tools.api import aget_financial_metrics, aget_market_cap, asearch_line_items
+from src.tools.http_client import run_isolated
+from src.utils.llm import acall_llm
 from src.utils.progress import progress
+from src.utils.parallel import amap_tickers
 from src.utils.api_key import get_api_key_from_state
 
 class RakeshJhunjhunwalaSignal(BaseModel):
@@ -14,46 +17,55 @@ class RakeshJhunjhunwalaSignal(BaseModel):
     confidence: float
     reasoning: str
 
-def rakesh_jhunjhunwala_agent(state: AgentState, agent_id: str = "rakesh_jhunjhunwala_agent"):
+LINE_ITEMS = [
+    "net_income",
+    "earnings_per_share",
+    "ebit",
+    "operating_income",
+    "revenue",
+    "operating_margin",
+    "total_assets",
+    "total_liabilities",
+    "current_assets",
+    "current_liabilities",
+    "free_cash_flow",
+    "dividends_and_other_cash_distributions",
+    "issuance_or_purchase_of_equity_shares"
+]
+
+# Data read for every ticker, declared so it can be prefetched before the agent runs
+DATA_NEEDS = [
+    FinancialMetricsNeed(period="ttm", limit=5),
+    LineItemsNeed(LINE_ITEMS, period="ttm", limit=10),
+    MarketCapNeed(),
+]
+
+
+async def arakesh_jhunjhunwala_agent(state: AgentState, agent_id: str = "rakesh_jhunjhunwala_agent"):
     """Analyzes stocks using Rakesh Jhunjhunwala's principles and LLM reasoning."""
     data = state["data"]
     end_date = data["end_date"]
     tickers = data["tickers"]
     api_key = get_api_key_from_state(state, "FINANCIAL_DATASETS_API_KEY")
-    # Collect all analysis for LLM reasoning
-    analysis_data = {}
-    jhunjhunwala_analysis = {}
 
-    for ticker in tickers:
+    async def analyze_ticker(ticker: str) -> dict:
+        # This ticker's analysis only, so the prompt carries no other tickers
+        analysis_data = {}
 
         # Core Data
         progress.update_status(agent_id, ticker, "Fetching financial metrics")
-        metrics = get_financial_metrics(ticker, end_date, period="ttm", limit=5, api_key=api_key)
+        metrics = await aget_financial_metrics(ticker, end_date, period="ttm", limit=5, api_key=api_key)
 
         progress.update_status(agent_id, ticker, "Fetching financial line items")
-        financial_line_items = search_line_items(
+        financial_line_items = await asearch_line_items(
             ticker,
-            [
-                "net_income",
-                "earnings_per_share",
-                "ebit",
-                "operating_income",
-                "revenue",
-                "operating_margin",
-                "total_assets",
-                "total_liabilities",
-                "current_assets",
-                "current_liabilities",
-                "free_cash_flow",
-                "dividends_and_other_cash_distributions",
-                "issuance_or_purchase_of_equity_shares"
-            ],
+            LINE_ITEMS,
             end_date,
             api_key=api_key,
         )
 
         progress.update_status(agent_id, ticker, "Getting market cap")
-        market_cap = get_market_cap(ticker, end_date, api_key=api_key)
+        market_cap = await aget_market_cap(ticker, end_date, api_key=api_key)
 
         # ─── Analyses ───────────────────────────────────────────────────────────
         progress.update_status(agent_id, ticker, "Analyzing growth")
@@ -136,27 +148,33 @@ def rakesh_jhunjhunwala_agent(state: AgentState, agent_id: str = "rakesh_jhunjhu
 
         # ─── LLM: craft Jhunjhunwala‑style narrative ──────────────────────────────
         progress.update_status(agent_id, ticker, "Generating Jhunjhunwala analysis")
-        jhunjhunwala_output = generate_jhunjhunwala_output(
+        jhunjhunwala_output = await generate_jhunjhunwala_output(
             ticker=ticker,
             analysis_data=analysis_data[ticker],
             state=state,
             agent_id=agent_id,
         )
 
-        jhunjhunwala_analysis[ticker] = jhunjhunwala_output.model_dump()
-
         progress.update_status(agent_id, ticker, "Done", analysis=jhunjhunwala_output.reasoning)
 
+        return jhunjhunwala_output.model_dump()
+
+    jhunjhunwala_analysis = await amap_tickers(agent_id, tickers, analyze_ticker)
+
     # ─── Push message back to graph state ──────────────────────────────────────
     message = HumanMessage(content=json.dumps(jhunjhunwala_analysis), name=agent_id)
 
     if state["metadata"]["show_reasoning"]:
         show_agent_reasoning(jhunjhunwala_analysis, "Rakesh Jhunjhunwala Agent")
 
-    state["data"]["analyst_signals"][agent_id] = jhunjhunwala_analysis
     progress.update_status(agent_id, None, "Done")
 
-    return {"messages": [message], "data": state["data"]}
+    return {"messages": [message], "data": {"analyst_signals": {agent_id: jhunjhunwala_analysis}}}
+
+
+def rakesh_jhunjhunwala_agent(state: AgentState, agent_id: str = "rakesh_jhunjhunwala_agent"):
+    """Synchronous version of arakesh_jhunjhunwala_agent."""
+    return run_isolated(arakesh_jhunjhunwala_agent(state, agent_id))
 
 
 def analyze_profitability(financial_line_items: list) -> dict[str, any]:
@@ -641,7 +659,7 @@ def analyze_rakesh_jhunjhunwala_style(
 # ────────────────────────────────────────────────────────────────────────────────
 # LLM generation
 # ────────────────────────────────────────────────────────────────────────────────
-def generate_jhunjhunwala_output(
+async def generate_jhunjhunwala_output(
     ticker: str,
     analysis_data: dict[str, any],
     state: AgentState,
@@ -699,7 +717,7 @@ def generate_jhunjhunwala_output(
     def create_default_rakesh_jhunjhunwala_signal():
         return RakeshJhunjhunwalaSignal(signal="neutral", confidence=0.0, reasoning="Error in analysis, defaulting to neutral")
 
-    return call_llm(
+    return await acall_llm(
         prompt=prompt,
         pydantic_model=RakeshJhunjhunwalaSignal,
         state=state,
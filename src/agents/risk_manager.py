@@ -1,14 +1,23 @@
 from langchain_core.messages import HumanMessage
 from src.graph.state import AgentState, show_agent_reasoning
 from src.utils.progress import progress
-from src.tools.api import get_prices, prices_to_df
+from src.utils.parallel import amap_tickers
+from src.data.needs import PricesNeed
+from src.tools.api import aget_price_frame, prices_to_df
+from src.tools.http_client import run_isolated
 import json
 import numpy as np
 import pandas as pd
 from src.utils.api_key import get_api_key_from_state
 
 ##### Risk Management Agent #####
-def risk_management_agent(state: AgentState, agent_id: str = "risk_management_agent"):
+# Data read for every ticker, declared so it can be prefetched before the agent runs
+DATA_NEEDS = [
+    PricesNeed(),
+]
+
+
+async def arisk_management_agent(state: AgentState, agent_id: str = "risk_management_agent"):
     """Controls position sizing based on volatility-adjusted risk factors for multiple tickers."""
     portfolio = state["data"]["portfolio"]
     data = state["data"]
@@ -22,12 +31,13 @@ def risk_management_agent(state: AgentState, agent_id: str = "risk_management_ag
     returns_by_ticker: dict[str, pd.Series] = {}  # For correlation analysis
 
     # First, fetch prices and calculate volatility for all relevant tickers
-    all_tickers = set(tickers) | set(portfolio.get("positions", {}).keys())
-    
-    for ticker in all_tickers:
+    all_tickers = list(dict.fromkeys([*tickers, *portfolio.get("positions", {}).keys()]))
+
+    async def fetch_volatility(ticker: str) -> tuple[float | None, dict, pd.Series | None]:
+        """(current price, volatility metrics, daily returns) of one ticker; price None when there is no price data."""
         progress.update_status(agent_id, ticker, "Fetching price data and calculating volatility")
         
-        prices = get_prices(
+        prices = await aget_price_frame(
             ticker=ticker,
             start_date=data["start_date"],
             end_date=data["end_date"],
@@ -36,43 +46,45 @@ def risk_management_agent(state: AgentState, agent_id: str = "risk_management_ag
 
         if not prices:
             progress.update_status(agent_id, ticker, "Warning: No price data found")
-            volatility_data[ticker] = {
+            return None, {
                 "daily_volatility": 0.05,  # Default fallback volatility (5% daily)
                 "annualized_volatility": 0.05 * np.sqrt(252),
                 "volatility_percentile": 100,  # Assume high risk if no data
                 "data_points": 0
-            }
-            continue
+            }, None
 
         prices_df = prices_to_df(prices)
         
         if not prices_df.empty and len(prices_df) > 1:
             current_price = prices_df["close"].iloc[-1]
-            current_prices[ticker] = current_price
             
             # Calculate volatility metrics
             volatility_metrics = calculate_volatility_metrics(prices_df)
-            volatility_data[ticker] = volatility_metrics
 
             # Store returns for correlation analysis (use close-to-close returns)
             daily_returns = prices_df["close"].pct_change().dropna()
-            if len(daily_returns) > 0:
-                returns_by_ticker[ticker] = daily_returns
             
             progress.update_status(
                 agent_id, 
                 ticker, 
                 f"Price: {current_price:.2f}, Ann. Vol: {volatility_metrics['annualized_volatility']:.1%}"
             )
-        else:
-            progress.update_status(agent_id, ticker, "Warning: Insufficient price data")
-            current_prices[ticker] = 0
-            volatility_data[ticker] = {
-                "daily_volatility": 0.05,
-                "annualized_volatility": 0.05 * np.sqrt(252),
-                "volatility_percentile": 100,
-                "data_points": len(prices_df) if not prices_df.empty else 0
-            }
+            return current_price, volatility_metrics, daily_returns if len(daily_returns) > 0 else None
+
+        progress.update_status(agent_id, ticker, "Warning: Insufficient price data")
+        return 0, {
+            "daily_volatility": 0.05,
+            "annualized_volatility": 0.05 * np.sqrt(252),
+            "volatility_percentile": 100,
+            "data_points": len(prices_df) if not prices_df.empty else 0
+        }, None
+
+    for ticker, (current_price, volatility_metrics, daily_returns) in (await amap_tickers(agent_id, all_tickers, fetch_volatility)).items():
+        if current_price is not None:
+            current_prices[ticker] = current_price
+        volatility_data[ticker] = volatility_metrics
+        if daily_returns is not None:
+            returns_by_ticker[ticker] = daily_returns
 
     # Build returns DataFrame aligned across tickers for correlation analysis
     correlation_matrix = None
@@ -210,15 +222,17 @@ def risk_management_agent(state: AgentState, agent_id: str = "risk_management_ag
     if state["metadata"]["show_reasoning"]:
         show_agent_reasoning(risk_analysis, "Volatility-Adjusted Risk Management Agent")
 
-    # Add the signal to the analyst_signals list
-    state["data"]["analyst_signals"][agent_id] = risk_analysis
-
     return {
         "messages": state["messages"] + [message],
-        "data": data,
+        "data": {"analyst_signals": {agent_id: risk_analysis}},
     }
 
 
+def risk_management_agent(state: AgentState, agent_id: str = "risk_management_agent"):
+    """Synchronous version of arisk_management_agent."""
+    return run_isolated(arisk_management_agent(state, agent_id))
+
+
 def calculate_volatility_metrics(prices_df: pd.DataFrame, lookback_days: int = 60) -> dict:
     """Calculate comprehensive volatility metrics from price data."""
     if len(prices_df) < 2:
@@ -1,28 +1,36 @@
 from langchain_core.messages import HumanMessage
 from src.graph.state import AgentState, show_agent_reasoning
 from src.utils.progress import progress
+from src.utils.parallel import amap_tickers
 import pandas as pd
 import numpy as np
 import json
 from src.utils.api_key import get_api_key_from_state
-from src.tools.api import get_insider_trades, get_company_news
+from src.data.needs import CompanyNewsNeed, InsiderTradesNeed
+from src.tools.api import aget_insider_trades, aget_company_news
+from src.tools.http_client import run_isolated
 
 
 ##### Sentiment Agent #####
-def sentiment_analyst_agent(state: AgentState, agent_id: str = "sentiment_analyst_agent"):
+# Data read for every ticker, declared so it can be prefetched before the agent runs
+DATA_NEEDS = [
+    InsiderTradesNeed(limit=1000),
+    CompanyNewsNeed(limit=100),
+]
+
+
+async def asentiment_analyst_agent(state: AgentState, agent_id: str = "sentiment_analyst_agent"):
     """Analyzes market sentiment and generates trading signals for multiple tickers."""
     data = state.get("data", {})
     end_date = data.get("end_date")
     tickers = data.get("tickers")
     api_key = get_api_key_from_state(state, "FINANCIAL_DATASETS_API_KEY")
-    # Initialize sentiment analysis for each ticker
-    sentiment_analysis = {}
 
-    for ticker in tickers:
+    async def analyze_ticker(ticker: str) -> dict:
         progress.update_status(agent_id, ticker, "Fetching insider trades")
 
         # Get the insider trades
-        insider_trades = get_insider_trades(
+        insider_trades = await aget_insider_trades(
             ticker=ticker,
             end_date=end_date,
             limit=1000,
@@ -38,7 +46,7 @@ def sentiment_analyst_agent(state: AgentState, agent_id: str = "sentiment_analys
         progress.update_status(agent_id, ticker, "Fetching company news")
 
         # Get the company news
-        company_news = get_company_news(ticker, end_date, limit=100, api_key=api_key)
+        company_news = await aget_company_news(ticker, end_date, limit=100, api_key=api_key)
 
         # Get the sentiment from the company news
         sentiment = pd.Series([n.sentiment for n in company_news]).dropna()
@@ -109,13 +117,15 @@ def sentiment_analyst_agent(state: AgentState, agent_id: str = "sentiment_analys
             }
         }
 
-        sentiment_analysis[ticker] = {
+        progress.update_status(agent_id, ticker, "Done", analysis=json.dumps(reasoning, indent=4))
+
+        return {
             "signal": overall_signal,
             "confidence": confidence,
             "reasoning": reasoning,
         }
 
-        progress.update_status(agent_id, ticker, "Done", analysis=json.dumps(reasoning, indent=4))
+    sentiment_analysis = await amap_tickers(agent_id, tickers, analyze_ticker)
 
     # Create the sentiment message
     message = HumanMessage(
@@ -127,12 +137,14 @@ def sentiment_analyst_agent(state: AgentState, agent_id: str = "sentiment_analys
     if state["metadata"]["show_reasoning"]:
         show_agent_reasoning(sentiment_analysis, "Sentiment Analysis Agent")
 
-    # Add the signal to the analyst_signals list
-    state["data"]["analyst_signals"][agent_id] = sentiment_analysis
-
     progress.update_status(agent_id, None, "Done")
 
     return {
         "messages": [message],
-        "data": data,
+        "data": {"analyst_signals": {agent_id: sentiment_analysis}},
     }
+
+
+def sentiment_analyst_agent(state: AgentState, agent_id: str = "sentiment_analyst_agent"):
+    """Synchronous version of asentiment_analyst_agent."""
+    return run_isolated(asentiment_analyst_agent(state, agent_id))
@@ -8,8 +8,11 @@ import json
 import pandas as pd
 import numpy as np
 
-from src.tools.api import get_prices, prices_to_df
+from src.data.needs import PricesNeed
+from src.tools.api import aget_price_frame, prices_to_df
+from src.tools.http_client import run_isolated
 from src.utils.progress import progress
+from src.utils.parallel import amap_tickers
 
 
 def safe_float(value, default=0.0):
@@ -32,7 +35,13 @@ def safe_float(value, default=0.0):
 
 
 ##### Technical Analyst #####
-def technical_analyst_agent(state: AgentState, agent_id: str = "technical_analyst_agent"):
+# Data read for every ticker, declared so it can be prefetched before the agent runs
+DATA_NEEDS = [
+    PricesNeed(),
+]
+
+
+async def atechnical_analyst_agent(state: AgentState, agent_id: str = "technical_analyst_agent"):
     """
     Sophisticated technical analysis system that combines multiple trading strategies for multiple tickers:
     1. Trend Following
@@ -46,14 +55,12 @@ def technical_analyst_agent(state: AgentState, agent_id: str = "technical_analys
     end_date = data["end_date"]
     tickers = data["tickers"]
     api_key = get_api_key_from_state(state, "FINANCIAL_DATASETS_API_KEY")
-    # Initialize analysis for each ticker
-    technical_analysis = {}
 
-    for ticker in tickers:
+    async def analyze_ticker(ticker: str) -> dict | None:
         progress.update_status(agent_id, ticker, "Analyzing price data")
 
         # Get the historical price data
-        prices = get_prices(
+        prices = await aget_price_frame(
             ticker=ticker,
             start_date=start_date,
             end_date=end_date,
@@ -62,7 +69,7 @@ def technical_analyst_agent(state: AgentState, agent_id: str = "technical_analys
 
         if not prices:
             progress.update_status(agent_id, ticker, "Failed: No price data found")
-            continue
+            return None
 
         # Convert prices to a DataFrame
         prices_df = prices_to_df(prices)
@@ -104,7 +111,7 @@ def technical_analyst_agent(state: AgentState, agent_id: str = "technical_analys
         )
 
         # Generate detailed analysis report for this ticker
-        technical_analysis[ticker] = {
+        ticker_analysis = {
             "signal": combined_signal["signal"],
             "confidence": round(combined_signal["confidence"] * 100),
             "reasoning": {
@@ -135,7 +142,10 @@ def technical_analyst_agent(state: AgentState, agent_id: str = "technical_analys
                 },
             },
         }
-        progress.update_status(agent_id, ticker, "Done", analysis=json.dumps(technical_analysis, indent=4))
+        progress.update_status(agent_id, ticker, "Done", analysis=json.dumps(ticker_analysis, indent=4))
+        return ticker_analysis
+
+    technical_analysis = await amap_tickers(agent_id, tickers, analyze_ticker)
 
     # Create the technical analyst message
     message = HumanMessage(
@@ -146,17 +156,19 @@ def technical_analyst_agent(state: AgentState, agent_id: str = "technical_analys
     if state["metadata"]["show_reasoning"]:
         show_agent_reasoning(technical_analysis, "Technical Analyst")
 
-    # Add the signal to the analyst_signals list
-    state["data"]["analyst_signals"][agent_id] = technical_analysis
-
     progress.update_status(agent_id, None, "Done")
 
     return {
         "messages": state["messages"] + [message],
-        "data": data,
+        "data": {"analyst_signals": {agent_id: technical_analysis}},
     }
 
 
+def technical_analyst_agent(state: AgentState, agent_id: str = "technical_analyst_agent"):
+    """Synchronous version of atechnical_analyst_agent."""
+    return run_isolated(atechnical_analyst_agent(state, agent_id))
+
+
 def calculate_trend_signals(prices_df):
     """
     Advanced trend following strategy using multiple timeframes and indicators
@@ -11,27 +11,52 @@ import statistics
 from langchain_core.messages import HumanMessage
 from src.graph.state import AgentState, show_agent_reasoning
 from src.utils.progress import progress
+from src.utils.parallel import amap_tickers
 from src.utils.api_key import get_api_key_from_state
+from src.data.needs import FinancialMetricsNeed, LineItemsNeed, MarketCapNeed
 from src.tools.api import (
-    get_financial_metrics,
-    get_market_cap,
-    search_line_items,
+    aget_financial_metrics,
+    aget_market_cap,
+    asearch_line_items,
 )
-
-def valuation_analyst_agent(state: AgentState, agent_id: str = "valuation_analyst_agent"):
+from src.tools.http_client import run_isolated
+
+LINE_ITEMS = [
+    "free_cash_flow",
+    "net_income",
+    "depreciation_and_amortization",
+    "capital_expenditure",
+    "working_capital",
+    "total_debt",
+    "cash_and_equivalents", 
+    "interest_expense",
+    "revenue",
+    "operating_income",
+    "ebit",
+    "ebitda"
+]
+
+# Data read for every ticker, declared so it can be prefetched before the agent runs
+DATA_NEEDS = [
+    FinancialMetricsNeed(period="ttm", limit=8),
+    LineItemsNeed(LINE_ITEMS, period="ttm", limit=8),
+    MarketCapNeed(),
+]
+
+
+async def avaluation_analyst_agent(state: AgentState, agent_id: str = "valuation_analyst_agent"):
     """Run valuation across tickers and write signals back to `state`."""
 
     data = state["data"]
     end_date = data["end_date"]
     tickers = data["tickers"]
     api_key = get_api_key_from_state(state, "FINANCIAL_DATASETS_API_KEY")
-    valuation_analysis: dict[str, dict] = {}
 
-    for ticker in tickers:
+    async def analyze_ticker(ticker: str) -> dict | None:
         progress.update_status(agent_id, ticker, "Fetching financial data")
 
         # --- Historical financial metrics ---
-        financial_metrics = get_financial_metrics(
+        financial_metrics = await aget_financial_metrics(
             ticker=ticker,
             end_date=end_date,
             period="ttm",
@@ -40,27 +65,14 @@ def valuation_analyst_agent(state: AgentState, agent_id: str = "valuation_analys
         )
         if not financial_metrics:
             progress.update_status(agent_id, ticker, "Failed: No financial metrics found")
-            continue
+            return None
         most_recent_metrics = financial_metrics[0]
 
         # --- Enhanced line‑items ---
         progress.update_status(agent_id, ticker, "Gathering comprehensive line items")
-        line_items = search_line_items(
+        line_items = await asearch_line_items(
             ticker=ticker,
-            line_items=[
-                "free_cash_flow",
-                "net_income",
-                "depreciation_and_amortization",
-                "capital_expenditure",
-                "working_capital",
-                "total_debt",
-                "cash_and_equivalents", 
-                "interest_expense",
-                "revenue",
-                "operating_income",
-                "ebit",
-                "ebitda"
-            ],
+            line_items=LINE_ITEMS,
             end_date=end_date,
             period="ttm",
             limit=8,
@@ -68,7 +80,7 @@ def valuation_analyst_agent(state: AgentState, agent_id: str = "valuation_analys
         )
         if len(line_items) < 2:
             progress.update_status(agent_id, ticker, "Failed: Insufficient financial line items")
-            continue
+            return None
         li_curr, li_prev = line_items[0], line_items[1]
 
         # ------------------------------------------------------------------
@@ -136,10 +148,10 @@ def valuation_analyst_agent(state: AgentState, agent_id: str = "valuation_analys
         # ------------------------------------------------------------------
         # Aggregate & signal
         # ------------------------------------------------------------------
-        market_cap = get_market_cap(ticker, end_date, api_key=api_key)
+        market_cap = await aget_market_cap(ticker, end_date, api_key=api_key)
         if not market_cap:
             progress.update_status(agent_id, ticker, "Failed: Market cap unavailable")
-            continue
+            return None
 
         method_values = {
             "dcf": {"value": dcf_val, "weight": 0.35},
@@ -151,7 +163,7 @@ def valuation_analyst_agent(state: AgentState, agent_id: str = "valuation_analys
         total_weight = sum(v["weight"] for v in method_values.values() if v["value"] > 0)
         if total_weight == 0:
             progress.update_status(agent_id, ticker, "Failed: All valuation methods zero")
-            continue
+            return None
 
         for v in method_values.values():
             v["gap"] = (v["value"] - market_cap) / market_cap if v["value"] > 0 else None
@@ -200,24 +212,29 @@ def valuation_analyst_agent(state: AgentState, agent_id: str = "valuation_analys
                 "fcf_periods_analyzed": len(fcf_history)
             }
 
-        valuation_analysis[ticker] = {
+        progress.update_status(agent_id, ticker, "Done", analysis=json.dumps(reasoning, indent=4))
+
+        return {
             "signal": signal,
             "confidence": confidence,
             "reasoning": reasoning,
         }
-        progress.update_status(agent_id, ticker, "Done", analysis=json.dumps(reasoning, indent=4))
+
+    valuation_analysis = await amap_tickers(agent_id, tickers, analyze_ticker)
 
     # ---- Emit message (for LLM tool chain) ----
     msg = HumanMessage(content=json.dumps(valuation_analysis), name=agent_id)
     if state["metadata"].get("show_reasoning"):
         show_agent_reasoning(valuation_analysis, "Valuation Analysis Agent")
 
-    # Add the signal to the analyst_signals list
-    state["data"]["analyst_signals"][agent_id] = valuation_analysis
-
     progress.update_status(agent_id, None, "Done")
     
-    return {"messages": [msg], "data": data}
+    return {"messages": [msg], "data": {"analyst_signals": {agent_id: valuation_analysis}}}
+
+
+def valuation_analyst_agent(state: AgentState, agent_id: str = "valuation_analyst_agent"):
+    """Synchronous version of avaluation_analyst_agent."""
+    return run_isolated(avaluation_analyst_agent(state, agent_id))
 
 #############################
 # Helper Valuation Functions
@@ -4,9 +4,12 @@ from langchain_core.messages import HumanMessage
 from pydantic import BaseModel, Field
 import json
 from typing_extensions import Literal
-from src.tools.api import get_financial_metrics, get_market_cap, search_line_items
-from src.utils.llm import call_llm
+from src.data.needs import FinancialMetricsNeed, LineItemsNeed, MarketCapNeed
+from src.tools.api import aget_financial_metrics, aget_market_cap, asearch_line_items
+from src.tools.http_client import run_isolated
+from src.utils.llm import acall_llm
 from src.utils.progress import progress
+from src.utils.parallel import amap_tickers
 from src.utils.api_key import get_api_key_from_state
 
 
@@ -16,38 +19,48 @@ class WarrenBuffettSignal(BaseModel):
     reasoning: str = Field(description="Reasoning for the decision")
 
 
-def warren_buffett_agent(state: AgentState, agent_id: str = "warren_buffett_agent"):
+LINE_ITEMS = [
+    "capital_expenditure",
+    "depreciation_and_amortization",
+    "net_income",
+    "outstanding_shares",
+    "total_assets",
+    "total_liabilities",
+    "shareholders_equity",
+    "dividends_and_other_cash_distributions",
+    "issuance_or_purchase_of_equity_shares",
+    "gross_profit",
+    "revenue",
+    "free_cash_flow",
+]
+
+# Data read for every ticker, declared so it can be prefetched before the agent runs
+DATA_NEEDS = [
+    FinancialMetricsNeed(period="ttm", limit=10),
+    LineItemsNeed(LINE_ITEMS, period="ttm", limit=10),
+    MarketCapNeed(),
+]
+
+
+async def awarren_buffett_agent(state: AgentState, agent_id: str = "warren_buffett_agent"):
     """Analyzes stocks using Buffett's principles and LLM reasoning."""
     data = state["data"]
     end_date = data["end_date"]
     tickers = data["tickers"]
     api_key = get_api_key_from_state(state, "FINANCIAL_DATASETS_API_KEY")
-    # Collect all analysis for LLM reasoning
-    analysis_data = {}
-    buffett_analysis = {}
 
-    for ticker in tickers:
+    async def analyze_ticker(ticker: str) -> dict:
+        # This ticker's analysis only, so the prompt carries no other tickers
+        analysis_data = {}
+
         progress.update_status(agent_id, ticker, "Fetching financial metrics")
         # Fetch required data - request more periods for better trend analysis
-        metrics = get_financial_metrics(ticker, end_date, period="ttm", limit=10, api_key=api_key)
+        metrics = await aget_financial_metrics(ticker, end_date, period="ttm", limit=10, api_key=api_key)
 
         progress.update_status(agent_id, ticker, "Gathering financial line items")
-        financial_line_items = search_line_items(
+        financial_line_items = await asearch_line_items(
             ticker,
-            [
-                "capital_expenditure",
-                "depreciation_and_amortization",
-                "net_income",
-                "outstanding_shares",
-                "total_assets",
-                "total_liabilities",
-                "shareholders_equity",
-                "dividends_and_other_cash_distributions",
-                "issuance_or_purchase_of_equity_shares",
-                "gross_profit",
-                "revenue",
-                "free_cash_flow",
-            ],
+            LINE_ITEMS,
             end_date,
             period="ttm",
             limit=10,
@@ -56,7 +69,7 @@ def warren_buffett_agent(state: AgentState, agent_id: str = "warren_buffett_agen
 
         progress.update_status(agent_id, ticker, "Getting market cap")
         # Get current market cap
-        market_cap = get_market_cap(ticker, end_date, api_key=api_key)
+        market_cap = await aget_market_cap(ticker, end_date, api_key=api_key)
 
         progress.update_status(agent_id, ticker, "Analyzing fundamentals")
         # Analyze fundamentals
@@ -122,21 +135,23 @@ def warren_buffett_agent(state: AgentState, agent_id: str = "warren_buffett_agen
         }
 
         progress.update_status(agent_id, ticker, "Generating Warren Buffett analysis")
-        buffett_output = generate_buffett_output(
+        buffett_output = await generate_buffett_output(
             ticker=ticker,
             analysis_data=analysis_data[ticker],
             state=state,
             agent_id=agent_id,
         )
 
+        progress.update_status(agent_id, ticker, "Done", analysis=buffett_output.reasoning)
+
         # Store analysis in consistent format with other agents
-        buffett_analysis[ticker] = {
+        return {
             "signal": buffett_output.signal,
             "confidence": buffett_output.confidence,
             "reasoning": buffett_output.reasoning,
         }
 
-        progress.update_status(agent_id, ticker, "Done", analysis=buffett_output.reasoning)
+    buffett_analysis = await amap_tickers(agent_id, tickers, analyze_ticker)
 
     # Create the message
     message = HumanMessage(content=json.dumps(buffett_analysis), name=agent_id)
@@ -145,12 +160,14 @@ def warren_buffett_agent(state: AgentState, agent_id: str = "warren_buffett_agen
     if state["metadata"]["show_reasoning"]:
         show_agent_reasoning(buffett_analysis, agent_id)
 
-    # Add the signal to the analyst_signals list
-    state["data"]["analyst_signals"][agent_id] = buffett_analysis
-
     progress.update_status(agent_id, None, "Done")
 
-    return {"messages": [message], "data": state["data"]}
+    return {"messages": [message], "data": {"analyst_signals": {agent_id: buffett_analysis}}}
+
+
+def warren_buffett_agent(state: AgentState, agent_id: str = "warren_buffett_agent"):
+    """Synchronous version of awarren_buffett_agent."""
+    return run_isolated(awarren_buffett_agent(state, agent_id))
 
 
 def analyze_fundamentals(metrics: list) -> dict[str, any]:
@@ -743,7 +760,7 @@ def analyze_pricing_power(financial_line_items: list, metrics: list) -> dict[str
     }
 
 
-def generate_buffett_output(
+async def generate_buffett_output(
         ticker: str,
         analysis_data: dict[str, any],
         state: AgentState,
@@ -817,7 +834,7 @@ def generate_buffett_output(
     def create_default_warren_buffett_signal():
         return WarrenBuffettSignal(signal="neutral", confidence=50, reasoning="Insufficient data")
 
-    return call_llm(
+    return await acall_llm(
         prompt=prompt,
         pydantic_model=WarrenBuffettSignal,
         agent_name=agent_id,
@@ -15,13 +15,14 @@ from .valuation import calculate_portfolio_value, compute_exposures
 from .output import OutputBuilder
 from .benchmarks import BenchmarkCalculator
 
+from src.agents.risk_manager import DATA_NEEDS as RISK_DATA_NEEDS
 from src.tools.api import (
-    get_company_news,
     get_price_data,
-    get_prices,
-    get_financial_metrics,
-    get_insider_trades,
+    get_price_frame,
+    get_prices_many,
 )
+from src.tools.prefetch import prefetch
+from src.utils.analysts import get_data_needs
 
 
 class BacktestEngine:
@@ -83,14 +84,13 @@ class BacktestEngine:
         start_date_dt = end_date_dt - relativedelta(years=1)
         start_date_str = start_date_dt.strftime("%Y-%m-%d")
 
-        for ticker in self._tickers:
-            get_prices(ticker, start_date_str, self._end_date)
-            get_financial_metrics(ticker, self._end_date, limit=10)
-            get_insider_trades(ticker, self._end_date, start_date=self._start_date, limit=1000)
-            get_company_news(ticker, self._end_date, start_date=self._start_date, limit=1000)
-        
+        get_prices_many(self._tickers, start_date_str, self._end_date)
+        # One pass over the whole window: every day's as-of queries are then answered from the cache
+        needs = get_data_needs(self._selected_analysts if self._selected_analysts else None) + RISK_DATA_NEEDS
+        prefetch(needs, self._tickers, start_date_str, self._end_date, first_end_date=self._start_date)
+
         # Preload data for SPY for benchmark comparison
-        get_prices("SPY", self._start_date, self._end_date)
+        get_price_frame("SPY", self._start_date, self._end_date)
 
 
     def run_backtest(self) -> PerformanceMetrics:
@@ -1,65 +1,247 @@
+import os
+import threading
+
+from src.data.cache_backends import MemoryCacheBackend, SQLiteCacheBackend, create_backend_from_env
+from src.data.history import ALL_FIELDS, MIN_DATE, EventHistory, ReportHistory, merge_date_ranges, missing_date_ranges  # noqa: F401
+from src.data.models import CompanyFacts
+from src.data.price_frame import PriceFrame
+
+# Default time-to-live (seconds) per dataset for persistent caches
+DEFAULT_TTLS: dict[str, float] = {
+    "prices": 24 * 60 * 60,
+    "financial_metrics": 24 * 60 * 60,
+    "line_items": 24 * 60 * 60,
+    "insider_trades": 6 * 60 * 60,
+    "company_news": 60 * 60,
+    "company_facts": 15 * 60,
+}
+
+# Datasets that change during the trading day (market cap moves with the price), so
+# their entries expire even in memory
+INTRADAY_DATASETS = ("company_facts",)
+
+# Time-to-live (seconds) of negative entries, which remember requests that returned nothing
+DEFAULT_NEGATIVE_TTLS: dict[str, float] = {
+    # The API answered, but has no data for the query (e.g. a small cap without insider trades)
+    "empty": 60 * 60,
+    # The request failed (non-200 after retries, unparsable body) and may well succeed soon
+    "error": 60,
+}
+
+
 class Cache:
-    """In-memory cache for API responses."""
-
-    def __init__(self):
-        self._prices_cache: dict[str, list[dict[str, any]]] = {}
-        self._financial_metrics_cache: dict[str, list[dict[str, any]]] = {}
-        self._line_items_cache: dict[str, list[dict[str, any]]] = {}
-        self._insider_trades_cache: dict[str, list[dict[str, any]]] = {}
-        self._company_news_cache: dict[str, list[dict[str, any]]] = {}
-
-    def _merge_data(self, existing: list[dict] | None, new_data: list[dict], key_field: str) -> list[dict]:
-        """Merge existing and new data, avoiding duplicates based on a key field."""
-        if not existing:
-            return new_data
-
-        # Create a set of existing keys for O(1) lookup
-        existing_keys = {item[key_field] for item in existing}
-
-        # Only add items that don't exist yet
-        merged = existing.copy()
-        merged.extend([item for item in new_data if item[key_field] not in existing_keys])
-        return merged
-
-    def get_prices(self, ticker: str) -> list[dict[str, any]] | None:
-        """Get cached price data if available."""
-        return self._prices_cache.get(ticker)
-
-    def set_prices(self, ticker: str, data: list[dict[str, any]]):
-        """Append new price data to cache."""
-        self._prices_cache[ticker] = self._merge_data(self._prices_cache.get(ticker), data, key_field="time")
-
-    def get_financial_metrics(self, ticker: str) -> list[dict[str, any]]:
-        """Get cached financial metrics if available."""
-        return self._financial_metrics_cache.get(ticker)
-
-    def set_financial_metrics(self, ticker: str, data: list[dict[str, any]]):
-        """Append new financial metrics to cache."""
-        self._financial_metrics_cache[ticker] = self._merge_data(self._financial_metrics_cache.get(ticker), data, key_field="report_period")
-
-    def get_line_items(self, ticker: str) -> list[dict[str, any]] | None:
-        """Get cached line items if available."""
-        return self._line_items_cache.get(ticker)
-
-    def set_line_items(self, ticker: str, data: list[dict[str, any]]):
-        """Append new line items to cache."""
-        self._line_items_cache[ticker] = self._merge_data(self._line_items_cache.get(ticker), data, key_field="report_period")
-
-    def get_insider_trades(self, ticker: str) -> list[dict[str, any]] | None:
-        """Get cached insider trades if available."""
-        return self._insider_trades_cache.get(ticker)
-
-    def set_insider_trades(self, ticker: str, data: list[dict[str, any]]):
-        """Append new insider trades to cache."""
-        self._insider_trades_cache[ticker] = self._merge_data(self._insider_trades_cache.get(ticker), data, key_field="filing_date")  # Could also use transaction_date if preferred
-
-    def get_company_news(self, ticker: str) -> list[dict[str, any]] | None:
-        """Get cached company news if available."""
-        return self._company_news_cache.get(ticker)
-
-    def set_company_news(self, ticker: str, data: list[dict[str, any]]):
-        """Append new company news to cache."""
-        self._company_news_cache[ticker] = self._merge_data(self._company_news_cache.get(ticker), data, key_field="date")
+    """
+    Cache for API responses, backed by memory or a persistent store.
+
+    Without an explicit backend, the backend is picked from the environment on first
+    use (see create_backend_from_env), so settings loaded from .env after import apply.
+    """
+
+    def __init__(self, backend: MemoryCacheBackend | SQLiteCacheBackend | None = None, ttls: dict[str, float | None] | None = None, negative_ttls: dict[str, float | None] | None = None):
+        self._backend = backend
+        self._ttls = ttls
+        self._negative_ttls = negative_ttls
+        # TTLs of INTRADAY_DATASETS not given in ttls, read from the environment on first use
+        self._intraday_ttls: dict[str, float | None] | None = None
+        # Requests answered by a negative entry instead of going out, per dataset
+        self._requests_saved: dict[str, int] = {}
+        # Serializes read-merge-write cycles so concurrent sets don't drop rows
+        self._lock = threading.RLock()
+
+    @property
+    def backend(self) -> MemoryCacheBackend | SQLiteCacheBackend:
+        if self._backend is None:
+            with self._lock:
+                if self._backend is None:
+                    backend = create_backend_from_env()
+                    # In-memory data dies with the process, so only persistent entries need to expire
+                    if self._ttls is None and isinstance(backend, SQLiteCacheBackend):
+                        self._ttls = _ttls_from_env()
+                    self._backend = backend
+        return self._backend
+
+    def _get(self, dataset: str, key: str):
+        return self.backend.get(dataset, key, ttl=self._ttl(dataset))
+
+    def _ttl(self, dataset: str) -> float | None:
+        if self._ttls is not None and dataset in self._ttls:
+            return self._ttls[dataset]
+        if dataset in INTRADAY_DATASETS:
+            if self._intraday_ttls is None:
+                ttls = _ttls_from_env()
+                self._intraday_ttls = {name: ttls[name] for name in INTRADAY_DATASETS}
+            return self._intraday_ttls[dataset]
+        return None
+
+    def _get_price_entry(self, ticker: str) -> dict:
+        entry = self._get("prices", ticker)
+        # Bars and the date ranges they fully cover live in one entry so they always expire together
+        if not isinstance(entry, dict) or not isinstance(entry.get("frame"), PriceFrame):
+            return {"frame": PriceFrame.empty(), "coverage": []}
+        return entry
+
+    def get_prices(self, ticker: str) -> PriceFrame | None:
+        """Get cached price bars if available."""
+        return self._get_price_entry(ticker)["frame"] or None
+
+    def get_price_coverage(self, ticker: str) -> list[tuple[str, str]]:
+        """Get the sorted, non-overlapping (start, end) date ranges whose prices are fully cached."""
+        return self._get_price_entry(ticker)["coverage"]
+
+    def set_prices(self, ticker: str, data: PriceFrame, covered: tuple[str, str] | None = None):
+        """Merge new price bars into the cache, optionally marking the date range they fully cover."""
+        with self._lock:
+            entry = self._get_price_entry(ticker)
+            coverage = entry["coverage"]
+            if covered is not None:
+                coverage = merge_date_ranges(coverage, covered)
+            self.backend.set("prices", ticker, {"frame": entry["frame"].merge(data), "coverage": coverage})
+
+    def _get_history(self, dataset: str, key: str) -> ReportHistory | None:
+        history = self._get(dataset, key)
+        return history if isinstance(history, ReportHistory) else None
+
+    def _record_history(self, dataset: str, key: str, fields: list[str], end_date: str, limit: int, data: list[dict]):
+        with self._lock:
+            cached = self._get_history(dataset, key)
+            # Copy-on-write: readers holding the cached history never see it change
+            history = cached.copy() if cached else ReportHistory()
+            history.record(fields, end_date, limit, data)
+            self.backend.set(dataset, key, history)
+
+    def get_financial_metrics(self, ticker: str, period: str) -> ReportHistory | None:
+        """Get the cached financial-metrics history for a ticker and period if available."""
+        return self._get_history("financial_metrics", f"{ticker}_{period}")
+
+    def set_financial_metrics(self, ticker: str, period: str, end_date: str, limit: int, data: list[dict[str, any]]):
+        """Merge a fetch of the latest `limit` metrics as of end_date into the history."""
+        self._record_history("financial_metrics", f"{ticker}_{period}", [ALL_FIELDS], end_date, limit, data)
+
+    def get_line_items(self, ticker: str, period: str) -> ReportHistory | None:
+        """Get the cached line-item history for a ticker and period if available."""
+        return self._get_history("line_items", f"{ticker}_{period}")
+
+    def set_line_items(self, ticker: str, period: str, line_items: list[str], end_date: str, limit: int, data: list[dict[str, any]]):
+        """Merge fetched line items into the history, column by column."""
+        self._record_history("line_items", f"{ticker}_{period}", line_items, end_date, limit, data)
+
+    def _get_events(self, dataset: str, ticker: str) -> EventHistory | None:
+        history = self._get(dataset, ticker)
+        return history if isinstance(history, EventHistory) else None
+
+    def _record_events(self, dataset: str, ticker: str, date_field: str, items: list, start_date: str | None, end_date: str, limit: int, complete: bool):
+        with self._lock:
+            cached = self._get_events(dataset, ticker)
+            # Copy-on-write: readers holding the cached history never see it change
+            history = cached.copy() if cached else EventHistory(date_field=date_field)
+            history.record(items, start_date, end_date, limit, complete=complete)
+            self.backend.set(dataset, ticker, history)
+
+    def get_insider_trades(self, ticker: str) -> EventHistory | None:
+        """Get the cached insider-trade history for a ticker if available."""
+        return self._get_events("insider_trades", ticker)
+
+    def record_insider_trades(self, ticker: str, trades: list, start_date: str | None, end_date: str, limit: int, complete: bool = True):
+        """Merge a fetch of insider trades (validated models) into the ticker's history, dated by filing_date."""
+        self._record_events("insider_trades", ticker, "filing_date", trades, start_date, end_date, limit, complete)
+
+    def get_company_news(self, ticker: str) -> EventHistory | None:
+        """Get the cached news history for a ticker if available."""
+        return self._get_events("company_news", ticker)
+
+    def record_company_news(self, ticker: str, news: list, start_date: str | None, end_date: str, limit: int, complete: bool = True):
+        """Merge a fetch of news articles (validated models) into the ticker's history, dated by date."""
+        self._record_events("company_news", ticker, "date", news, start_date, end_date, limit, complete)
+
+    def get_company_facts(self, ticker: str) -> CompanyFacts | None:
+        """Get cached company facts if available and fetched within the intraday TTL."""
+        facts = self._get("company_facts", ticker)
+        return facts if isinstance(facts, CompanyFacts) else None
+
+    def set_company_facts(self, ticker: str, facts: CompanyFacts):
+        """Cache a ticker's company facts (validated model)."""
+        self.backend.set("company_facts", ticker, facts)
+
+    def _negative_ttl(self, kind: str) -> float | None:
+        if self._negative_ttls is None:
+            self._negative_ttls = _negative_ttls_from_env()
+        return self._negative_ttls.get(kind)
+
+    def get_negative(self, dataset: str, key: str, start_date: str | None, end_date: str) -> str | None:
+        """
+        Check for a negative entry before sending a request that the cache can't answer.
+
+        Returns "error" while a recent failure for (dataset, key) is remembered, "empty"
+        when earlier empty answers cover [start_date (or the beginning), end_date], and
+        None otherwise. Every non-None answer is a request saved, counted in stats().
+        """
+        entry_key = f"{dataset}:{key}"
+        kind = None
+        if self._negative_ttl("error") and self.backend.get("negative_error", entry_key, ttl=self._negative_ttl("error")) is not None:
+            kind = "error"
+        elif self._negative_ttl("empty"):
+            ranges = self.backend.get("negative_empty", entry_key, ttl=self._negative_ttl("empty"))
+            if ranges and not missing_date_ranges(ranges, start_date or MIN_DATE, end_date):
+                kind = "empty"
+        if kind is not None:
+            with self._lock:
+                self._requests_saved[dataset] = self._requests_saved.get(dataset, 0) + 1
+        return kind
+
+    def record_negative(self, dataset: str, key: str, kind: str, start_date: str | None, end_date: str):
+        """
+        Remember that a request for [start_date, end_date] returned nothing.
+
+        kind is "empty" when the API has no data for the range (kept for the "empty" TTL,
+        counted from the latest empty answer for the key) or "error" when the request
+        failed (kept for the short "error" TTL, whatever the range).
+        """
+        entry_key = f"{dataset}:{key}"
+        if not self._negative_ttl(kind):
+            return
+        if kind == "error":
+            self.backend.set("negative_error", entry_key, True)
+            return
+        with self._lock:
+            ranges = self.backend.get("negative_empty", entry_key, ttl=self._negative_ttl("empty")) or []
+            self.backend.set("negative_empty", entry_key, merge_date_ranges(ranges, (start_date or MIN_DATE, end_date)))
+
+    def clear(self):
+        """Drop every cached entry."""
+        self.backend.clear()
+        with self._lock:
+            self._requests_saved.clear()
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Per-dataset hits, misses, evictions, entry count, approximate size in bytes and requests saved by negative entries."""
+        stats = self.backend.stats()
+        with self._lock:
+            saved = dict(self._requests_saved)
+        for dataset in saved:
+            stats.setdefault(dataset, {"hits": 0, "misses": 0, "evictions": 0, "entries": 0, "bytes": 0})
+        for dataset, counts in stats.items():
+            counts["requests_saved"] = saved.get(dataset, 0)
+        return stats
+
+
+def _ttls_from_env() -> dict[str, float | None]:
+    """Default TTLs, overridable per dataset via HEDGE_FUND_CACHE_TTL_<DATASET> (seconds, 0 = never expire)."""
+    ttls: dict[str, float | None] = dict(DEFAULT_TTLS)
+    for dataset in DEFAULT_TTLS:
+        value = os.environ.get(f"HEDGE_FUND_CACHE_TTL_{dataset.upper()}")
+        if value is not None:
+            ttls[dataset] = float(value) or None
+    return ttls
+
+
+def _negative_ttls_from_env() -> dict[str, float | None]:
+    """Negative-entry TTLs, overridable via HEDGE_FUND_CACHE_NEGATIVE_TTL_EMPTY / _ERROR (seconds, 0 = don't cache)."""
+    ttls: dict[str, float | None] = dict(DEFAULT_NEGATIVE_TTLS)
+    for kind in DEFAULT_NEGATIVE_TTLS:
+        value = os.environ.get(f"HEDGE_FUND_CACHE_NEGATIVE_TTL_{kind.upper()}")
+        if value is not None:
+            ttls[kind] = float(value) or None
+    return ttls
 
 
 # Global cache instance
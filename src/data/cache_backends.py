@@ -0,0 +1,296 @@
+"""Storage backends for the API response cache."""
+
+import itertools
+import os
+import pickle
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+
+# Default ceiling for the in-memory cache
+DEFAULT_MEMORY_MAX_BYTES = 512 * 1024 * 1024
+
+# Containers larger than this are sized from a sample of their items
+_SIZE_SAMPLE = 16
+
+
+def estimate_size(value: Any, _depth: int = 0) -> int:
+    """
+    Approximate the memory held by a cached value, in bytes.
+
+    Arrays report their buffer size; containers are sized from a sample of at most
+    _SIZE_SAMPLE items scaled up to their length, so the estimate stays cheap for the
+    long news and insider-trade lists.
+    """
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes + 64
+    size = sys.getsizeof(value)
+    if _depth > 4:
+        return size
+    if isinstance(value, dict):
+        items = value.items()
+        if not items:
+            return size
+        sample = list(itertools.islice(items, _SIZE_SAMPLE))
+        sampled = sum(estimate_size(k, _depth + 1) + estimate_size(v, _depth + 1) for k, v in sample)
+        return size + sampled * len(value) // len(sample)
+    if isinstance(value, (list, tuple, set, frozenset)):
+        if not value:
+            return size
+        sample = list(itertools.islice(value, _SIZE_SAMPLE))
+        return size + sum(estimate_size(item, _depth + 1) for item in sample) * len(value) // len(sample)
+    if hasattr(value, "__dict__"):
+        return size + estimate_size(vars(value), _depth + 1)
+    return size
+
+
+class CacheStats:
+    """Per-dataset hit, miss and eviction counters."""
+
+    EVENTS = ("hits", "misses", "evictions")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts: dict[str, dict[str, int]] = {}
+
+    def record(self, dataset: str, event: str, count: int = 1) -> None:
+        with self._lock:
+            counts = self._counts.setdefault(dataset, dict.fromkeys(self.EVENTS, 0))
+            counts[event] += count
+
+    def snapshot(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            return {dataset: dict(counts) for dataset, counts in self._counts.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts.clear()
+
+
+def _merge_stats(counts: dict[str, dict[str, int]], usage: dict[str, tuple[int, int]]) -> dict[str, dict[str, int]]:
+    """Combine event counters with per-dataset (entries, bytes) usage."""
+    stats = {}
+    for dataset in sorted(set(counts) | set(usage)):
+        entries, nbytes = usage.get(dataset, (0, 0))
+        stats[dataset] = {**dict.fromkeys(CacheStats.EVENTS, 0), **counts.get(dataset, {}), "entries": entries, "bytes": nbytes}
+    return stats
+
+
+class MemoryCacheBackend:
+    """
+    Process-local storage. Nothing survives the process.
+
+    Each entry's size is estimated when it is stored. Once the total passes max_bytes,
+    the least recently used entries are evicted until it fits again.
+    """
+
+    def __init__(self, max_bytes: int | None = None):
+        self.max_bytes = max_bytes
+        # (dataset, key) -> (stored_at, size, value), least recently used first
+        self._entries: OrderedDict[tuple[str, str], tuple[float, int, Any]] = OrderedDict()
+        self._bytes = 0
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def get(self, dataset: str, key: str, ttl: float | None = None) -> Any | None:
+        """Return the stored value, or None if missing or older than ttl seconds."""
+        with self._lock:
+            entry = self._entries.get((dataset, key))
+            if entry is None:
+                self._stats.record(dataset, "misses")
+                return None
+            stored_at, size, value = entry
+            if ttl is not None and time.time() - stored_at > ttl:
+                self._remove((dataset, key))
+                self._stats.record(dataset, "misses")
+                return None
+            self._entries.move_to_end((dataset, key))
+            self._stats.record(dataset, "hits")
+            return value
+
+    def set(self, dataset: str, key: str, value: Any) -> None:
+        size = estimate_size(value)
+        with self._lock:
+            self._remove((dataset, key))
+            self._entries[(dataset, key)] = (time.time(), size, value)
+            self._bytes += size
+            if self.max_bytes is not None:
+                self._evict(self.max_bytes)
+
+    def delete(self, dataset: str, key: str) -> None:
+        with self._lock:
+            self._remove((dataset, key))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            return self._bytes
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Hits, misses, evictions, entries and approximate bytes per dataset."""
+        with self._lock:
+            usage: dict[str, tuple[int, int]] = {}
+            for (dataset, _), (_, size, _) in self._entries.items():
+                entries, nbytes = usage.get(dataset, (0, 0))
+                usage[dataset] = (entries + 1, nbytes + size)
+        return _merge_stats(self._stats.snapshot(), usage)
+
+    def _remove(self, entry_key: tuple[str, str]) -> None:
+        entry = self._entries.pop(entry_key, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+
+    def _evict(self, max_bytes: int) -> None:
+        """Drop least recently used entries until the total fits in max_bytes."""
+        while self._bytes > max_bytes and self._entries:
+            (dataset, _), (_, size, _) = self._entries.popitem(last=False)
+            self._bytes -= size
+            self._stats.record(dataset, "evictions")
+
+
+class SQLiteCacheBackend:
+    """
+    Persistent storage in a single SQLite file.
+
+    Values are pickled into one row per (dataset, key). Every write runs in its own
+    transaction, so a crash mid-write never leaves a half-written entry behind, and
+    several processes can share the same file. When the stored payload grows past
+    max_bytes, the least recently read entries are evicted first.
+    """
+
+    def __init__(self, path: str | Path, max_bytes: int | None = None):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                dataset TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                PRIMARY KEY (dataset, key)
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at)")
+
+    def get(self, dataset: str, key: str, ttl: float | None = None) -> Any | None:
+        """Return the stored value, or None if missing or older than ttl seconds."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT value, stored_at FROM entries WHERE dataset = ? AND key = ?", (dataset, key)).fetchone()
+            if row is None:
+                self._stats.record(dataset, "misses")
+                return None
+            value, stored_at = row
+            if ttl is not None and now - stored_at > ttl:
+                self._conn.execute("DELETE FROM entries WHERE dataset = ? AND key = ?", (dataset, key))
+                self._stats.record(dataset, "misses")
+                return None
+            self._conn.execute("UPDATE entries SET accessed_at = ? WHERE dataset = ? AND key = ?", (now, dataset, key))
+        try:
+            value = pickle.loads(value)
+        except Exception:
+            # Written by an incompatible version of the code - treat as a miss
+            self.delete(dataset, key)
+            self._stats.record(dataset, "misses")
+            return None
+        self._stats.record(dataset, "hits")
+        return value
+
+    def set(self, dataset: str, key: str, value: Any) -> None:
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        now = time.time()
+        with self._lock:
+            with self._transaction():
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO entries (dataset, key, value, size, stored_at, accessed_at) VALUES (?, ?, ?, ?, ?, ?)",
+                    (dataset, key, payload, len(payload), now, now),
+                )
+                if self.max_bytes is not None:
+                    self._evict(self.max_bytes)
+
+    def delete(self, dataset: str, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM entries WHERE dataset = ? AND key = ?", (dataset, key))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Hits, misses and evictions seen by this process, plus entries and stored bytes per dataset."""
+        with self._lock:
+            rows = self._conn.execute("SELECT dataset, COUNT(*), COALESCE(SUM(size), 0) FROM entries GROUP BY dataset").fetchall()
+        return _merge_stats(self._stats.snapshot(), {dataset: (entries, nbytes) for dataset, entries, nbytes in rows})
+
+    def _evict(self, max_bytes: int) -> None:
+        """Drop least recently accessed entries until the payload fits in max_bytes."""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= max_bytes:
+            return
+        rows = self._conn.execute("SELECT dataset, key, size FROM entries ORDER BY accessed_at ASC").fetchall()
+        for dataset, key, size in rows:
+            if total <= max_bytes:
+                break
+            self._conn.execute("DELETE FROM entries WHERE dataset = ? AND key = ?", (dataset, key))
+            self._stats.record(dataset, "evictions")
+            total -= size
+
+    def _transaction(self):
+        return _Transaction(self._conn)
+
+
+class _Transaction:
+    """BEGIN IMMEDIATE ... COMMIT, rolled back on error."""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+
+    def __enter__(self):
+        self._conn.execute("BEGIN IMMEDIATE")
+        return self._conn
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self._conn.execute("COMMIT")
+        else:
+            self._conn.execute("ROLLBACK")
+        return False
+
+
+def create_backend_from_env() -> MemoryCacheBackend | SQLiteCacheBackend:
+    """
+    Pick a backend from the environment.
+
+    HEDGE_FUND_CACHE_DIR enables the persistent SQLite backend in that directory.
+    Without a cache dir, data stays in memory. HEDGE_FUND_CACHE_MAX_BYTES caps the size
+    of either backend; the in-memory cache defaults to DEFAULT_MEMORY_MAX_BYTES.
+    """
+    cache_dir = os.environ.get("HEDGE_FUND_CACHE_DIR")
+    max_bytes = os.environ.get("HEDGE_FUND_CACHE_MAX_BYTES")
+    if not cache_dir:
+        return MemoryCacheBackend(max_bytes=int(max_bytes) if max_bytes else DEFAULT_MEMORY_MAX_BYTES)
+    return SQLiteCacheBackend(Path(cache_dir).expanduser() / "financial_data.sqlite", max_bytes=int(max_bytes) if max_bytes else None)
@@ -0,0 +1,257 @@
+"""Per-ticker report and event histories that let the cache answer overlapping and point-in-time queries."""
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Any, Callable, Hashable
+
+# Pseudo field name for datasets whose rows are always fetched whole (e.g. financial metrics)
+ALL_FIELDS = "*"
+
+# Start of an open-ended date range ("everything up to ...")
+MIN_DATE = "0001-01-01"
+
+
+@dataclass(frozen=True)
+class HistoryFetch:
+    """One completed fetch: the API's top `limit` reports with report_period <= end_date."""
+
+    end_date: str
+    limit: int
+    # Fewer than limit rows came back, so every report up to end_date is known
+    complete: bool
+    # Oldest report_period returned (None when nothing came back)
+    oldest: str | None
+
+
+@dataclass
+class ReportHistory:
+    """
+    Report rows for one (ticker, period), keyed by report_period and merged by column.
+
+    Besides the rows, the history remembers which fetches produced each field. A fetch
+    of the latest `limit` reports as of `end_date` is contiguous, so it can answer any
+    query with an earlier or equal end_date as long as enough of its rows fall on or
+    before that date. Lookups bisect the sorted report periods, so one wide fetch can
+    serve every as-of date of a backtest.
+    """
+
+    rows: dict[str, dict] = field(default_factory=dict)
+    fetches: dict[str, list[HistoryFetch]] = field(default_factory=dict)
+    # Validated models built from rows, per report_period and variant (see select_models)
+    models: dict[str, dict[Hashable, Any]] = field(default_factory=dict, repr=False, compare=False)
+
+    def __setstate__(self, state: dict) -> None:
+        # Histories pickled by older versions lack the newer attributes
+        self.__dict__.update(state)
+        self.__dict__.setdefault("models", {})
+
+    def copy(self) -> "ReportHistory":
+        """Copy for copy-on-write updates, so readers of the cached instance never see it change."""
+        return ReportHistory(
+            rows={rp: dict(row) for rp, row in self.rows.items()},
+            fetches={name: list(fetches) for name, fetches in self.fetches.items()},
+            models={rp: dict(built) for rp, built in self.models.items()},
+        )
+
+    def covers(self, field_name: str, end_date: str, limit: int) -> bool:
+        """Whether the latest `limit` reports as of end_date are known for field_name."""
+        for fetch in self.fetches.get(field_name, ()):
+            if end_date > fetch.end_date:
+                continue
+            if fetch.complete:
+                return True
+            periods = self._sorted_periods()
+            known = bisect_right(periods, end_date) - bisect_left(periods, fetch.oldest)
+            if known >= limit:
+                return True
+        return False
+
+    def missing_fields(self, fields: list[str], end_date: str, limit: int) -> list[str]:
+        return [name for name in fields if not self.covers(name, end_date, limit)]
+
+    def record(self, fields: list[str], end_date: str, limit: int, rows: list[dict]) -> None:
+        """Merge fetched rows column-wise and remember the fetch for each of its fields."""
+        for row in rows:
+            self.rows.setdefault(row["report_period"], {}).update(row)
+            self.models.pop(row["report_period"], None)
+        fetch = HistoryFetch(
+            end_date=end_date,
+            limit=limit,
+            complete=len(rows) < limit,
+            oldest=min((row["report_period"] for row in rows), default=None),
+        )
+        for name in fields:
+            # A fetch reaching further back in time supersedes older records with the same end_date
+            kept = [f for f in self.fetches.get(name, ()) if not (f.end_date == fetch.end_date and f.limit <= fetch.limit)]
+            self.fetches[name] = kept + [fetch]
+
+    def select(self, end_date: str, limit: int) -> list[dict]:
+        """The latest `limit` rows with report_period <= end_date, newest first."""
+        return [self.rows[rp] for rp in self._latest(end_date, limit)]
+
+    def select_models(self, end_date: str, limit: int, build: Callable[[dict], Any], variant: Hashable = None) -> list:
+        """
+        Like select(), but returns build(row) for each row.
+
+        Built models are kept until their row changes, so repeated reads don't validate
+        the same row again. variant distinguishes models built differently from the same
+        row (e.g. different line item subsets).
+        """
+        models = []
+        for rp in self._latest(end_date, limit):
+            built = self.models.setdefault(rp, {})
+            model = built.get(variant)
+            if model is None:
+                model = built[variant] = build(self.rows[rp])
+            models.append(model)
+        return models
+
+    def _sorted_periods(self) -> list[str]:
+        # Rows are only ever added, so a length mismatch means the sorted index is stale
+        periods = self.__dict__.get("_periods")
+        if periods is None or len(periods) != len(self.rows):
+            periods = self.__dict__["_periods"] = sorted(self.rows)
+        return periods
+
+    def _latest(self, end_date: str, limit: int) -> list[str]:
+        periods = self._sorted_periods()
+        hi = bisect_right(periods, end_date)
+        return periods[max(0, hi - limit) : hi][::-1]
+
+
+@dataclass
+class EventHistory:
+    """
+    Dated items for one ticker (news articles, insider trades), oldest first.
+
+    coverage lists the inclusive YYYY-MM-DD ranges for which every item is known. A
+    query is answered locally when its range (or, without a start date, enough of the
+    range reaching back from its end date) is covered; items are found by bisecting
+    their dates. full_pages remembers the (end_date, limit) of full pages fetched
+    without a start date, which answer their own query even though their oldest day
+    isn't covered.
+    """
+
+    # Name of the item attribute holding its date (e.g. "date" or "filing_date")
+    date_field: str
+    items: list = field(default_factory=list)
+    coverage: list[tuple[str, str]] = field(default_factory=list)
+    full_pages: dict[str, int] = field(default_factory=dict)
+
+    def __setstate__(self, state: dict) -> None:
+        # Histories pickled by older versions lack the newer attributes
+        self.__dict__.update(state)
+        self.__dict__.setdefault("full_pages", {})
+
+    def copy(self) -> "EventHistory":
+        """Copy for copy-on-write updates, so readers of the cached instance never see it change."""
+        return EventHistory(date_field=self.date_field, items=list(self.items), coverage=list(self.coverage), full_pages=dict(self.full_pages))
+
+    def high_water_mark(self) -> str | None:
+        """Date (timestamp) of the newest item seen, the point an incremental sync resumes from."""
+        return self._timestamp(self.items[-1]) if self.items else None
+
+    def record(self, items: list, start_date: str | None, end_date: str, limit: int, complete: bool = True) -> None:
+        """
+        Merge fetched items and remember the range they cover.
+
+        A fetch with a start date returns every item in [start_date, end_date]. Without
+        one it returns the newest `limit` items up to end_date; if the page was full,
+        items on its oldest day may be cut off, so only later days count as covered,
+        but the page itself is remembered as the answer to its query. Incomplete fetches (e.g. pagination stopped by an error) add items but no coverage.
+        """
+        known = set(self.items)
+        new_items = [item for item in dict.fromkeys(items) if item not in known]
+        if new_items:
+            self.items = sorted(self.items + new_items, key=self._timestamp)
+        if not complete:
+            return
+        if start_date is not None:
+            covered_from = start_date
+        elif len(items) < limit:
+            covered_from = MIN_DATE
+        else:
+            covered_from = next_day(min(self._day(item) for item in items))
+            self.full_pages[end_date] = max(limit, self.full_pages.get(end_date, 0))
+        if covered_from <= end_date:
+            self.coverage = merge_date_ranges(self.coverage, (covered_from, end_date))
+
+    def select(self, start_date: str | None, end_date: str, limit: int) -> list | None:
+        """
+        Items the API would return for this query, newest first, or None if the history can't tell.
+
+        With a start date that is every item in [start_date, end_date]; without one the
+        newest `limit` items up to end_date.
+        """
+        days = self._sorted_days()
+        hi = bisect_right(days, end_date)
+        if start_date is None and limit <= self.full_pages.get(end_date, 0):
+            return self.items[max(0, hi - limit) : hi][::-1]
+        covering = next((r for r in self.coverage if r[0] <= end_date <= r[1]), None)
+        if covering is None:
+            return None
+        if start_date is not None:
+            if start_date < covering[0]:
+                return None
+            return self.items[bisect_left(days, start_date) : hi][::-1]
+        if covering[0] != MIN_DATE and hi - bisect_left(days, covering[0]) < limit:
+            return None
+        return self.items[max(0, hi - limit) : hi][::-1]
+
+    def _timestamp(self, item) -> str:
+        return getattr(item, self.date_field)
+
+    def _day(self, item) -> str:
+        return self._timestamp(item)[:10]
+
+    def _sorted_days(self) -> list[str]:
+        # Items are only ever added, so a length mismatch means the day index is stale
+        days = self.__dict__.get("_days")
+        if days is None or len(days) != len(self.items):
+            days = self.__dict__["_days"] = [self._day(item) for item in self.items]
+        return days
+
+
+def merge_date_ranges(ranges: list[tuple[str, str]], new_range: tuple[str, str]) -> list[tuple[str, str]]:
+    """Add an inclusive YYYY-MM-DD range to a sorted range list, joining overlapping or adjacent ranges."""
+    merged: list[tuple[str, str]] = []
+    start, end = new_range
+    for range_start, range_end in sorted(ranges):
+        if next_day(range_end) < start:
+            merged.append((range_start, range_end))
+        elif next_day(end) < range_start:
+            merged.append((start, end))
+            start, end = range_start, range_end
+        else:
+            start, end = min(start, range_start), max(end, range_end)
+    merged.append((start, end))
+    return merged
+
+
+def missing_date_ranges(ranges: list[tuple[str, str]], start: str, end: str) -> list[tuple[str, str]]:
+    """Return the parts of the inclusive range [start, end] not covered by the sorted range list."""
+    if start > end:
+        return []
+    missing: list[tuple[str, str]] = []
+    cursor = start
+    for range_start, range_end in ranges:
+        if range_end < cursor:
+            continue
+        if range_start > end:
+            break
+        if range_start > cursor:
+            missing.append((cursor, previous_day(range_start)))
+        cursor = next_day(range_end)
+        if cursor > end:
+            return missing
+    missing.append((cursor, end))
+    return missing
+
+
+def next_day(day: str) -> str:
+    return (date.fromisoformat(day) + timedelta(days=1)).isoformat()
+
+
+def previous_day(day: str) -> str:
+    return (date.fromisoformat(day) - timedelta(days=1)).isoformat()
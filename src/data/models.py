@@ -1,7 +1,10 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class Price(BaseModel):
+    # Immutable, so validated instances can be shared straight out of the cache
+    model_config = ConfigDict(frozen=True)
+
     open: float
     close: float
     high: float
@@ -16,6 +19,9 @@ class PriceResponse(BaseModel):
 
 
 class FinancialMetrics(BaseModel):
+    # Immutable, so validated instances can be shared straight out of the cache
+    model_config = ConfigDict(frozen=True)
+
     ticker: str
     report_period: str
     period: str
@@ -71,8 +77,8 @@ class LineItem(BaseModel):
     period: str
     currency: str
 
-    # Allow additional fields dynamically
-    model_config = {"extra": "allow"}
+    # Allow additional fields dynamically; immutable, so validated instances can be shared straight out of the cache
+    model_config = ConfigDict(extra="allow", frozen=True)
 
 
 class LineItemResponse(BaseModel):
@@ -80,6 +86,9 @@ class LineItemResponse(BaseModel):
 
 
 class InsiderTrade(BaseModel):
+    # Immutable, so validated instances can be shared straight out of the cache
+    model_config = ConfigDict(frozen=True)
+
     ticker: str
     issuer: str | None
     name: str | None
@@ -100,6 +109,9 @@ class InsiderTradeResponse(BaseModel):
 
 
 class CompanyNews(BaseModel):
+    # Immutable, so validated instances can be shared straight out of the cache
+    model_config = ConfigDict(frozen=True)
+
     ticker: str
     title: str
     author: str
@@ -114,6 +126,9 @@ class CompanyNewsResponse(BaseModel):
 
 
 class CompanyFacts(BaseModel):
+    # Immutable, so validated instances can be shared straight out of the cache
+    model_config = ConfigDict(frozen=True)
+
     ticker: str
     name: str
     cik: str | None = None
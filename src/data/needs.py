@@ -0,0 +1,51 @@
+"""Declarations of the financial data each agent reads, used to prefetch it up front."""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+
+@dataclass(frozen=True)
+class PricesNeed:
+    """Daily prices over the run's start_date..end_date window."""
+
+
+@dataclass(frozen=True)
+class FinancialMetricsNeed:
+    period: str = "ttm"
+    limit: int = 10
+
+
+@dataclass(frozen=True)
+class LineItemsNeed:
+    line_items: list[str]
+    period: str = "ttm"
+    limit: int = 10
+
+
+@dataclass(frozen=True)
+class InsiderTradesNeed:
+    limit: int = 1000
+    # Only trades filed within this many days before end_date (None = no start date)
+    lookback_days: int | None = None
+
+
+@dataclass(frozen=True)
+class CompanyNewsNeed:
+    limit: int = 1000
+    # Only articles published within this many days before end_date (None = no start date)
+    lookback_days: int | None = None
+
+
+@dataclass(frozen=True)
+class MarketCapNeed:
+    """Market cap as of end_date."""
+
+
+DataNeed = PricesNeed | FinancialMetricsNeed | LineItemsNeed | InsiderTradesNeed | CompanyNewsNeed | MarketCapNeed
+
+
+def lookback_start_date(end_date: str, days: int | None) -> str | None:
+    """The start_date an agent passes for a lookback of `days` ending at end_date."""
+    if days is None:
+        return None
+    return (datetime.fromisoformat(end_date) - timedelta(days=days)).date().isoformat()
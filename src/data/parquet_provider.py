@@ -0,0 +1,190 @@
+"""A data provider reading a local, partitioned Parquet data lake."""
+
+import asyncio
+import datetime
+from contextlib import contextmanager
+from pathlib import Path
+from typing import AsyncIterator
+
+from src.data.models import CompanyFacts, CompanyNews, FinancialMetrics, InsiderTrade, LineItem
+from src.data.price_frame import PRICE_COLUMNS, PriceFrame
+from src.data.provider import DataProvider, DataProviderError
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+    from pyarrow import fs
+except ImportError:  # optional dependency, only this provider needs it
+    pa = None
+
+# Fields every line-item row carries regardless of the requested line items
+_LINE_ITEM_BASE_FIELDS = ("ticker", "report_period", "period", "currency")
+
+
+class ParquetProvider(DataProvider):
+    """
+    Data from Parquet files laid out as one hive-style partition per dataset and ticker:
+
+        <root>/prices/ticker=AAPL/*.parquet             time, open, close, high, low, volume
+        <root>/financial_metrics/ticker=AAPL/*.parquet  FinancialMetrics fields
+        <root>/line_items/ticker=AAPL/*.parquet         ticker, report_period, period, currency, one column per line item
+        <root>/insider_trades/ticker=AAPL/*.parquet     InsiderTrade fields
+        <root>/company_news/ticker=AAPL/*.parquet       CompanyNews fields
+        <root>/company_facts/ticker=AAPL/*.parquet      CompanyFacts fields (the last row is used)
+
+    Only the ticker's partition is opened, files are memory-mapped, and scans read just
+    the columns a query needs with its filters pushed down to the row groups. Dates
+    may be stored as ISO strings or as date/timestamp columns. Queries answer exactly
+    what the Financial Datasets API would return for the same arguments, and the
+    (blocking) scans run in worker threads; news and insider trades are read in one
+    scan and handed out in pages. Unreadable files and rows that don't fit the models
+    raise DataProviderError, as malformed API responses do.
+
+    Requires the optional pyarrow dependency.
+    """
+
+    # Every ticker's partition is scanned separately, so batches only group the calls
+    line_items_batch_size = 100
+
+    def __init__(self, root: str | Path):
+        if pa is None:
+            raise ImportError("The parquet data provider needs pyarrow: pip install pyarrow (or poetry install --extras parquet)")
+        self.root = Path(root).expanduser()
+        self._filesystem = fs.LocalFileSystem(use_mmap=True)
+
+    async def aget_prices(self, ticker: str, start_date: str, end_date: str, api_key: str = None) -> PriceFrame:
+        with _read_errors("prices", ticker):
+            return await asyncio.to_thread(self._prices, ticker, start_date, end_date)
+
+    async def aget_financial_metrics(self, ticker: str, end_date: str, period: str, limit: int, api_key: str = None) -> list[FinancialMetrics]:
+        with _read_errors("financial metrics", ticker):
+            rows = await asyncio.to_thread(self._reports, "financial_metrics", ticker, list(FinancialMetrics.model_fields), end_date, period, limit)
+            return [FinancialMetrics(**row) for row in rows]
+
+    async def asearch_line_items(self, tickers: list[str], line_items: list[str], end_date: str, period: str, limit: int, api_key: str = None) -> dict[str, list[LineItem] | None]:
+        columns = list(_LINE_ITEM_BASE_FIELDS) + [name for name in line_items if name not in _LINE_ITEM_BASE_FIELDS]
+
+        async def read(ticker: str) -> list[LineItem]:
+            with _read_errors("line items", ticker):
+                rows = await asyncio.to_thread(self._reports, "line_items", ticker, columns, end_date, period, limit)
+                return [LineItem(**row) for row in rows]
+
+        results = await asyncio.gather(*(read(ticker) for ticker in tickers), return_exceptions=True)
+        return {ticker: None if isinstance(items, Exception) else items for ticker, items in zip(tickers, results)}
+
+    async def aiter_insider_trades(self, ticker: str, start_date: str | None, end_date: str, limit: int, api_key: str = None) -> AsyncIterator[list[InsiderTrade]]:
+        with _read_errors("insider trades", ticker):
+            rows = await asyncio.to_thread(self._events, "insider_trades", ticker, list(InsiderTrade.model_fields), "filing_date", start_date, end_date, limit)
+            trades = [InsiderTrade(**row) for row in rows]
+        for i in range(0, len(trades), limit):
+            yield trades[i : i + limit]
+
+    async def aiter_company_news(self, ticker: str, start_date: str | None, end_date: str, limit: int, api_key: str = None) -> AsyncIterator[list[CompanyNews]]:
+        with _read_errors("company news", ticker):
+            rows = await asyncio.to_thread(self._events, "company_news", ticker, list(CompanyNews.model_fields), "date", start_date, end_date, limit)
+            news = [CompanyNews(**row) for row in rows]
+        for i in range(0, len(news), limit):
+            yield news[i : i + limit]
+
+    async def aget_company_facts(self, ticker: str, api_key: str = None) -> CompanyFacts:
+        with _read_errors("company facts", ticker):
+            table = await asyncio.to_thread(self._scan, "company_facts", ticker, list(CompanyFacts.model_fields), None)
+            if table is None or table.num_rows == 0:
+                raise DataProviderError(f"No company facts for {ticker}", kind="empty")
+            return CompanyFacts(**_rows(table, ticker, list(CompanyFacts.model_fields))[-1])
+
+    def _dataset(self, dataset: str, ticker: str):
+        path = self.root / dataset / f"ticker={ticker}"
+        if not path.is_dir():
+            return None
+        return ds.dataset(str(path), filesystem=self._filesystem, format="parquet")
+
+    def _scan(self, dataset: str, ticker: str, columns: list[str], build_filter):
+        """Read the ticker's partition, projected to the wanted columns that exist. build_filter(schema) returns the row filter."""
+        data = self._dataset(dataset, ticker)
+        if data is None:
+            return None
+        schema = data.schema
+        return data.to_table(
+            columns=[name for name in columns if name in schema.names],
+            filter=build_filter(schema) if build_filter else None,
+        )
+
+    def _prices(self, ticker: str, start_date: str, end_date: str) -> PriceFrame:
+        end_exclusive = (datetime.date.fromisoformat(end_date) + datetime.timedelta(days=1)).isoformat()
+        table = self._scan(
+            "prices",
+            ticker,
+            ["time", *PRICE_COLUMNS],
+            lambda schema: (pc.field("time") >= _bound(schema, "time", start_date)) & (pc.field("time") < _bound(schema, "time", end_exclusive)),
+        )
+        if table is None or table.num_rows == 0:
+            return PriceFrame.empty()
+        time = table.column("time")
+        if pa.types.is_timestamp(time.type) or pa.types.is_date(time.type):
+            time = time.cast(pa.timestamp("ns", tz="UTC"))
+        return PriceFrame.from_columns(time.to_numpy(zero_copy_only=False), {column: table.column(column).to_numpy(zero_copy_only=False) for column in PRICE_COLUMNS})
+
+    def _reports(self, dataset: str, ticker: str, columns: list[str], end_date: str, period: str, limit: int) -> list[dict]:
+        """The latest `limit` reports of the period with report_period <= end_date, newest first."""
+        table = self._scan(
+            dataset,
+            ticker,
+            columns,
+            lambda schema: (pc.field("period") == period) & (pc.field("report_period") <= _bound(schema, "report_period", end_date)),
+        )
+        if table is None:
+            return []
+        table = table.sort_by([("report_period", "descending")]).slice(0, limit)
+        return _rows(table, ticker, columns)
+
+    def _events(self, dataset: str, ticker: str, columns: list[str], date_field: str, start_date: str | None, end_date: str, limit: int) -> list[dict]:
+        """Items dated in [start_date, end_date] (or, without a start date, the latest `limit` up to end_date), newest first."""
+        end_exclusive = (datetime.date.fromisoformat(end_date) + datetime.timedelta(days=1)).isoformat()
+
+        def build_filter(schema):
+            row_filter = pc.field(date_field) < _bound(schema, date_field, end_exclusive)
+            if start_date:
+                row_filter &= pc.field(date_field) >= _bound(schema, date_field, start_date)
+            return row_filter
+
+        table = self._scan(dataset, ticker, columns, build_filter)
+        if table is None:
+            return []
+        table = table.sort_by([(date_field, "descending")])
+        if not start_date:
+            table = table.slice(0, limit)
+        return _rows(table, ticker, columns)
+
+
+@contextmanager
+def _read_errors(what: str, ticker: str):
+    """Raise I/O errors (OSError), schema mismatches (Arrow errors, missing columns) and invalid rows (ValueError) as DataProviderError."""
+    try:
+        yield
+    except (pa.ArrowException, OSError, KeyError, ValueError) as e:
+        raise DataProviderError(f"Error reading {what}: {ticker} - {e}") from e
+
+
+def _bound(schema, name: str, day: str):
+    """A YYYY-MM-DD bound as a scalar comparable with the column's type."""
+    column_type = schema.field(name).type
+    if pa.types.is_timestamp(column_type):
+        return pa.scalar(datetime.datetime.fromisoformat(day).replace(tzinfo=datetime.timezone.utc if column_type.tz else None), type=column_type)
+    if pa.types.is_date(column_type):
+        return pa.scalar(datetime.date.fromisoformat(day), type=column_type)
+    return day
+
+
+def _rows(table, ticker: str, columns: list[str]) -> list[dict]:
+    """Table rows as model-ready dicts: dates as ISO strings, absent columns as None, the partition's ticker filled in."""
+    rows = table.to_pylist()
+    for row in rows:
+        for name, value in row.items():
+            if isinstance(value, (datetime.date, datetime.datetime)):
+                row[name] = value.isoformat()
+        for name in columns:
+            row.setdefault(name, None)
+        row["ticker"] = row["ticker"] or ticker
+    return rows
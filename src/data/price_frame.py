@@ -0,0 +1,108 @@
+"""Columnar storage for daily price bars."""
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+from src.data.models import Price
+
+# Column order of PriceFrame.values
+PRICE_COLUMNS = ("open", "close", "high", "low", "volume")
+
+
+@dataclass(frozen=True)
+class PriceFrame:
+    """
+    Price bars as NumPy arrays, sorted by time.
+
+    time holds int64 nanoseconds since the epoch (UTC) and values a float64 (n, 5)
+    matrix in PRICE_COLUMNS order. Keeping OHLCV in one 2-D block lets to_df() and
+    slice() return views instead of copies.
+    """
+
+    time: np.ndarray
+    values: np.ndarray
+
+    @classmethod
+    def empty(cls) -> "PriceFrame":
+        return cls(time=np.empty(0, dtype=np.int64), values=np.empty((0, len(PRICE_COLUMNS)), dtype=np.float64))
+
+    @classmethod
+    def from_records(cls, records: list[dict]) -> "PriceFrame":
+        """Build a frame from API-style price dicts (open, close, high, low, volume, time)."""
+        if not records:
+            return cls.empty()
+        time = pd.to_datetime([record["time"] for record in records], utc=True).as_unit("ns").asi8
+        values = np.array([[record[column] for column in PRICE_COLUMNS] for record in records], dtype=np.float64)
+        return cls._sorted(time, values)
+
+    @classmethod
+    def from_columns(cls, time, columns: dict[str, np.ndarray]) -> "PriceFrame":
+        """Build a frame from a time column (anything pd.to_datetime accepts) and one array per PRICE_COLUMNS entry."""
+        if len(time) == 0:
+            return cls.empty()
+        time = pd.to_datetime(time, utc=True).as_unit("ns").asi8
+        values = np.column_stack([np.asarray(columns[column], dtype=np.float64) for column in PRICE_COLUMNS])
+        return cls._sorted(time, values)
+
+    @classmethod
+    def from_prices(cls, prices: list[Price]) -> "PriceFrame":
+        return cls.from_records([price.model_dump() for price in prices])
+
+    @classmethod
+    def _sorted(cls, time: np.ndarray, values: np.ndarray) -> "PriceFrame":
+        order = np.argsort(time, kind="stable")
+        time, values = np.ascontiguousarray(time[order]), np.ascontiguousarray(values[order])
+        # Frames are shared through the cache and handed out as views - never let callers write to them
+        time.flags.writeable = False
+        values.flags.writeable = False
+        return cls(time=time, values=values)
+
+    def __len__(self) -> int:
+        return len(self.time)
+
+    def __bool__(self) -> bool:
+        return len(self.time) > 0
+
+    @property
+    def nbytes(self) -> int:
+        return self.time.nbytes + self.values.nbytes
+
+    def column(self, name: str) -> np.ndarray:
+        """A view of one OHLCV column."""
+        return self.values[:, PRICE_COLUMNS.index(name)]
+
+    @property
+    def close(self) -> np.ndarray:
+        return self.column("close")
+
+    def slice(self, start_date: str, end_date: str) -> "PriceFrame":
+        """Bars whose UTC date falls in the inclusive YYYY-MM-DD range, as views into this frame."""
+        start = pd.Timestamp(start_date, tz="UTC").value
+        end = pd.Timestamp(date.fromisoformat(end_date) + timedelta(days=1), tz="UTC").value
+        lo, hi = np.searchsorted(self.time, [start, end], side="left")
+        return PriceFrame(time=self.time[lo:hi], values=self.values[lo:hi])
+
+    def merge(self, other: "PriceFrame") -> "PriceFrame":
+        """Combine two frames. Where both have a bar for the same time, other's bar wins."""
+        if not self:
+            return other
+        if not other:
+            return self
+        keep = ~np.isin(self.time, other.time)
+        return PriceFrame._sorted(np.concatenate([self.time[keep], other.time]), np.concatenate([self.values[keep], other.values]))
+
+    def to_df(self) -> pd.DataFrame:
+        """Wrap the arrays in a DataFrame indexed by Date, without copying the OHLCV data."""
+        index = pd.DatetimeIndex(self.time.view("datetime64[ns]"), name="Date").tz_localize("UTC")
+        return pd.DataFrame(self.values, index=index, columns=list(PRICE_COLUMNS), copy=False)
+
+    def to_prices(self) -> list[Price]:
+        """Materialize Price models (time as ISO-8601 UTC strings)."""
+        times = np.datetime_as_string(self.time.view("datetime64[ns]"), unit="s")
+        return [
+            Price.model_construct(open=row[0], close=row[1], high=row[2], low=row[3], volume=int(row[4]), time=f"{time}Z")
+            for time, row in zip(times.tolist(), self.values.tolist())
+        ]
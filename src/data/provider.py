@@ -0,0 +1,68 @@
+"""The interface every source of financial data implements."""
+
+from abc import ABC, abstractmethod
+from typing import AsyncIterator
+
+from src.data.models import CompanyFacts, CompanyNews, FinancialMetrics, InsiderTrade, LineItem
+from src.data.price_frame import PriceFrame
+
+
+class DataProviderError(Exception):
+    """
+    A provider could not answer a query.
+
+    kind is "empty" when the source has no such data (e.g. an unknown ticker) and
+    "error" when the failure may be transient; the cache remembers them for different
+    lengths of time (see Cache.record_negative).
+    """
+
+    def __init__(self, message: str, kind: str = "error"):
+        super().__init__(message)
+        self.kind = kind
+
+
+class DataProvider(ABC):
+    """
+    A source of financial data (the Financial Datasets API, a local Parquet lake, ...).
+
+    Providers only fetch: src/tools/api.py puts the cache in front of whichever provider
+    is active and answers every query it can from there. Queries mirror the Financial
+    Datasets API, so a provider returns what the API would return for the same arguments.
+    """
+
+    # Tickers sent to one asearch_line_items call
+    line_items_batch_size: int = 10
+
+    @abstractmethod
+    async def aget_prices(self, ticker: str, start_date: str, end_date: str, api_key: str = None) -> PriceFrame:
+        """Daily bars with a date in [start_date, end_date]."""
+
+    @abstractmethod
+    async def aget_financial_metrics(self, ticker: str, end_date: str, period: str, limit: int, api_key: str = None) -> list[FinancialMetrics]:
+        """The latest `limit` reports of the period with report_period <= end_date, newest first."""
+
+    @abstractmethod
+    async def asearch_line_items(self, tickers: list[str], line_items: list[str], end_date: str, period: str, limit: int, api_key: str = None) -> dict[str, list[LineItem] | None]:
+        """
+        Like aget_financial_metrics for the given line items and several tickers (None
+        where a ticker's query failed). Raises DataProviderError when the whole query fails.
+        """
+
+    @abstractmethod
+    def aiter_insider_trades(self, ticker: str, start_date: str | None, end_date: str, limit: int, api_key: str = None) -> AsyncIterator[list[InsiderTrade]]:
+        """
+        Trades filed up to end_date, page by page, newest first (an async generator).
+
+        With a start date, pages of at most `limit` trades run back to start_date, each
+        holding the latest trades filed up to the oldest filing day of the previous
+        page. Without one, a single page of the latest `limit` trades. Raises
+        DataProviderError when a page can't be fetched.
+        """
+
+    @abstractmethod
+    def aiter_company_news(self, ticker: str, start_date: str | None, end_date: str, limit: int, api_key: str = None) -> AsyncIterator[list[CompanyNews]]:
+        """Articles published up to end_date, page by page, like aiter_insider_trades."""
+
+    @abstractmethod
+    async def aget_company_facts(self, ticker: str, api_key: str = None) -> CompanyFacts:
+        """Current company facts."""
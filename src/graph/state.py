@@ -2,6 +2,7 @@ from typing_extensions import Annotated, Sequence, TypedDict
 
 import operator
 from langchain_core.messages import BaseMessage
+from langchain_core.runnables import RunnableLambda
 
 
 import json
@@ -11,10 +12,33 @@ def merge_dicts(a: dict[str, any], b: dict[str, any]) -> dict[str, any]:
     return {**a, **b}
 
 
+def agent_node(name: str, agent_func, async_agent_func) -> RunnableLambda:
+    """
+    A graph node for an agent: the graph runs async_agent_func when it is awaited with
+    ainvoke and agent_func, the agent's synchronous version, when it is run with invoke.
+    """
+    return RunnableLambda(agent_func, afunc=async_agent_func, name=name)
+
+
+def merge_data(a: dict[str, any], b: dict[str, any]) -> dict[str, any]:
+    """
+    Reducer for the data channel: keys in b replace those in a, except analyst_signals,
+    which are merged per agent.
+
+    Nodes return only what they add (e.g. {"analyst_signals": {agent_id: signals}})
+    instead of mutating the shared state, so analysts running in parallel never
+    overwrite or race on each other's signals.
+    """
+    merged = {**a, **b}
+    if "analyst_signals" in a and "analyst_signals" in b:
+        merged["analyst_signals"] = merge_dicts(a["analyst_signals"], b["analyst_signals"])
+    return merged
+
+
 # Define agent state
 class AgentState(TypedDict):
     messages: Annotated[Sequence[BaseMessage], operator.add]
-    data: Annotated[dict[str, any], merge_dicts]
+    data: Annotated[dict[str, any], merge_data]
     metadata: Annotated[dict[str, any], merge_dicts]
 
 
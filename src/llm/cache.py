@@ -0,0 +1,151 @@
+"""Persistent cache of structured LLM answers, keyed by the content of the request."""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+from langchain_core.messages import HumanMessage, convert_to_messages
+from langchain_core.prompt_values import PromptValue
+from pydantic import BaseModel, ValidationError
+
+from src.data.cache_backends import SQLiteCacheBackend
+
+# Default time-to-live (seconds) of a cached answer
+DEFAULT_TTL = 30 * 24 * 60 * 60
+
+# Default ceiling for the cache file's payload
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+
+# Backend dataset the answers are stored under
+_DATASET = "llm_responses"
+
+
+def cache_key(model_name: str, model_provider: str, prompt, pydantic_model: type[BaseModel]) -> str:
+    """
+    SHA-256 of everything that determines the answer: the model, its provider, the
+    prompt messages and the JSON schema of the requested output.
+    """
+    payload = {
+        "model": model_name,
+        "provider": str(getattr(model_provider, "value", model_provider)),
+        "messages": [{"type": message.type, "content": message.content} for message in _prompt_messages(prompt)],
+        "schema": pydantic_model.model_json_schema(),
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _prompt_messages(prompt) -> list:
+    """The messages a chat model receives for the prompt (a string, a prompt value or a list of messages)."""
+    if isinstance(prompt, PromptValue):
+        return prompt.to_messages()
+    if isinstance(prompt, str):
+        return [HumanMessage(content=prompt)]
+    return convert_to_messages(prompt)
+
+
+class LLMCache:
+    """
+    Answers of call_llm stored on disk, so a prompt that repeats unchanged (the same
+    facts bundle on another backtest day, or a re-run) is answered without calling
+    the model.
+
+    Answers are stored as their model_dump() under cache_key(...) in a SQLite file and
+    validated against the requested model on the way out. Only answers the model
+    actually gave are stored, never the fallbacks used after failed attempts. Entries
+    expire after ttl seconds (None = never), and once the file's payload passes
+    max_bytes the least recently read ones are evicted. With bypass set the cache is
+    not read, but fresh answers still replace the stored ones.
+
+    Without an explicit backend, the cache is configured from the environment on first
+    use (see _backend_from_env); it stays off when no directory is configured.
+    """
+
+    def __init__(self, backend: SQLiteCacheBackend | None = None, ttl: float | None = DEFAULT_TTL, bypass: bool | None = None):
+        self._backend = backend
+        self._configured = backend is not None
+        self._ttl = ttl
+        self._bypass = bypass
+        self._lock = threading.Lock()
+
+    @property
+    def backend(self) -> SQLiteCacheBackend | None:
+        if not self._configured:
+            with self._lock:
+                if not self._configured:
+                    self._backend = _backend_from_env()
+                    ttl = os.environ.get("HEDGE_FUND_LLM_CACHE_TTL")
+                    if ttl is not None:
+                        self._ttl = float(ttl) or None
+                    self._configured = True
+        return self._backend
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None
+
+    @property
+    def bypass(self) -> bool:
+        if self._bypass is not None:
+            return self._bypass
+        return os.environ.get("HEDGE_FUND_LLM_CACHE_BYPASS", "").strip().lower() in ("1", "true", "yes")
+
+    def key(self, model_name: str, model_provider: str, prompt, pydantic_model: type[BaseModel]) -> str | None:
+        """The request's cache key, or None when the cache is off."""
+        if not self.enabled:
+            return None
+        return cache_key(model_name, model_provider, prompt, pydantic_model)
+
+    def get(self, key: str | None, pydantic_model: type[BaseModel]) -> BaseModel | None:
+        """The stored answer for key as a pydantic_model instance, or None."""
+        if key is None or self.bypass:
+            return None
+        data = self.backend.get(_DATASET, key, ttl=self._ttl)
+        if data is None:
+            return None
+        try:
+            return pydantic_model.model_validate(data)
+        except ValidationError:
+            # Stored for an older version of the output model - ask again
+            self.backend.delete(_DATASET, key)
+            return None
+
+    def set(self, key: str | None, result: BaseModel) -> None:
+        if key is not None and isinstance(result, BaseModel):
+            self.backend.set(_DATASET, key, result.model_dump(mode="json"))
+
+    def clear(self) -> None:
+        if self.enabled:
+            self.backend.clear()
+
+    def stats(self) -> dict[str, float]:
+        """Hits, misses, evictions, entries and stored bytes (hits and misses seen by this process), and the hit rate."""
+        stats = dict.fromkeys(("hits", "misses", "evictions", "entries", "bytes"), 0)
+        if self.enabled:
+            stats.update(self.backend.stats().get(_DATASET, {}))
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+
+def _backend_from_env() -> SQLiteCacheBackend | None:
+    """
+    HEDGE_FUND_LLM_CACHE_DIR enables the cache in that directory. It is opt-in on its
+    own: persisting the data cache (HEDGE_FUND_CACHE_DIR) doesn't also replay model
+    answers. HEDGE_FUND_LLM_CACHE_MAX_BYTES caps its size (default DEFAULT_MAX_BYTES).
+    """
+    cache_dir = os.environ.get("HEDGE_FUND_LLM_CACHE_DIR")
+    if not cache_dir:
+        return None
+    max_bytes = os.environ.get("HEDGE_FUND_LLM_CACHE_MAX_BYTES")
+    return SQLiteCacheBackend(Path(cache_dir).expanduser() / "llm_responses.sqlite", max_bytes=int(max_bytes) if max_bytes else DEFAULT_MAX_BYTES)
+
+
+# Global LLM cache instance
+_llm_cache = LLMCache()
+
+
+def get_llm_cache() -> LLMCache:
+    """Get the global LLM cache instance."""
+    return _llm_cache
@@ -1,5 +1,8 @@
+import asyncio
 import os
 import json
+import threading
+import weakref
 from langchain_anthropic import ChatAnthropic
 from langchain_deepseek import ChatDeepSeek
 from langchain_google_genai import ChatGoogleGenerativeAI
@@ -11,7 +14,7 @@ from langchain_gigachat import GigaChat
 from langchain_ollama import ChatOllama
 from enum import Enum
 from pydantic import BaseModel
-from typing import Tuple, List
+from typing import Any, Callable, Tuple, List
 from pathlib import Path
 
 
@@ -135,7 +138,56 @@ def get_models_list():
     ]
 
 
+# Chat clients keep their HTTP sessions open, so each configuration is constructed once and
+# reused by every call and thread. The async sessions are bound to the event loop that first
+# uses them, so clients used inside an event loop are kept per loop.
+_models: dict[tuple, Any] = {}
+_loop_models: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[tuple, Any]]" = weakref.WeakKeyDictionary()
+_models_lock = threading.Lock()
+
+
+def _model_key(model_name: str, model_provider: ModelProvider, api_keys: dict | None) -> tuple:
+    return (model_name, str(getattr(model_provider, "value", model_provider)), tuple(sorted((api_keys or {}).items())))
+
+
+def _pooled(key: tuple, create: Callable[[], Any]) -> Any:
+    """The pooled object for key (in the running event loop's pool, if any), created on first use."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    with _models_lock:
+        pool = _models if loop is None else _loop_models.setdefault(loop, {})
+        model = pool.get(key)
+    if model is None:
+        # Built outside the lock; if two threads race, both get the first one stored
+        model = create()
+        with _models_lock:
+            model = pool.setdefault(key, model)
+    return model
+
+
+def clear_model_pool() -> None:
+    """Drop every pooled client, e.g. after changing API keys or base URLs in the environment."""
+    with _models_lock:
+        _models.clear()
+        _loop_models.clear()
+
+
 def get_model(model_name: str, model_provider: ModelProvider, api_keys: dict = None) -> ChatOpenAI | ChatGroq | ChatOllama | GigaChat | None:
+    """The chat model for the configuration, constructed on first use and reused afterwards (see _pooled)."""
+    return _pooled(_model_key(model_name, model_provider, api_keys), lambda: _create_model(model_name, model_provider, api_keys))
+
+
+def get_structured_model(model_name: str, model_provider: ModelProvider, pydantic_model: type[BaseModel], api_keys: dict = None, method: str = "json_mode"):
+    """get_model(...).with_structured_output(pydantic_model, method=method), pooled per output model like the client itself."""
+    return _pooled(
+        (*_model_key(model_name, model_provider, api_keys), pydantic_model, method),
+        lambda: get_model(model_name, model_provider, api_keys).with_structured_output(pydantic_model, method=method),
+    )
+
+
+def _create_model(model_name: str, model_provider: ModelProvider, api_keys: dict = None) -> ChatOpenAI | ChatGroq | ChatOllama | GigaChat | None:
     if model_provider == ModelProvider.GROQ:
         api_key = (api_keys or {}).get("GROQ_API_KEY") or os.getenv("GROQ_API_KEY")
         if not api_key:
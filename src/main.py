@@ -1,3 +1,4 @@
+import os
 import sys
 
 from dotenv import load_dotenv
@@ -5,13 +6,14 @@ from langchain_core.messages import HumanMessage
 from langgraph.graph import END, StateGraph
 from colorama import Fore, Style, init
 import questionary
-from src.agents.portfolio_manager import portfolio_management_agent
-from src.agents.risk_manager import risk_management_agent
-from src.graph.state import AgentState
+from src.agents.portfolio_manager import aportfolio_management_agent, portfolio_management_agent
+from src.agents.risk_manager import DATA_NEEDS as RISK_DATA_NEEDS, arisk_management_agent, risk_management_agent
+from src.graph.state import AgentState, agent_node
 from src.utils.display import print_trading_output
-from src.utils.analysts import ANALYST_ORDER, get_analyst_nodes
+from src.utils.analysts import ANALYST_ORDER, get_analyst_nodes, get_data_needs
 from src.utils.progress import progress
 from src.utils.visualize import save_graph_as_png
+from src.tools.prefetch import aprefetch, plan_prefetch, prefetch
 from src.cli.input import (
     parse_cli_inputs,
 )
@@ -52,6 +54,7 @@ def run_hedge_fund(
     selected_analysts: list[str] = [],
     model_name: str = "gpt-4.1",
     model_provider: str = "OpenAI",
+    max_concurrency: int | None = None,
 ):
     # Start progress tracking
     progress.start()
@@ -61,37 +64,105 @@ def run_hedge_fund(
         workflow = create_workflow(selected_analysts if selected_analysts else None)
         agent = workflow.compile()
 
+        # Warm the cache with everything the agents will read, all requests in parallel,
+        # so the agents themselves run against cached data
+        prefetch(get_data_needs(selected_analysts if selected_analysts else None) + RISK_DATA_NEEDS, tickers, start_date, end_date)
+
         final_state = agent.invoke(
-            {
-                "messages": [
-                    HumanMessage(
-                        content="Make trading decisions based on the provided data.",
-                    )
-                ],
-                "data": {
-                    "tickers": tickers,
-                    "portfolio": portfolio,
-                    "start_date": start_date,
-                    "end_date": end_date,
-                    "analyst_signals": {},
-                },
-                "metadata": {
-                    "show_reasoning": show_reasoning,
-                    "model_name": model_name,
-                    "model_provider": model_provider,
-                },
-            },
+            _initial_state(tickers, start_date, end_date, portfolio, show_reasoning, model_name, model_provider),
+            # Bound how many analysts run at once (the sync graph runs them on a thread pool)
+            config={"max_concurrency": max_concurrency or get_max_concurrency(selected_analysts)},
         )
 
-        return {
-            "decisions": parse_hedge_fund_response(final_state["messages"][-1].content),
-            "analyst_signals": final_state["data"]["analyst_signals"],
-        }
+        return _hedge_fund_result(final_state)
     finally:
         # Stop progress tracking
         progress.stop()
 
 
+async def arun_hedge_fund(
+    tickers: list[str],
+    start_date: str,
+    end_date: str,
+    portfolio: dict,
+    show_reasoning: bool = False,
+    selected_analysts: list[str] = [],
+    model_name: str = "gpt-4.1",
+    model_provider: str = "OpenAI",
+    max_concurrency: int | None = None,
+):
+    """
+    Async version of run_hedge_fund.
+
+    The graph is awaited with ainvoke, so the agents run as coroutines on the calling
+    event loop: their data requests and LLM calls are awaited rather than each holding
+    a thread, and the requests of every agent and ticker are in flight together.
+    """
+    progress.start()
+
+    try:
+        workflow = create_workflow(selected_analysts if selected_analysts else None)
+        agent = workflow.compile()
+
+        plan = plan_prefetch(get_data_needs(selected_analysts if selected_analysts else None) + RISK_DATA_NEEDS, end_date)
+        if tickers and not plan.is_empty():
+            await aprefetch(plan, tickers, start_date, end_date)
+
+        final_state = await agent.ainvoke(
+            _initial_state(tickers, start_date, end_date, portfolio, show_reasoning, model_name, model_provider),
+            config={"max_concurrency": max_concurrency or get_max_concurrency(selected_analysts)},
+        )
+
+        return _hedge_fund_result(final_state)
+    finally:
+        progress.stop()
+
+
+def _initial_state(tickers: list[str], start_date: str, end_date: str, portfolio: dict, show_reasoning: bool, model_name: str, model_provider: str) -> dict:
+    return {
+        "messages": [
+            HumanMessage(
+                content="Make trading decisions based on the provided data.",
+            )
+        ],
+        "data": {
+            "tickers": tickers,
+            "portfolio": portfolio,
+            "start_date": start_date,
+            "end_date": end_date,
+            "analyst_signals": {},
+        },
+        "metadata": {
+            "show_reasoning": show_reasoning,
+            "model_name": model_name,
+            "model_provider": model_provider,
+        },
+    }
+
+
+def _hedge_fund_result(final_state: dict) -> dict:
+    return {
+        "decisions": parse_hedge_fund_response(final_state["messages"][-1].content),
+        "analyst_signals": final_state["data"]["analyst_signals"],
+    }
+
+
+def get_max_concurrency(selected_analysts: list[str] | None = None) -> int:
+    """
+    How many agent nodes may run at once (HEDGE_FUND_MAX_CONCURRENCY).
+
+    Defaults to one per selected analyst, so the whole fan-out runs simultaneously and
+    a run takes about as long as its slowest analyst.
+    """
+    value = os.environ.get("HEDGE_FUND_MAX_CONCURRENCY")
+    if value:
+        limit = int(value)
+        if limit < 1:
+            raise ValueError("HEDGE_FUND_MAX_CONCURRENCY must be at least 1.")
+        return limit
+    return max(len(selected_analysts or get_analyst_nodes()), 1)
+
+
 def start(state: AgentState):
     """Initialize the workflow with the input message."""
     return state
@@ -115,8 +186,8 @@ def create_workflow(selected_analysts=None):
         workflow.add_edge("start_node", node_name)
 
     # Always add risk and portfolio management
-    workflow.add_node("risk_management_agent", risk_management_agent)
-    workflow.add_node("portfolio_manager", portfolio_management_agent)
+    workflow.add_node("risk_management_agent", agent_node("risk_management_agent", risk_management_agent, arisk_management_agent))
+    workflow.add_node("portfolio_manager", agent_node("portfolio_manager", portfolio_management_agent, aportfolio_management_agent))
 
     # Connect selected analysts to risk management
     for analyst_key in selected_analysts:
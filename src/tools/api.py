@@ -1,136 +1,173 @@
+import asyncio
 import datetime
+import operator
 import os
+import threading
+from typing import AsyncIterator, Iterator
+
 import pandas as pd
-import requests
-import time
 
-from src.data.cache import get_cache
+from src.data.cache import get_cache, missing_date_ranges
+from src.data.history import ALL_FIELDS
+from src.data.price_frame import PriceFrame
+from src.data.provider import DataProvider, DataProviderError
 from src.data.models import (
+    CompanyFacts,
     CompanyNews,
-    CompanyNewsResponse,
     FinancialMetrics,
-    FinancialMetricsResponse,
     Price,
-    PriceResponse,
     LineItem,
-    LineItemResponse,
     InsiderTrade,
-    InsiderTradeResponse,
-    CompanyFactsResponse,
 )
+from src.tools.financial_datasets import FinancialDatasetsProvider
+from src.tools.http_client import iterate_sync, run_sync
 
 # Global cache instance
 _cache = get_cache()
 
+# Source of everything the cache can't answer (see get_provider)
+_provider: DataProvider | None = None
+_provider_lock = threading.Lock()
+
+DATA_PROVIDERS = ("financial_datasets", "parquet")
+
 
-def _make_api_request(url: str, headers: dict, method: str = "GET", json_data: dict = None, max_retries: int = 3) -> requests.Response:
+def get_provider() -> DataProvider:
     """
-    Make an API request with rate limiting handling and moderate backoff.
-    
-    Args:
-        url: The URL to request
-        headers: Headers to include in the request
-        method: HTTP method (GET or POST)
-        json_data: JSON data for POST requests
-        max_retries: Maximum number of retries (default: 3)
-    
-    Returns:
-        requests.Response: The response object
-    
-    Raises:
-        Exception: If the request fails with a non-429 error
+    The active data provider, created on first use from the environment.
+
+    FINANCIAL_DATA_PROVIDER selects it: "financial_datasets" (the default, the HTTP
+    API) or "parquet", which reads a local partitioned Parquet lake from
+    FINANCIAL_DATA_PARQUET_DIR (see src/data/parquet_provider.py).
     """
-    for attempt in range(max_retries + 1):  # +1 for initial attempt
-        if method.upper() == "POST":
-            response = requests.post(url, headers=headers, json=json_data)
-        else:
-            response = requests.get(url, headers=headers)
-        
-        if response.status_code == 429 and attempt < max_retries:
-            # Linear backoff: 60s, 90s, 120s, 150s...
-            delay = 60 + (30 * attempt)
-            print(f"Rate limited (429). Attempt {attempt + 1}/{max_retries + 1}. Waiting {delay}s before retrying...")
-            time.sleep(delay)
-            continue
-        
-        # Return the response (whether success, other errors, or final 429)
-        return response
+    global _provider
+    if _provider is None:
+        with _provider_lock:
+            if _provider is None:
+                _provider = _create_provider_from_env()
+    return _provider
 
 
-def get_prices(ticker: str, start_date: str, end_date: str, api_key: str = None) -> list[Price]:
-    """Fetch price data from cache or API."""
-    # Create a cache key that includes all parameters to ensure exact matches
-    cache_key = f"{ticker}_{start_date}_{end_date}"
-    
-    # Check cache first - simple exact match
-    if cached_data := _cache.get_prices(cache_key):
-        return [Price(**price) for price in cached_data]
-
-    # If not in cache, fetch from API
-    headers = {}
-    financial_api_key = api_key or os.environ.get("FINANCIAL_DATASETS_API_KEY")
-    if financial_api_key:
-        headers["X-API-KEY"] = financial_api_key
-
-    url = f"https://api.financialdatasets.ai/prices/?ticker={ticker}&interval=day&interval_multiplier=1&start_date={start_date}&end_date={end_date}"
-    response = _make_api_request(url, headers)
-    if response.status_code != 200:
-        return []
+def set_provider(provider: DataProvider | None) -> None:
+    """Replace the active data provider (None = pick it from the environment again)."""
+    global _provider
+    with _provider_lock:
+        _provider = provider
 
-    # Parse response with Pydantic model
-    try:
-        price_response = PriceResponse(**response.json())
-        prices = price_response.prices
-    except:
-        return []
 
-    if not prices:
-        return []
+def _create_provider_from_env() -> DataProvider:
+    name = os.environ.get("FINANCIAL_DATA_PROVIDER", "financial_datasets").lower()
+    if name not in DATA_PROVIDERS:
+        raise ValueError(f"Unknown FINANCIAL_DATA_PROVIDER {name!r}, expected one of {DATA_PROVIDERS}")
+    if name == "parquet":
+        from src.data.parquet_provider import ParquetProvider
 
-    # Cache the results using the comprehensive cache key
-    _cache.set_prices(cache_key, [p.model_dump() for p in prices])
-    return prices
+        root = os.environ.get("FINANCIAL_DATA_PARQUET_DIR")
+        if not root:
+            raise ValueError("FINANCIAL_DATA_PARQUET_DIR must be set to use the parquet data provider")
+        return ParquetProvider(root)
+    return FinancialDatasetsProvider()
 
 
-def get_financial_metrics(
+async def aget_price_frame(ticker: str, start_date: str, end_date: str, api_key: str = None) -> PriceFrame:
+    """
+    Fetch price bars from cache or the data provider as a columnar PriceFrame.
+
+    The cache remembers which date ranges it holds in full for each ticker, so any
+    sub-range of earlier requests is served locally and only the uncovered gaps are
+    fetched (as a single request spanning them).
+    """
+    gaps = missing_date_ranges(_cache.get_price_coverage(ticker), start_date, end_date)
+    if gaps and not _cache.get_negative("prices", ticker, gaps[0][0], gaps[-1][1]):
+        fetch_start, fetch_end = gaps[0][0], gaps[-1][1]
+        try:
+            frame = await get_provider().aget_prices(ticker, fetch_start, fetch_end, api_key=api_key)
+        except DataProviderError as e:
+            _cache.record_negative("prices", ticker, e.kind, fetch_start, fetch_end)
+            return PriceFrame.empty()
+
+        # Today's bar is still forming, so only mark completed days as covered
+        last_complete_day = (datetime.date.today() - datetime.timedelta(days=1)).isoformat()
+        covered_end = min(fetch_end, last_complete_day)
+        _cache.set_prices(ticker, frame, covered=(fetch_start, covered_end) if fetch_start <= covered_end else None)
+
+    cached_frame = _cache.get_prices(ticker)
+    if cached_frame is None:
+        return PriceFrame.empty()
+    return cached_frame.slice(start_date, end_date)
+
+
+def get_price_frame(ticker: str, start_date: str, end_date: str, api_key: str = None) -> PriceFrame:
+    """Synchronous version of aget_price_frame."""
+    return run_sync(aget_price_frame(ticker, start_date, end_date, api_key=api_key))
+
+
+async def aget_prices(ticker: str, start_date: str, end_date: str, api_key: str = None) -> list[Price]:
+    """Fetch price data from cache or API. Prefer aget_price_frame for analytics."""
+    frame = await aget_price_frame(ticker, start_date, end_date, api_key=api_key)
+    return frame.to_prices()
+
+
+def get_prices(ticker: str, start_date: str, end_date: str, api_key: str = None) -> list[Price]:
+    """Synchronous version of aget_prices."""
+    return run_sync(aget_prices(ticker, start_date, end_date, api_key=api_key))
+
+
+async def aget_financial_metrics(
     ticker: str,
     end_date: str,
     period: str = "ttm",
     limit: int = 10,
     api_key: str = None,
 ) -> list[FinancialMetrics]:
-    """Fetch financial metrics from cache or API."""
-    # Create a cache key that includes all parameters to ensure exact matches
-    cache_key = f"{ticker}_{period}_{end_date}_{limit}"
-    
-    # Check cache first - simple exact match
-    if cached_data := _cache.get_financial_metrics(cache_key):
-        return [FinancialMetrics(**metric) for metric in cached_data]
-
-    # If not in cache, fetch from API
-    headers = {}
-    financial_api_key = api_key or os.environ.get("FINANCIAL_DATASETS_API_KEY")
-    if financial_api_key:
-        headers["X-API-KEY"] = financial_api_key
-
-    url = f"https://api.financialdatasets.ai/financial-metrics/?ticker={ticker}&report_period_lte={end_date}&limit={limit}&period={period}"
-    response = _make_api_request(url, headers)
-    if response.status_code != 200:
+    """
+    Fetch financial metrics from cache or API.
+
+    The cache keeps the report history per (ticker, period), so a request is answered
+    locally by taking the latest `limit` reports with report_period <= end_date
+    whenever earlier fetches already cover it (e.g. limit=5 after limit=10, or an
+    earlier end_date). Only requests the history can't answer go to the API.
+    """
+    history = _cache.get_financial_metrics(ticker, period)
+    if history and history.covers(ALL_FIELDS, end_date, limit):
+        return history.select_models(end_date, limit, FinancialMetrics.model_validate)
+    if _cache.get_negative("financial_metrics", f"{ticker}_{period}", None, end_date):
         return []
 
-    # Parse response with Pydantic model
+    # If not in cache, fetch from the provider
     try:
-        metrics_response = FinancialMetricsResponse(**response.json())
-        financial_metrics = metrics_response.financial_metrics
-    except:
+        financial_metrics = await get_provider().aget_financial_metrics(ticker, end_date, period, limit, api_key=api_key)
+    except DataProviderError as e:
+        _cache.record_negative("financial_metrics", f"{ticker}_{period}", e.kind, None, end_date)
         return []
 
-    if not financial_metrics:
-        return []
+    # Record even empty results: they prove there is nothing up to end_date
+    _cache.set_financial_metrics(ticker, period, end_date, limit, [m.model_dump() for m in financial_metrics])
+    return financial_metrics[:limit]
 
-    # Cache the results as dicts using the comprehensive cache key
-    _cache.set_financial_metrics(cache_key, [m.model_dump() for m in financial_metrics])
-    return financial_metrics
+
+def get_financial_metrics(
+    ticker: str,
+    end_date: str,
+    period: str = "ttm",
+    limit: int = 10,
+    api_key: str = None,
+) -> list[FinancialMetrics]:
+    """Synchronous version of aget_financial_metrics."""
+    return run_sync(aget_financial_metrics(ticker, end_date, period=period, limit=limit, api_key=api_key))
+
+
+async def asearch_line_items(
+    ticker: str,
+    line_items: list[str],
+    end_date: str,
+    period: str = "ttm",
+    limit: int = 10,
+    api_key: str = None,
+) -> list[LineItem]:
+    """Fetch line items from cache or API."""
+    results = await asearch_line_items_many([ticker], line_items, end_date, period=period, limit=limit, api_key=api_key)
+    return results[ticker]
 
 
 def search_line_items(
@@ -141,37 +178,59 @@ def search_line_items(
     limit: int = 10,
     api_key: str = None,
 ) -> list[LineItem]:
-    """Fetch line items from API."""
-    # If not in cache or insufficient data, fetch from API
-    headers = {}
-    financial_api_key = api_key or os.environ.get("FINANCIAL_DATASETS_API_KEY")
-    if financial_api_key:
-        headers["X-API-KEY"] = financial_api_key
-
-    url = "https://api.financialdatasets.ai/financials/search/line-items"
-
-    body = {
-        "tickers": [ticker],
-        "line_items": line_items,
-        "end_date": end_date,
-        "period": period,
-        "limit": limit,
-    }
-    response = _make_api_request(url, headers, method="POST", json_data=body)
-    if response.status_code != 200:
-        return []
-    
-    try:
-        data = response.json()
-        response_model = LineItemResponse(**data)
-        search_results = response_model.search_results
-    except:
-        return []
-    if not search_results:
-        return []
+    """Synchronous version of asearch_line_items."""
+    return run_sync(asearch_line_items(ticker, line_items, end_date, period=period, limit=limit, api_key=api_key))
 
-    # Cache the results
-    return search_results[:limit]
+
+async def aiter_insider_trades(
+    ticker: str,
+    end_date: str,
+    start_date: str | None = None,
+    limit: int = 1000,
+    api_key: str = None,
+) -> AsyncIterator[list[InsiderTrade]]:
+    """
+    Stream insider trades from cache or the data provider, page by page, newest first.
+
+    Trades are cached per ticker, sorted by filing date, together with the date ranges
+    known to be complete. Any query inside those ranges - in particular every as-of
+    date of a backtest after one wide fetch - is answered by bisecting the cached trades.
+    Otherwise each fetched page is merged into the cache as it arrives, so a caller
+    that stops iterating early skips the remaining requests and keeps what was read.
+    """
+    async for page in _aiter_events(
+        "insider_trades",
+        ticker,
+        start_date,
+        end_date,
+        limit,
+        _cache.get_insider_trades,
+        _cache.record_insider_trades,
+        lambda: get_provider().aiter_insider_trades(ticker, start_date, end_date, limit, api_key=api_key),
+    ):
+        yield page
+
+
+def iter_insider_trades(
+    ticker: str,
+    end_date: str,
+    start_date: str | None = None,
+    limit: int = 1000,
+    api_key: str = None,
+) -> Iterator[list[InsiderTrade]]:
+    """Synchronous version of aiter_insider_trades."""
+    return iterate_sync(aiter_insider_trades(ticker, end_date, start_date=start_date, limit=limit, api_key=api_key))
+
+
+async def aget_insider_trades(
+    ticker: str,
+    end_date: str,
+    start_date: str | None = None,
+    limit: int = 1000,
+    api_key: str = None,
+) -> list[InsiderTrade]:
+    """Fetch insider trades from cache or the data provider (all pages of aiter_insider_trades)."""
+    return [trade async for page in aiter_insider_trades(ticker, end_date, start_date=start_date, limit=limit, api_key=api_key) for trade in page]
 
 
 def get_insider_trades(
@@ -181,62 +240,82 @@ def get_insider_trades(
     limit: int = 1000,
     api_key: str = None,
 ) -> list[InsiderTrade]:
-    """Fetch insider trades from cache or API."""
-    # Create a cache key that includes all parameters to ensure exact matches
-    cache_key = f"{ticker}_{start_date or 'none'}_{end_date}_{limit}"
-    
-    # Check cache first - simple exact match
-    if cached_data := _cache.get_insider_trades(cache_key):
-        return [InsiderTrade(**trade) for trade in cached_data]
-
-    # If not in cache, fetch from API
-    headers = {}
-    financial_api_key = api_key or os.environ.get("FINANCIAL_DATASETS_API_KEY")
-    if financial_api_key:
-        headers["X-API-KEY"] = financial_api_key
-
-    all_trades = []
-    current_end_date = end_date
-
-    while True:
-        url = f"https://api.financialdatasets.ai/insider-trades/?ticker={ticker}&filing_date_lte={current_end_date}"
-        if start_date:
-            url += f"&filing_date_gte={start_date}"
-        url += f"&limit={limit}"
-
-        response = _make_api_request(url, headers)
-        if response.status_code != 200:
-            break
+    """Synchronous version of aget_insider_trades."""
+    return run_sync(aget_insider_trades(ticker, end_date, start_date=start_date, limit=limit, api_key=api_key))
 
-        try:
-            data = response.json()
-            response_model = InsiderTradeResponse(**data)
-            insider_trades = response_model.insider_trades
-        except:
-            break  # Parsing error, exit loop
 
-        if not insider_trades:
-            break
+async def arefresh_insider_trades(ticker: str, end_date: str | None = None, limit: int = 1000, api_key: str = None) -> list[InsiderTrade]:
+    """
+    Incrementally sync a ticker's cached insider trades up to end_date (default: today).
 
-        all_trades.extend(insider_trades)
+    Only trades filed on or after the ticker's high-water mark - the newest filing date
+    already cached - are requested, and they are appended to the cached history; the
+    cache is not consulted first, so repeated refreshes pick up newly filed trades.
+    Without cached trades this fetches the latest `limit` trades. Returns the trades
+    that were new to the cache, newest first.
+    """
+    return await _arefresh_events(
+        "insider_trades",
+        ticker,
+        end_date,
+        limit,
+        _cache.get_insider_trades,
+        _cache.record_insider_trades,
+        lambda start_date, end_date: get_provider().aiter_insider_trades(ticker, start_date, end_date, limit, api_key=api_key),
+    )
 
-        # Only continue pagination if we have a start_date and got a full page
-        if not start_date or len(insider_trades) < limit:
-            break
 
-        # Update end_date to the oldest filing date from current batch for next iteration
-        current_end_date = min(trade.filing_date for trade in insider_trades).split("T")[0]
+def refresh_insider_trades(ticker: str, end_date: str | None = None, limit: int = 1000, api_key: str = None) -> list[InsiderTrade]:
+    """Synchronous version of arefresh_insider_trades."""
+    return run_sync(arefresh_insider_trades(ticker, end_date=end_date, limit=limit, api_key=api_key))
 
-        # If we've reached or passed the start_date, we can stop
-        if current_end_date <= start_date:
-            break
 
-    if not all_trades:
-        return []
+async def aiter_company_news(
+    ticker: str,
+    end_date: str,
+    start_date: str | None = None,
+    limit: int = 1000,
+    api_key: str = None,
+) -> AsyncIterator[list[CompanyNews]]:
+    """
+    Stream company news from cache or the data provider, page by page, newest first.
+
+    Articles are cached per ticker, sorted by date, together with the date ranges known
+    to be complete, and answered from there the same way as insider trades.
+    """
+    async for page in _aiter_events(
+        "company_news",
+        ticker,
+        start_date,
+        end_date,
+        limit,
+        _cache.get_company_news,
+        _cache.record_company_news,
+        lambda: get_provider().aiter_company_news(ticker, start_date, end_date, limit, api_key=api_key),
+    ):
+        yield page
+
+
+def iter_company_news(
+    ticker: str,
+    end_date: str,
+    start_date: str | None = None,
+    limit: int = 1000,
+    api_key: str = None,
+) -> Iterator[list[CompanyNews]]:
+    """Synchronous version of aiter_company_news."""
+    return iterate_sync(aiter_company_news(ticker, end_date, start_date=start_date, limit=limit, api_key=api_key))
+
 
-    # Cache the results using the comprehensive cache key
-    _cache.set_insider_trades(cache_key, [trade.model_dump() for trade in all_trades])
-    return all_trades
+async def aget_company_news(
+    ticker: str,
+    end_date: str,
+    start_date: str | None = None,
+    limit: int = 1000,
+    api_key: str = None,
+) -> list[CompanyNews]:
+    """Fetch company news from cache or the data provider (all pages of aiter_company_news)."""
+    return [news async for page in aiter_company_news(ticker, end_date, start_date=start_date, limit=limit, api_key=api_key) for news in page]
 
 
 def get_company_news(
@@ -246,65 +325,123 @@ def get_company_news(
     limit: int = 1000,
     api_key: str = None,
 ) -> list[CompanyNews]:
-    """Fetch company news from cache or API."""
-    # Create a cache key that includes all parameters to ensure exact matches
-    cache_key = f"{ticker}_{start_date or 'none'}_{end_date}_{limit}"
-    
-    # Check cache first - simple exact match
-    if cached_data := _cache.get_company_news(cache_key):
-        return [CompanyNews(**news) for news in cached_data]
-
-    # If not in cache, fetch from API
-    headers = {}
-    financial_api_key = api_key or os.environ.get("FINANCIAL_DATASETS_API_KEY")
-    if financial_api_key:
-        headers["X-API-KEY"] = financial_api_key
-
-    all_news = []
-    current_end_date = end_date
-
-    while True:
-        url = f"https://api.financialdatasets.ai/news/?ticker={ticker}&end_date={current_end_date}"
-        if start_date:
-            url += f"&start_date={start_date}"
-        url += f"&limit={limit}"
-
-        response = _make_api_request(url, headers)
-        if response.status_code != 200:
-            break
+    """Synchronous version of aget_company_news."""
+    return run_sync(aget_company_news(ticker, end_date, start_date=start_date, limit=limit, api_key=api_key))
+
+
+async def arefresh_company_news(ticker: str, end_date: str | None = None, limit: int = 1000, api_key: str = None) -> list[CompanyNews]:
+    """Incrementally sync a ticker's cached news up to end_date, like arefresh_insider_trades."""
+    return await _arefresh_events(
+        "company_news",
+        ticker,
+        end_date,
+        limit,
+        _cache.get_company_news,
+        _cache.record_company_news,
+        lambda start_date, end_date: get_provider().aiter_company_news(ticker, start_date, end_date, limit, api_key=api_key),
+    )
+
+
+def refresh_company_news(ticker: str, end_date: str | None = None, limit: int = 1000, api_key: str = None) -> list[CompanyNews]:
+    """Synchronous version of arefresh_company_news."""
+    return run_sync(arefresh_company_news(ticker, end_date=end_date, limit=limit, api_key=api_key))
 
-        try:
-            data = response.json()
-            response_model = CompanyNewsResponse(**data)
-            company_news = response_model.news
-        except:
-            break  # Parsing error, exit loop
 
-        if not company_news:
-            break
+# Attribute holding each event's date, per dataset
+_EVENT_DATE_FIELDS = {"insider_trades": "filing_date", "company_news": "date"}
 
-        all_news.extend(company_news)
 
-        # Only continue pagination if we have a start_date and got a full page
-        if not start_date or len(company_news) < limit:
-            break
+async def _aiter_events(dataset: str, ticker: str, start_date: str | None, end_date: str, limit: int, get_history, record, fetch_pages) -> AsyncIterator[list]:
+    history = get_history(ticker)
+    if history and (cached := history.select(start_date, end_date, limit)) is not None:
+        for i in range(0, len(cached), limit):
+            yield cached[i : i + limit]
+        return
+    if _cache.get_negative(dataset, ticker, start_date, end_date):
+        return
 
-        # Update end_date to the oldest date from current batch for next iteration
-        current_end_date = min(news.date for news in company_news).split("T")[0]
+    async for page in _arecord_pages(dataset, ticker, start_date, end_date, limit, record, fetch_pages()):
+        yield page
 
-        # If we've reached or passed the start_date, we can stop
-        if current_end_date <= start_date:
-            break
 
-    if not all_news:
+async def _arecord_pages(dataset: str, ticker: str, start_date: str | None, end_date: str, limit: int, record, pages: AsyncIterator[list]) -> AsyncIterator[list]:
+    """Merge each provider page into the cache as it arrives and pass on the items not seen on earlier pages."""
+    seen = set()
+    page_end = end_date
+    try:
+        async for page in pages:
+            # A full page holds the latest `limit` items up to page_end, so only the days after its
+            # oldest one are known in full; a short page reaches all the way back to start_date
+            record(ticker, page, start_date if len(page) < limit else None, page_end, limit)
+            date_of = operator.attrgetter(_EVENT_DATE_FIELDS[dataset])
+            page_end = min(map(date_of, page))[:10]
+            fresh = sorted((item for item in dict.fromkeys(page) if item not in seen), key=date_of, reverse=True)
+            seen.update(fresh)
+            if fresh:
+                yield fresh
+    except DataProviderError as e:
+        # Pages already read stay cached; without any, remember the failure
+        if not seen:
+            _cache.record_negative(dataset, ticker, e.kind, start_date, end_date)
+        return
+
+    if not seen:
+        _cache.record_negative(dataset, ticker, "empty", start_date, end_date)
+    elif start_date:
+        # Pagination ran down to start_date, so the rest of the window is known too
+        record(ticker, [], start_date, page_end, limit)
+
+
+async def _arefresh_events(dataset: str, ticker: str, end_date: str | None, limit: int, get_history, record, fetch_pages) -> list:
+    end_date = end_date or datetime.date.today().isoformat()
+    history = get_history(ticker)
+    mark = history.high_water_mark() if history else None
+    # The API filters by day, so the mark's day is requested again; known items are deduplicated
+    start_date = mark[:10] if mark else None
+    if start_date and start_date > end_date:
         return []
 
-    # Cache the results using the comprehensive cache key
-    _cache.set_company_news(cache_key, [news.model_dump() for news in all_news])
-    return all_news
+    fetched = False
+    async for _ in _arecord_pages(dataset, ticker, start_date, end_date, limit, record, fetch_pages(start_date, end_date)):
+        fetched = True
+    if not fetched:
+        return []
 
+    known = set(history.items) if history else set()
+    updated = get_history(ticker)
+    return [item for item in reversed(updated.items) if item not in known]
 
-def get_market_cap(
+
+async def aget_company_facts(ticker: str, api_key: str = None) -> CompanyFacts | None:
+    """
+    Fetch company facts from cache or the data provider.
+
+    Facts carry the current market cap, so they are cached for an intraday TTL
+    (HEDGE_FUND_CACHE_TTL_COMPANY_FACTS, 15 minutes by default) even in memory.
+    """
+    cached = _cache.get_company_facts(ticker)
+    if cached is not None:
+        return cached
+    today = datetime.date.today().isoformat()
+    if _cache.get_negative("company_facts", ticker, None, today):
+        return None
+
+    try:
+        company_facts = await get_provider().aget_company_facts(ticker, api_key=api_key)
+    except DataProviderError as e:
+        _cache.record_negative("company_facts", ticker, e.kind, None, today)
+        return None
+
+    _cache.set_company_facts(ticker, company_facts)
+    return company_facts
+
+
+def get_company_facts(ticker: str, api_key: str = None) -> CompanyFacts | None:
+    """Synchronous version of aget_company_facts."""
+    return run_sync(aget_company_facts(ticker, api_key=api_key))
+
+
+async def aget_market_cap(
     ticker: str,
     end_date: str,
     api_key: str = None,
@@ -313,22 +450,10 @@ def get_market_cap(
     # Check if end_date is today
     if end_date == datetime.datetime.now().strftime("%Y-%m-%d"):
         # Get the market cap from company facts API
-        headers = {}
-        financial_api_key = api_key or os.environ.get("FINANCIAL_DATASETS_API_KEY")
-        if financial_api_key:
-            headers["X-API-KEY"] = financial_api_key
-
-        url = f"https://api.financialdatasets.ai/company/facts/?ticker={ticker}"
-        response = _make_api_request(url, headers)
-        if response.status_code != 200:
-            print(f"Error fetching company facts: {ticker} - {response.status_code}")
-            return None
-
-        data = response.json()
-        response_model = CompanyFactsResponse(**data)
-        return response_model.company_facts.market_cap
-
-    financial_metrics = get_financial_metrics(ticker, end_date, api_key=api_key)
+        company_facts = await aget_company_facts(ticker, api_key=api_key)
+        return company_facts.market_cap if company_facts else None
+
+    financial_metrics = await aget_financial_metrics(ticker, end_date, api_key=api_key)
     if not financial_metrics:
         return None
 
@@ -340,8 +465,168 @@ def get_market_cap(
     return market_cap
 
 
-def prices_to_df(prices: list[Price]) -> pd.DataFrame:
-    """Convert prices to a DataFrame."""
+def get_market_cap(
+    ticker: str,
+    end_date: str,
+    api_key: str = None,
+) -> float | None:
+    """Synchronous version of aget_market_cap."""
+    return run_sync(aget_market_cap(ticker, end_date, api_key=api_key))
+
+
+# Fields every line-item row carries regardless of the requested line items
+_LINE_ITEM_BASE_FIELDS = ("ticker", "report_period", "period", "currency")
+
+
+async def asearch_line_items_many(
+    tickers: list[str],
+    line_items: list[str],
+    end_date: str,
+    period: str = "ttm",
+    limit: int = 10,
+    api_key: str = None,
+) -> dict[str, list[LineItem]]:
+    """
+    Fetch the same line items for many tickers.
+
+    Line items are cached per (ticker, period) by report_period and merged column by
+    column, so only fields the cache can't answer for this end_date/limit are fetched.
+    Tickers missing the same fields are sent to the provider in batches of its
+    line_items_batch_size (the API's search endpoint accepts a ticker list), and the
+    batches run concurrently.
+    """
+    unique = list(dict.fromkeys(tickers))
+    line_items = list(dict.fromkeys(line_items))
+
+    # Group tickers by the fields they still need so each group can share requests
+    needed: dict[tuple[str, ...], list[str]] = {}
+    failed: set[str] = set()
+    for ticker in unique:
+        history = _cache.get_line_items(ticker, period)
+        missing = history.missing_fields(line_items, end_date, limit) if history else line_items
+        if missing and _cache.get_negative("line_items", f"{ticker}_{period}", None, end_date):
+            failed.add(ticker)
+        elif missing:
+            needed.setdefault(tuple(missing), []).append(ticker)
+
+    provider = get_provider()
+    batch_size = provider.line_items_batch_size
+    batches = [
+        (list(fields), group[i : i + batch_size])
+        for fields, group in needed.items()
+        for i in range(0, len(group), batch_size)
+    ]
+    batch_results = await asyncio.gather(*(provider.asearch_line_items(batch, fields, end_date, period, limit, api_key=api_key) for fields, batch in batches), return_exceptions=True)
+    for (fields, batch), batch_result in zip(batches, batch_results):
+        if isinstance(batch_result, DataProviderError):
+            for ticker in batch:
+                _cache.record_negative("line_items", f"{ticker}_{period}", batch_result.kind, None, end_date)
+            failed.update(batch)
+            continue
+        if isinstance(batch_result, BaseException):
+            raise batch_result
+        for ticker, items in batch_result.items():
+            if items is None:
+                _cache.record_negative("line_items", f"{ticker}_{period}", "error", None, end_date)
+                failed.add(ticker)
+                continue
+            _cache.set_line_items(ticker, period, fields, end_date, limit, [item.model_dump() for item in items])
+
+    results: dict[str, list[LineItem]] = {}
+    for ticker in unique:
+        history = _cache.get_line_items(ticker, period)
+        if ticker in failed or history is None:
+            results[ticker] = []
+            continue
+        results[ticker] = history.select_models(
+            end_date,
+            limit,
+            lambda row: LineItem(**{key: value for key, value in row.items() if key in _LINE_ITEM_BASE_FIELDS or key in line_items}),
+            variant=tuple(line_items),
+        )
+    return {ticker: results[ticker] for ticker in tickers}
+
+
+def search_line_items_many(
+    tickers: list[str],
+    line_items: list[str],
+    end_date: str,
+    period: str = "ttm",
+    limit: int = 10,
+    api_key: str = None,
+) -> dict[str, list[LineItem]]:
+    """Synchronous version of asearch_line_items_many."""
+    return run_sync(asearch_line_items_many(tickers, line_items, end_date, period=period, limit=limit, api_key=api_key))
+
+
+async def aget_prices_many(tickers: list[str], start_date: str, end_date: str, api_key: str = None) -> dict[str, list[Price]]:
+    """Fetch prices for many tickers concurrently (the prices endpoint takes one ticker per request)."""
+    unique = list(dict.fromkeys(tickers))
+    results = await asyncio.gather(*(aget_prices(ticker, start_date, end_date, api_key=api_key) for ticker in unique))
+    by_ticker = dict(zip(unique, results))
+    return {ticker: by_ticker[ticker] for ticker in tickers}
+
+
+def get_prices_many(tickers: list[str], start_date: str, end_date: str, api_key: str = None) -> dict[str, list[Price]]:
+    """Synchronous version of aget_prices_many."""
+    return run_sync(aget_prices_many(tickers, start_date, end_date, api_key=api_key))
+
+
+async def aget_financial_metrics_many(
+    tickers: list[str],
+    end_date: str,
+    period: str = "ttm",
+    limit: int = 10,
+    api_key: str = None,
+) -> dict[str, list[FinancialMetrics]]:
+    """Fetch financial metrics for many tickers concurrently (the endpoint takes one ticker per request)."""
+    unique = list(dict.fromkeys(tickers))
+    results = await asyncio.gather(*(aget_financial_metrics(ticker, end_date, period=period, limit=limit, api_key=api_key) for ticker in unique))
+    by_ticker = dict(zip(unique, results))
+    return {ticker: by_ticker[ticker] for ticker in tickers}
+
+
+def get_financial_metrics_many(
+    tickers: list[str],
+    end_date: str,
+    period: str = "ttm",
+    limit: int = 10,
+    api_key: str = None,
+) -> dict[str, list[FinancialMetrics]]:
+    """Synchronous version of aget_financial_metrics_many."""
+    return run_sync(aget_financial_metrics_many(tickers, end_date, period=period, limit=limit, api_key=api_key))
+
+
+async def aget_company_facts_many(tickers: list[str], api_key: str = None) -> dict[str, CompanyFacts | None]:
+    """Fetch company facts for many tickers concurrently (the endpoint takes one ticker per request)."""
+    unique = list(dict.fromkeys(tickers))
+    results = await asyncio.gather(*(aget_company_facts(ticker, api_key=api_key) for ticker in unique))
+    by_ticker = dict(zip(unique, results))
+    return {ticker: by_ticker[ticker] for ticker in tickers}
+
+
+def get_company_facts_many(tickers: list[str], api_key: str = None) -> dict[str, CompanyFacts | None]:
+    """Synchronous version of aget_company_facts_many."""
+    return run_sync(aget_company_facts_many(tickers, api_key=api_key))
+
+
+async def aget_market_cap_many(tickers: list[str], end_date: str, api_key: str = None) -> dict[str, float | None]:
+    """Fetch market caps for many tickers concurrently."""
+    unique = list(dict.fromkeys(tickers))
+    results = await asyncio.gather(*(aget_market_cap(ticker, end_date, api_key=api_key) for ticker in unique))
+    by_ticker = dict(zip(unique, results))
+    return {ticker: by_ticker[ticker] for ticker in tickers}
+
+
+def get_market_cap_many(tickers: list[str], end_date: str, api_key: str = None) -> dict[str, float | None]:
+    """Synchronous version of aget_market_cap_many."""
+    return run_sync(aget_market_cap_many(tickers, end_date, api_key=api_key))
+
+
+def prices_to_df(prices: list[Price] | PriceFrame) -> pd.DataFrame:
+    """Convert prices to a DataFrame. A PriceFrame is wrapped without copying."""
+    if isinstance(prices, PriceFrame):
+        return prices.to_df()
     df = pd.DataFrame([p.model_dump() for p in prices])
     df["Date"] = pd.to_datetime(df["time"])
     df.set_index("Date", inplace=True)
@@ -354,5 +639,5 @@ def prices_to_df(prices: list[Price]) -> pd.DataFrame:
 
 # Update the get_price_data function to use the new functions
 def get_price_data(ticker: str, start_date: str, end_date: str, api_key: str = None) -> pd.DataFrame:
-    prices = get_prices(ticker, start_date, end_date, api_key=api_key)
+    prices = get_price_frame(ticker, start_date, end_date, api_key=api_key)
     return prices_to_df(prices)
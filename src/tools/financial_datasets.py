@@ -0,0 +1,285 @@
+"""The Financial Datasets HTTP API as a data provider."""
+
+import asyncio
+import json
+import os
+from typing import AsyncIterator
+
+import httpx
+
+from src.data.models import (
+    CompanyFacts,
+    CompanyFactsResponse,
+    CompanyNews,
+    CompanyNewsResponse,
+    FinancialMetrics,
+    FinancialMetricsResponse,
+    InsiderTrade,
+    InsiderTradeResponse,
+    LineItem,
+    LineItemResponse,
+)
+from src.data.price_frame import PriceFrame
+from src.data.provider import DataProvider, DataProviderError
+from src.tools.http_client import get_async_client, get_request_semaphore, run_sync
+from src.tools.rate_limit import backoff_delay, get_rate_limiter
+from src.tools.singleflight import SingleFlight
+
+DEFAULT_BASE_URL = "https://api.financialdatasets.ai"
+
+# Coalesces identical in-flight requests
+_inflight = SingleFlight()
+
+
+async def _amake_api_request(url: str, headers: dict, method: str = "GET", json_data: dict = None, max_retries: int = 3) -> httpx.Response:
+    """
+    Make an API request with rate limiting and backoff.
+
+    Requests go through the pooled keep-alive client of the running event loop, and at
+    most FINANCIAL_DATASETS_MAX_CONCURRENCY of them are in flight at once. Identical
+    requests issued while one is already in flight (from any thread or event loop)
+    wait for that response instead of going out again.
+
+    Args:
+        url: The URL to request
+        headers: Headers to include in the request
+        method: HTTP method (GET or POST)
+        json_data: JSON data for POST requests
+        max_retries: Maximum number of retries (default: 3)
+
+    Returns:
+        httpx.Response: The response object
+
+    Raises:
+        Exception: If the request fails with a non-429 error
+    """
+    key = (method.upper(), url, json.dumps(json_data, sort_keys=True), headers.get("X-API-KEY"))
+    return await _inflight.do(key, lambda: _asend_api_request(url, headers, method, json_data, max_retries))
+
+
+async def _asend_api_request(url: str, headers: dict, method: str, json_data: dict | None, max_retries: int) -> httpx.Response:
+    """Send a request through the shared rate limiter, retrying on 429."""
+    client = get_async_client()
+    rate_limiter = get_rate_limiter()
+    for attempt in range(max_retries + 1):  # +1 for initial attempt
+        await rate_limiter.acquire()
+        async with get_request_semaphore():
+            if method.upper() == "POST":
+                response = await client.post(url, headers=headers, json=json_data)
+            else:
+                response = await client.get(url, headers=headers)
+
+        if response.status_code == 429 and attempt < max_retries:
+            # Honour Retry-After, else exponential backoff with jitter. The pause applies to
+            # every caller, so other threads stop hammering the API too.
+            delay = backoff_delay(attempt, response.headers.get("Retry-After"))
+            print(f"Rate limited (429). Attempt {attempt + 1}/{max_retries + 1}. Waiting {delay:.1f}s before retrying...")
+            rate_limiter.pause(delay)
+            continue
+
+        # Return the response (whether success, other errors, or final 429)
+        return response
+
+
+def _make_api_request(url: str, headers: dict, method: str = "GET", json_data: dict = None, max_retries: int = 3) -> httpx.Response:
+    """Synchronous version of _amake_api_request."""
+    return run_sync(_amake_api_request(url, headers, method=method, json_data=json_data, max_retries=max_retries))
+
+
+def _api_headers(api_key: str = None) -> dict:
+    headers = {}
+    financial_api_key = api_key or os.environ.get("FINANCIAL_DATASETS_API_KEY")
+    if financial_api_key:
+        headers["X-API-KEY"] = financial_api_key
+    return headers
+
+
+def get_base_url() -> str:
+    """API root: FINANCIAL_DATASETS_BASE_URL (e.g. a local stand-in server for load tests) or the public API."""
+    return os.environ.get("FINANCIAL_DATASETS_BASE_URL", DEFAULT_BASE_URL).rstrip("/")
+
+
+def _response_error(what: str, response: httpx.Response) -> DataProviderError:
+    """Error for a non-200 response: 404 means the API has no such data, anything else may be transient."""
+    return DataProviderError(f"Error fetching {what}: {response.status_code}", kind="empty" if response.status_code == 404 else "error")
+
+
+class FinancialDatasetsProvider(DataProvider):
+    """
+    Data from https://api.financialdatasets.ai.
+
+    Requests share the pooled client, rate limiter and in-flight coalescing of
+    _amake_api_request. The API key comes from the api_key argument or the
+    FINANCIAL_DATASETS_API_KEY environment variable. base_url points the provider at
+    another server speaking the same API (default: get_base_url()).
+    """
+
+    # Tickers per line-item search request
+    line_items_batch_size = 10
+
+    def __init__(self, base_url: str | None = None):
+        self._base_url = base_url.rstrip("/") if base_url else None
+
+    @property
+    def base_url(self) -> str:
+        return self._base_url or get_base_url()
+
+    async def aget_prices(self, ticker: str, start_date: str, end_date: str, api_key: str = None) -> PriceFrame:
+        url = f"{self.base_url}/prices/?ticker={ticker}&interval=day&interval_multiplier=1&start_date={start_date}&end_date={end_date}"
+        response = await _amake_api_request(url, _api_headers(api_key))
+        if response.status_code != 200:
+            raise _response_error(f"prices: {ticker}", response)
+
+        # Parse straight into columns - no per-bar model objects
+        try:
+            return PriceFrame.from_records(response.json()["prices"])
+        except Exception as e:
+            raise DataProviderError(f"Error parsing prices: {ticker} - {e}") from e
+
+    async def aget_financial_metrics(self, ticker: str, end_date: str, period: str, limit: int, api_key: str = None) -> list[FinancialMetrics]:
+        url = f"{self.base_url}/financial-metrics/?ticker={ticker}&report_period_lte={end_date}&limit={limit}&period={period}"
+        response = await _amake_api_request(url, _api_headers(api_key))
+        if response.status_code != 200:
+            raise _response_error(f"financial metrics: {ticker}", response)
+
+        # Parse response with Pydantic model
+        try:
+            return FinancialMetricsResponse(**response.json()).financial_metrics
+        except Exception as e:
+            raise DataProviderError(f"Error parsing financial metrics: {ticker} - {e}") from e
+
+    async def asearch_line_items(self, tickers: list[str], line_items: list[str], end_date: str, period: str, limit: int, api_key: str = None) -> dict[str, list[LineItem] | None]:
+        """
+        Run one line-item search for several tickers and split the results per ticker.
+
+        Raises DataProviderError when the search fails; a ticker whose refetch (see
+        below) fails is None.
+        """
+        url = f"{self.base_url}/financials/search/line-items"
+
+        # Ask for limit periods per ticker, whether the API applies the limit per ticker or overall
+        body = {
+            "tickers": tickers,
+            "line_items": line_items,
+            "end_date": end_date,
+            "period": period,
+            "limit": limit * len(tickers),
+        }
+        response = await _amake_api_request(url, _api_headers(api_key), method="POST", json_data=body)
+        if response.status_code != 200:
+            raise _response_error(f"line items: {', '.join(tickers)}", response)
+
+        try:
+            data = response.json()
+            response_model = LineItemResponse(**data)
+            search_results = response_model.search_results
+        except Exception as e:
+            raise DataProviderError(f"Error parsing line items: {', '.join(tickers)} - {e}") from e
+
+        by_ticker: dict[str, list[LineItem] | None] = {ticker: [] for ticker in tickers}
+        requested = {ticker.upper(): ticker for ticker in tickers}
+        for item in search_results:
+            ticker = tickers[0] if len(tickers) == 1 else requested.get(item.ticker.upper())
+            if ticker:
+                by_ticker[ticker].append(item)
+
+        # A full page may have been cut short for some tickers - refetch those on their own
+        if len(tickers) > 1 and len(search_results) >= body["limit"]:
+            short = [ticker for ticker, items in by_ticker.items() if len(items) < limit]
+            if short:
+                refetched = await asyncio.gather(*(self.asearch_line_items([ticker], line_items, end_date, period, limit, api_key) for ticker in short), return_exceptions=True)
+                for ticker, result in zip(short, refetched):
+                    if isinstance(result, DataProviderError):
+                        by_ticker[ticker] = None
+                    elif isinstance(result, BaseException):
+                        raise result
+                    else:
+                        by_ticker.update(result)
+
+        return {ticker: items[:limit] if items is not None else None for ticker, items in by_ticker.items()}
+
+    async def aiter_insider_trades(self, ticker: str, start_date: str | None, end_date: str, limit: int, api_key: str = None) -> AsyncIterator[list[InsiderTrade]]:
+        headers = _api_headers(api_key)
+        current_end_date = end_date
+
+        while True:
+            url = f"{self.base_url}/insider-trades/?ticker={ticker}&filing_date_lte={current_end_date}"
+            if start_date:
+                url += f"&filing_date_gte={start_date}"
+            url += f"&limit={limit}"
+
+            response = await _amake_api_request(url, headers)
+            if response.status_code != 200:
+                raise _response_error(f"insider trades: {ticker}", response)
+
+            try:
+                data = response.json()
+                response_model = InsiderTradeResponse(**data)
+                insider_trades = response_model.insider_trades
+            except Exception as e:
+                raise DataProviderError(f"Error parsing insider trades: {ticker} - {e}") from e
+
+            if not insider_trades:
+                return
+
+            yield insider_trades
+
+            # Only continue pagination if we have a start_date and got a full page
+            if not start_date or len(insider_trades) < limit:
+                return
+
+            # Update end_date to the oldest filing date from current batch for next iteration
+            current_end_date = min(trade.filing_date for trade in insider_trades).split("T")[0]
+
+            # If we've reached or passed the start_date, we can stop
+            if current_end_date <= start_date:
+                return
+
+    async def aiter_company_news(self, ticker: str, start_date: str | None, end_date: str, limit: int, api_key: str = None) -> AsyncIterator[list[CompanyNews]]:
+        headers = _api_headers(api_key)
+        current_end_date = end_date
+
+        while True:
+            url = f"{self.base_url}/news/?ticker={ticker}&end_date={current_end_date}"
+            if start_date:
+                url += f"&start_date={start_date}"
+            url += f"&limit={limit}"
+
+            response = await _amake_api_request(url, headers)
+            if response.status_code != 200:
+                raise _response_error(f"company news: {ticker}", response)
+
+            try:
+                data = response.json()
+                response_model = CompanyNewsResponse(**data)
+                company_news = response_model.news
+            except Exception as e:
+                raise DataProviderError(f"Error parsing company news: {ticker} - {e}") from e
+
+            if not company_news:
+                return
+
+            yield company_news
+
+            # Only continue pagination if we have a start_date and got a full page
+            if not start_date or len(company_news) < limit:
+                return
+
+            # Update end_date to the oldest date from current batch for next iteration
+            current_end_date = min(news.date for news in company_news).split("T")[0]
+
+            # If we've reached or passed the start_date, we can stop
+            if current_end_date <= start_date:
+                return
+
+    async def aget_company_facts(self, ticker: str, api_key: str = None) -> CompanyFacts:
+        url = f"{self.base_url}/company/facts/?ticker={ticker}"
+        response = await _amake_api_request(url, _api_headers(api_key))
+        if response.status_code != 200:
+            print(f"Error fetching company facts: {ticker} - {response.status_code}")
+            raise _response_error(f"company facts: {ticker}", response)
+
+        try:
+            return CompanyFactsResponse(**response.json()).company_facts
+        except Exception as e:
+            raise DataProviderError(f"Error parsing company facts: {ticker} - {e}") from e
@@ -0,0 +1,203 @@
+"""Pooled HTTP clients shared by the financial data API layer."""
+
+import asyncio
+import os
+import threading
+import weakref
+from typing import Any, AsyncIterator, Coroutine, Iterator, TypeVar
+
+import httpx
+
+from src.tools.replay import CassetteStore, RecordingTransport, ReplayTransport
+
+T = TypeVar("T")
+
+DEFAULT_MAX_CONCURRENCY = 10
+
+# "live" talks to the API, "record" also saves every response, "replay" answers from saved responses only
+HTTP_MODES = ("live", "record", "replay")
+DEFAULT_CASSETTE_DIR = "data/cassettes"
+
+# Generous read timeout - paginated news/insider-trade pages can be large
+_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
+_max_concurrency: int | None = None
+_http_mode: str | None = None
+_cassette_dir: str | None = None
+
+# httpx.AsyncClient and asyncio.Semaphore are bound to the loop that first uses them,
+# so keep one of each per event loop
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+_clients_lock = threading.Lock()
+
+_background_loop: asyncio.AbstractEventLoop | None = None
+_background_lock = threading.Lock()
+
+
+def get_max_concurrency() -> int:
+    """Maximum number of in-flight requests per event loop (FINANCIAL_DATASETS_MAX_CONCURRENCY, default 10)."""
+    if _max_concurrency is not None:
+        return _max_concurrency
+    return int(os.environ.get("FINANCIAL_DATASETS_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY))
+
+
+def set_max_concurrency(limit: int) -> None:
+    """Override the concurrency limit. Pooled clients are closed and replaced on next use."""
+    global _max_concurrency
+    if limit < 1:
+        raise ValueError("Concurrency limit must be at least 1.")
+    _max_concurrency = limit
+    with _clients_lock:
+        clients = list(_clients.items())
+        _clients.clear()
+        _semaphores.clear()
+    _close_clients(clients)
+
+
+def get_http_mode() -> str:
+    """The HTTP mode (FINANCIAL_DATASETS_HTTP_MODE: live, record or replay; default live)."""
+    mode = _http_mode or os.environ.get("FINANCIAL_DATASETS_HTTP_MODE", "live").strip().lower() or "live"
+    if mode not in HTTP_MODES:
+        raise ValueError(f"Unknown HTTP mode {mode!r}; expected one of {', '.join(HTTP_MODES)}.")
+    return mode
+
+
+def get_cassette_dir() -> str:
+    """Where recorded responses live (FINANCIAL_DATASETS_CASSETTE_DIR, default data/cassettes)."""
+    return _cassette_dir or os.environ.get("FINANCIAL_DATASETS_CASSETTE_DIR") or DEFAULT_CASSETTE_DIR
+
+
+def set_http_mode(mode: str, cassette_dir: str | None = None) -> None:
+    """Switch between live, record and replay. Pooled clients are closed and replaced on next use."""
+    global _http_mode, _cassette_dir
+    if mode not in HTTP_MODES:
+        raise ValueError(f"Unknown HTTP mode {mode!r}; expected one of {', '.join(HTTP_MODES)}.")
+    _http_mode = mode
+    _cassette_dir = cassette_dir
+    with _clients_lock:
+        clients = list(_clients.items())
+        _clients.clear()
+    _close_clients(clients)
+
+
+def _close_clients(clients: list[tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]]) -> None:
+    """Close replaced clients, each on the loop its connections belong to."""
+    for loop, client in clients:
+        if client.is_closed or loop.is_closed():
+            continue
+        if loop.is_running():
+            # Scheduled rather than awaited, so this also works from the loop's own thread
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        else:
+            loop.run_until_complete(client.aclose())
+
+
+def _create_transport(limits: httpx.Limits) -> httpx.AsyncBaseTransport | None:
+    mode = get_http_mode()
+    if mode == "live":
+        return None
+    store = CassetteStore(get_cassette_dir())
+    if mode == "record":
+        return RecordingTransport(store, httpx.AsyncHTTPTransport(limits=limits))
+    return ReplayTransport(store)
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Return the keep-alive client for the running event loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        client = _clients.get(loop)
+        if client is None or client.is_closed:
+            limit = get_max_concurrency()
+            limits = httpx.Limits(max_connections=limit, max_keepalive_connections=limit)
+            client = httpx.AsyncClient(timeout=_TIMEOUT, limits=limits, transport=_create_transport(limits))
+            _clients[loop] = client
+        return client
+
+
+def get_request_semaphore() -> asyncio.Semaphore:
+    """Return the semaphore bounding in-flight requests on the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        semaphore = _semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(get_max_concurrency())
+            _semaphores[loop] = semaphore
+        return semaphore
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    global _background_loop
+    with _background_lock:
+        if _background_loop is None or _background_loop.is_closed():
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name="financial-data-io", daemon=True)
+            thread.start()
+            _background_loop = loop
+        return _background_loop
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion from synchronous code.
+
+    All synchronous callers share one background event loop, so they also share its
+    connection pool and concurrency limit, whichever thread they call from.
+    """
+    loop = _get_background_loop()
+    try:
+        running_loop = asyncio.get_running_loop()
+    except RuntimeError:
+        running_loop = None
+    if running_loop is loop:
+        coro.close()
+        raise RuntimeError("run_sync() cannot be called from the financial data I/O loop; await the coroutine instead.")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
+def run_isolated(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion on a new event loop in the calling thread.
+
+    For whole units of work with their own CPU-bound steps and blocking calls (e.g. an
+    agent's analytics and SQLite cache access): unlike run_sync, they don't run on the
+    shared background loop, so they only hold up the calling thread, never the
+    requests of other callers. The loop's pooled client is closed before the loop is.
+    """
+
+    async def run_and_close() -> T:
+        try:
+            return await coro
+        finally:
+            await aclose_async_client()
+
+    return asyncio.run(run_and_close())
+
+
+async def aclose_async_client() -> None:
+    """Close the running event loop's pooled client, if it has one."""
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        client = _clients.pop(loop, None)
+        _semaphores.pop(loop, None)
+    if client is not None:
+        await client.aclose()
+
+
+def iterate_sync(agen: AsyncIterator[T]) -> Iterator[T]:
+    """
+    Iterate an async generator from synchronous code, one item at a time.
+
+    Each step runs on the shared background loop (see run_sync). Leaving the loop
+    early closes the generator there, so it stops without doing further work.
+    """
+    try:
+        while True:
+            try:
+                item = run_sync(agen.__anext__())
+            except StopAsyncIteration:
+                return
+            yield item
+    finally:
+        run_sync(agen.aclose())
@@ -0,0 +1,159 @@
+"""Plan and run the prefetch that warms the cache before the agents start."""
+
+import asyncio
+import datetime
+import math
+from dataclasses import dataclass, field
+
+from src.data.needs import (
+    CompanyNewsNeed,
+    DataNeed,
+    FinancialMetricsNeed,
+    InsiderTradesNeed,
+    LineItemsNeed,
+    MarketCapNeed,
+    PricesNeed,
+    lookback_start_date,
+)
+from src.tools.api import (
+    aget_company_facts,
+    aget_company_news,
+    aget_financial_metrics,
+    aget_insider_trades,
+    aget_price_frame,
+    asearch_line_items_many,
+)
+from src.tools.http_client import run_sync
+
+
+@dataclass
+class EventPlan:
+    """What to fetch of a dated dataset (news or insider trades)."""
+
+    # Largest limit asked for without a start date (0 = none)
+    limit: int = 0
+    # Longest lookback asked for, and the largest limit used with it
+    lookback_days: int | None = None
+    lookback_limit: int = 0
+
+    def add(self, limit: int, lookback_days: int | None) -> None:
+        if lookback_days is None:
+            self.limit = max(self.limit, limit)
+        else:
+            self.lookback_days = max(self.lookback_days or 0, lookback_days)
+            self.lookback_limit = max(self.lookback_limit, limit)
+
+
+@dataclass
+class PrefetchPlan:
+    """The union of several agents' data needs, reduced to the fewest requests that answer all of them."""
+
+    prices: bool = False
+    # Company facts (today's market cap)
+    company_facts: bool = False
+    # period -> largest limit asked for
+    financial_metrics: dict[str, int] = field(default_factory=dict)
+    # period -> (union of line items, largest limit asked for)
+    line_items: dict[str, tuple[list[str], int]] = field(default_factory=dict)
+    # News and insider trades are cached as dated histories: one fetch of the largest
+    # limit and one of the longest lookback answer every smaller query
+    insider_trades: EventPlan | None = None
+    company_news: EventPlan | None = None
+
+    def is_empty(self) -> bool:
+        return not (self.prices or self.company_facts or self.financial_metrics or self.line_items or self.insider_trades or self.company_news)
+
+
+def plan_prefetch(needs: list[DataNeed], end_date: str) -> PrefetchPlan:
+    """
+    Merge data needs into a plan.
+
+    Metrics and line items are cached as per-(ticker, period) histories, so one fetch
+    of the largest limit (and, for line items, the union of fields) answers every
+    smaller query for the same period. News and insider trades are reduced the same
+    way (see EventPlan).
+    """
+    plan = PrefetchPlan()
+    for need in needs:
+        if isinstance(need, PricesNeed):
+            plan.prices = True
+        elif isinstance(need, FinancialMetricsNeed):
+            plan.financial_metrics[need.period] = max(need.limit, plan.financial_metrics.get(need.period, 0))
+        elif isinstance(need, LineItemsNeed):
+            fields, limit = plan.line_items.get(need.period, ([], 0))
+            fields = fields + [name for name in need.line_items if name not in fields]
+            plan.line_items[need.period] = (fields, max(limit, need.limit))
+        elif isinstance(need, InsiderTradesNeed):
+            plan.insider_trades = plan.insider_trades or EventPlan()
+            plan.insider_trades.add(need.limit, need.lookback_days)
+        elif isinstance(need, CompanyNewsNeed):
+            plan.company_news = plan.company_news or EventPlan()
+            plan.company_news.add(need.limit, need.lookback_days)
+        elif isinstance(need, MarketCapNeed):
+            # Today's market cap comes from the company facts endpoint; earlier dates are
+            # read from the default financial metrics query
+            if end_date == datetime.datetime.now().strftime("%Y-%m-%d"):
+                plan.company_facts = True
+            else:
+                plan.financial_metrics["ttm"] = max(10, plan.financial_metrics.get("ttm", 0))
+        else:
+            raise TypeError(f"Unknown data need: {need!r}")
+    return plan
+
+
+def _reports_between(period: str, first_date: str, last_date: str) -> int:
+    """Upper bound on the reports of a period filed between two dates."""
+    days = (datetime.date.fromisoformat(last_date) - datetime.date.fromisoformat(first_date)).days
+    if days <= 0:
+        return 0
+    per_year = 1 if period == "annual" else 4
+    return math.ceil(days * per_year / 365) + 1
+
+
+async def aprefetch(plan: PrefetchPlan, tickers: list[str], start_date: str, end_date: str, api_key: str = None, first_end_date: str | None = None) -> None:
+    """
+    Issue every request in the plan concurrently.
+
+    Runs ask for data as of their end_date. With first_end_date, the prefetch loads
+    enough history for every end date from first_end_date to end_date at once (e.g.
+    all the days of a backtest): report histories are fetched deep enough to still
+    hold `limit` reports as of first_end_date, and news and insider trades cover the
+    whole window, so each day's queries are answered from the cache by bisection.
+    Prices are loaded for start_date..end_date.
+
+    Failures are ignored: the agents fetch whatever is missing from the cache themselves.
+    """
+    tickers = list(dict.fromkeys(tickers))
+    first_end_date = first_end_date or end_date
+    calls = []
+
+    def add_event_calls(fetch, ticker: str, events: EventPlan | None) -> None:
+        if events is None:
+            return
+        if events.limit:
+            calls.append(fetch(ticker, first_end_date, limit=events.limit, api_key=api_key))
+        if events.lookback_days is not None or first_end_date != end_date:
+            window_start = lookback_start_date(first_end_date, events.lookback_days or 0)
+            calls.append(fetch(ticker, end_date, start_date=window_start, limit=max(events.limit, events.lookback_limit), api_key=api_key))
+
+    for ticker in tickers:
+        if plan.prices:
+            calls.append(aget_price_frame(ticker, start_date, end_date, api_key=api_key))
+        if plan.company_facts:
+            calls.append(aget_company_facts(ticker, api_key=api_key))
+        for period, limit in plan.financial_metrics.items():
+            calls.append(aget_financial_metrics(ticker, end_date, period=period, limit=limit + _reports_between(period, first_end_date, end_date), api_key=api_key))
+        add_event_calls(aget_insider_trades, ticker, plan.insider_trades)
+        add_event_calls(aget_company_news, ticker, plan.company_news)
+    for period, (line_items, limit) in plan.line_items.items():
+        calls.append(asearch_line_items_many(tickers, line_items, end_date, period=period, limit=limit + _reports_between(period, first_end_date, end_date), api_key=api_key))
+
+    await asyncio.gather(*calls, return_exceptions=True)
+
+
+def prefetch(needs: list[DataNeed], tickers: list[str], start_date: str, end_date: str, api_key: str = None, first_end_date: str | None = None) -> PrefetchPlan:
+    """Plan and run the prefetch for the given needs (see aprefetch). Returns the plan that was executed."""
+    plan = plan_prefetch(needs, end_date)
+    if tickers and not plan.is_empty():
+        run_sync(aprefetch(plan, tickers, start_date, end_date, api_key=api_key, first_end_date=first_end_date))
+    return plan
@@ -0,0 +1,115 @@
+"""Process-wide rate limiting for the financial data API."""
+
+import asyncio
+import os
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+DEFAULT_BURST = 5
+
+# Exponential backoff (seconds) used when a 429 carries no Retry-After header
+BACKOFF_BASE = 5.0
+BACKOFF_CAP = 120.0
+
+
+class TokenBucket:
+    """
+    Token bucket shared by every thread and event loop in the process.
+
+    Each caller reserves the next free slot under a lock and then sleeps until it, so
+    waiting requests are released in arrival order (first come, first served) no matter
+    which agent issued them. A rate of None disables proactive limiting; pauses
+    requested after a 429 still apply.
+    """
+
+    def __init__(self, requests_per_minute: float | None = None, burst: int = DEFAULT_BURST):
+        self.rate = requests_per_minute / 60.0 if requests_per_minute else None
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return how many seconds the caller must wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            wait = max(0.0, self._paused_until - now)
+            if self.rate is None:
+                return wait
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= 1
+            if self._tokens < 0:
+                wait = max(wait, -self._tokens / self.rate)
+            return wait
+
+    async def acquire(self) -> None:
+        """Wait for a token without blocking the event loop."""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every caller for the given time, e.g. after the server answered 429."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            # Don't let a burst of queued requests hit the server the moment the pause ends
+            self._tokens = min(self._tokens, 0.0)
+            self._updated_at = max(self._updated_at, self._paused_until)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header (delay in seconds or an HTTP date) into seconds from now."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def backoff_delay(attempt: int, retry_after: str | None = None) -> float:
+    """Seconds to wait before retry number attempt + 1: the server's Retry-After, else jittered exponential backoff."""
+    delay = parse_retry_after(retry_after)
+    if delay is not None:
+        return delay
+    return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * (2**attempt))) + BACKOFF_BASE
+
+
+_rate_limiter: TokenBucket | None = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> TokenBucket:
+    """
+    Get the global rate limiter, configured on first use from the environment.
+
+    FINANCIAL_DATASETS_RATE_LIMIT is the plan's quota in requests per minute and
+    FINANCIAL_DATASETS_RATE_BURST how many requests may go out back to back.
+    """
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            rate = os.environ.get("FINANCIAL_DATASETS_RATE_LIMIT")
+            burst = os.environ.get("FINANCIAL_DATASETS_RATE_BURST")
+            _rate_limiter = TokenBucket(float(rate) if rate else None, int(burst) if burst else DEFAULT_BURST)
+        return _rate_limiter
+
+
+def set_rate_limit(requests_per_minute: float | None, burst: int = DEFAULT_BURST) -> TokenBucket:
+    """Replace the global rate limiter."""
+    global _rate_limiter
+    with _rate_limiter_lock:
+        _rate_limiter = TokenBucket(requests_per_minute, burst)
+        return _rate_limiter
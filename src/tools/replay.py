@@ -0,0 +1,102 @@
+"""Record/replay of Financial Datasets HTTP traffic for offline, deterministic runs."""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import httpx
+
+# Response headers worth keeping in a cassette
+_KEPT_HEADERS = ("content-type", "retry-after")
+
+
+class ReplayMissError(Exception):
+    """
+    A request in replay mode has no recording.
+
+    Deliberately not a DataProviderError: a missing cassette says nothing about the
+    data, so it must surface instead of being cached as an empty or failed response.
+    """
+
+
+class CassetteStore:
+    """One JSON file per recorded request, named by a hash of the request."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path).expanduser()
+
+    @staticmethod
+    def request_key(request: httpx.Request) -> str:
+        """Hash of method, URL (query parameters sorted) and body. Headers, and so API keys, are left out."""
+        url = urlsplit(str(request.url))
+        query = urlencode(sorted(parse_qsl(url.query, keep_blank_values=True)))
+        body = request.content or b""
+        if body:
+            try:
+                body = json.dumps(json.loads(body), sort_keys=True).encode()
+            except ValueError:
+                pass
+        digest = hashlib.sha256()
+        digest.update(f"{request.method.upper()} {url.scheme}://{url.netloc}{url.path}?{query}\n".encode())
+        digest.update(body)
+        return digest.hexdigest()
+
+    def read(self, key: str) -> dict | None:
+        try:
+            with open(self.path / f"{key}.json", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def write(self, key: str, entry: dict) -> None:
+        """Write atomically so concurrent recorders never leave a truncated cassette."""
+        self.path.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, self.path / f"{key}.json")
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Passes requests through to the network and stores every final response."""
+
+    def __init__(self, store: CassetteStore, inner: httpx.AsyncBaseTransport | None = None):
+        self.store = store
+        self.inner = inner or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await self.inner.handle_async_request(request)
+        content = await response.aread()
+        await response.aclose()
+        headers = {name: value for name, value in response.headers.items() if name.lower() in _KEPT_HEADERS}
+        # Rate-limit responses are retried by the client, so they are never the answer worth replaying
+        if response.status_code != 429:
+            self.store.write(
+                CassetteStore.request_key(request),
+                {
+                    "request": {"method": request.method, "url": str(request.url)},
+                    "status_code": response.status_code,
+                    "headers": headers,
+                    "body": content.decode("utf-8", errors="replace"),
+                },
+            )
+        return httpx.Response(response.status_code, headers=headers, content=content, request=request)
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """Answers requests from recorded cassettes without touching the network."""
+
+    def __init__(self, store: CassetteStore):
+        self.store = store
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        entry = self.store.read(CassetteStore.request_key(request))
+        if entry is None:
+            raise ReplayMissError(f"No recorded response for {request.method} {request.url} - record it first with FINANCIAL_DATASETS_HTTP_MODE=record")
+        return httpx.Response(entry["status_code"], headers=entry["headers"], content=entry["body"].encode("utf-8"), request=request)
@@ -0,0 +1,75 @@
+"""Coalescing of concurrent identical calls ("single flight")."""
+
+import asyncio
+import concurrent.futures
+import threading
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class _LeaderCancelled(Exception):
+    """Set on the in-flight future when its leader is cancelled, telling followers to retry."""
+
+
+class SingleFlight:
+    """
+    Runs at most one call per key at a time.
+
+    The first caller for a key (the leader) runs the call; callers arriving with the
+    same key while it is in flight wait for the leader's result instead of repeating
+    the work. The in-flight record is a concurrent.futures.Future, so followers can be
+    on other threads or other event loops than the leader.
+
+    Cancellation stays with the caller it was meant for: a follower that is cancelled
+    (or times out) stops waiting without touching the shared call, and when the leader
+    is cancelled its followers don't inherit the cancellation - one of them retries and
+    becomes the new leader.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, concurrent.futures.Future] = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Await fn() for the leader, or the leader's result for everyone else."""
+        while True:
+            with self._lock:
+                future = self._calls.get(key)
+                is_leader = future is None
+                if is_leader:
+                    future = concurrent.futures.Future()
+                    self._calls[key] = future
+                    self.executed += 1
+                else:
+                    self.coalesced += 1
+
+            if is_leader:
+                return await self._lead(key, future, fn)
+            try:
+                # Shielded, so a follower's cancellation doesn't cancel the shared future
+                return await asyncio.shield(asyncio.wrap_future(future))
+            except _LeaderCancelled:
+                continue
+
+    async def _lead(self, key: Hashable, future: concurrent.futures.Future, fn: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            result = await fn()
+        except BaseException as e:
+            # Released before the followers wake, so a retrying follower starts a new call
+            self._release(key)
+            # A cancelled leader keeps its cancellation to itself; the followers try again
+            future.set_exception(_LeaderCancelled() if isinstance(e, asyncio.CancelledError) else e)
+            raise
+        self._release(key)
+        future.set_result(result)
+        return result
+
+    def _release(self, key: Hashable) -> None:
+        with self._lock:
+            self._calls.pop(key, None)
+
+    def stats(self) -> dict[str, int]:
+        """Number of calls executed and of calls that piggybacked on an in-flight one."""
+        with self._lock:
+            return {"executed": self.executed, "coalesced": self.coalesced, "in_flight": len(self._calls)}
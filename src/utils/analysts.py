@@ -1,24 +1,27 @@
 """Constants and utilities related to analysts configuration."""
 
+import sys
+
 from src.agents import portfolio_manager
-from src.agents.aswath_damodaran import aswath_damodaran_agent
-from src.agents.ben_graham import ben_graham_agent
-from src.agents.bill_ackman import bill_ackman_agent
-from src.agents.cathie_wood import cathie_wood_agent
-from src.agents.charlie_munger import charlie_munger_agent
-from src.agents.fundamentals import fundamentals_analyst_agent
-from src.agents.michael_burry import michael_burry_agent
-from src.agents.phil_fisher import phil_fisher_agent
-from src.agents.peter_lynch import peter_lynch_agent
-from src.agents.sentiment import sentiment_analyst_agent
-from src.agents.stanley_druckenmiller import stanley_druckenmiller_agent
-from src.agents.technicals import technical_analyst_agent
-from src.agents.valuation import valuation_analyst_agent
-from src.agents.warren_buffett import warren_buffett_agent
-from src.agents.rakesh_jhunjhunwala import rakesh_jhunjhunwala_agent
-from src.agents.mohnish_pabrai import mohnish_pabrai_agent
-from src.agents.news_sentiment import news_sentiment_agent
-from src.agents.growth_agent import growth_analyst_agent
+from src.agents.aswath_damodaran import aswath_damodaran_agent, aaswath_damodaran_agent
+from src.agents.ben_graham import ben_graham_agent, aben_graham_agent
+from src.agents.bill_ackman import bill_ackman_agent, abill_ackman_agent
+from src.agents.cathie_wood import cathie_wood_agent, acathie_wood_agent
+from src.agents.charlie_munger import charlie_munger_agent, acharlie_munger_agent
+from src.agents.fundamentals import fundamentals_analyst_agent, afundamentals_analyst_agent
+from src.agents.michael_burry import michael_burry_agent, amichael_burry_agent
+from src.agents.phil_fisher import phil_fisher_agent, aphil_fisher_agent
+from src.agents.peter_lynch import peter_lynch_agent, apeter_lynch_agent
+from src.agents.sentiment import sentiment_analyst_agent, asentiment_analyst_agent
+from src.agents.stanley_druckenmiller import stanley_druckenmiller_agent, astanley_druckenmiller_agent
+from src.agents.technicals import technical_analyst_agent, atechnical_analyst_agent
+from src.agents.valuation import valuation_analyst_agent, avaluation_analyst_agent
+from src.agents.warren_buffett import warren_buffett_agent, awarren_buffett_agent
+from src.agents.rakesh_jhunjhunwala import rakesh_jhunjhunwala_agent, arakesh_jhunjhunwala_agent
+from src.agents.mohnish_pabrai import mohnish_pabrai_agent, amohnish_pabrai_agent
+from src.agents.news_sentiment import news_sentiment_agent, anews_sentiment_agent
+from src.agents.growth_agent import growth_analyst_agent, agrowth_analyst_agent
+from src.graph.state import agent_node
 
 # Define analyst configuration - single source of truth
 ANALYST_CONFIG = {
@@ -27,6 +30,7 @@ ANALYST_CONFIG = {
         "description": "The Dean of Valuation",
         "investing_style": "Focuses on intrinsic value and financial metrics to assess investment opportunities through rigorous valuation analysis.",
         "agent_func": aswath_damodaran_agent,
+        "async_agent_func": aaswath_damodaran_agent,
         "type": "analyst",
         "order": 0,
     },
@@ -35,6 +39,7 @@ ANALYST_CONFIG = {
         "description": "The Father of Value Investing",
         "investing_style": "Emphasizes a margin of safety and invests in undervalued companies with strong fundamentals through systematic value analysis.",
         "agent_func": ben_graham_agent,
+        "async_agent_func": aben_graham_agent,
         "type": "analyst",
         "order": 1,
     },
@@ -43,6 +48,7 @@ ANALYST_CONFIG = {
         "description": "The Activist Investor",
         "investing_style": "Seeks to influence management and unlock value through strategic activism and contrarian investment positions.",
         "agent_func": bill_ackman_agent,
+        "async_agent_func": abill_ackman_agent,
         "type": "analyst",
         "order": 2,
     },
@@ -51,6 +57,7 @@ ANALYST_CONFIG = {
         "description": "The Queen of Growth Investing",
         "investing_style": "Focuses on disruptive innovation and growth, investing in companies that are leading technological advancements and market disruption.",
         "agent_func": cathie_wood_agent,
+        "async_agent_func": acathie_wood_agent,
         "type": "analyst",
         "order": 3,
     },
@@ -59,6 +66,7 @@ ANALYST_CONFIG = {
         "description": "The Rational Thinker",
         "investing_style": "Advocates for value investing with a focus on quality businesses and long-term growth through rational decision-making.",
         "agent_func": charlie_munger_agent,
+        "async_agent_func": acharlie_munger_agent,
         "type": "analyst",
         "order": 4,
     },
@@ -67,6 +75,7 @@ ANALYST_CONFIG = {
         "description": "The Big Short Contrarian",
         "investing_style": "Makes contrarian bets, often shorting overvalued markets and investing in undervalued assets through deep fundamental analysis.",
         "agent_func": michael_burry_agent,
+        "async_agent_func": amichael_burry_agent,
         "type": "analyst",
         "order": 5,
     },
@@ -75,6 +84,7 @@ ANALYST_CONFIG = {
         "description": "The Dhandho Investor",
         "investing_style": "Focuses on value investing and long-term growth through fundamental analysis and a margin of safety.",
         "agent_func": mohnish_pabrai_agent,
+        "async_agent_func": amohnish_pabrai_agent,
         "type": "analyst",
         "order": 6,
     },
@@ -83,6 +93,7 @@ ANALYST_CONFIG = {
         "description": "The 10-Bagger Investor",
         "investing_style": "Invests in companies with understandable business models and strong growth potential using the 'buy what you know' strategy.",
         "agent_func": peter_lynch_agent,
+        "async_agent_func": apeter_lynch_agent,
         "type": "analyst",
         "order": 6,
     },
@@ -91,6 +102,7 @@ ANALYST_CONFIG = {
         "description": "The Scuttlebutt Investor",
         "investing_style": "Emphasizes investing in companies with strong management and innovative products, focusing on long-term growth through scuttlebutt research.",
         "agent_func": phil_fisher_agent,
+        "async_agent_func": aphil_fisher_agent,
         "type": "analyst",
         "order": 7,
     },
@@ -99,6 +111,7 @@ ANALYST_CONFIG = {
         "description": "The Big Bull Of India",
         "investing_style": "Leverages macroeconomic insights to invest in high-growth sectors, particularly within emerging markets and domestic opportunities.",
         "agent_func": rakesh_jhunjhunwala_agent,
+        "async_agent_func": arakesh_jhunjhunwala_agent,
         "type": "analyst",
         "order": 8,
     },
@@ -107,6 +120,7 @@ ANALYST_CONFIG = {
         "description": "The Macro Investor",
         "investing_style": "Focuses on macroeconomic trends, making large bets on currencies, commodities, and interest rates through top-down analysis.",
         "agent_func": stanley_druckenmiller_agent,
+        "async_agent_func": astanley_druckenmiller_agent,
         "type": "analyst",
         "order": 9,
     },
@@ -115,6 +129,7 @@ ANALYST_CONFIG = {
         "description": "The Oracle of Omaha",
         "investing_style": "Seeks companies with strong fundamentals and competitive advantages through value investing and long-term ownership.",
         "agent_func": warren_buffett_agent,
+        "async_agent_func": awarren_buffett_agent,
         "type": "analyst",
         "order": 10,
     },
@@ -123,6 +138,7 @@ ANALYST_CONFIG = {
         "description": "Chart Pattern Specialist",
         "investing_style": "Focuses on chart patterns and market trends to make investment decisions, often using technical indicators and price action analysis.",
         "agent_func": technical_analyst_agent,
+        "async_agent_func": atechnical_analyst_agent,
         "type": "analyst",
         "order": 11,
     },
@@ -131,6 +147,7 @@ ANALYST_CONFIG = {
         "description": "Financial Statement Specialist",
         "investing_style": "Delves into financial statements and economic indicators to assess the intrinsic value of companies through fundamental analysis.",
         "agent_func": fundamentals_analyst_agent,
+        "async_agent_func": afundamentals_analyst_agent,
         "type": "analyst",
         "order": 12,
     },
@@ -139,6 +156,7 @@ ANALYST_CONFIG = {
         "description": "Growth Specialist",
         "investing_style": "Analyzes growth trends and valuation to identify growth opportunities through growth analysis.",
         "agent_func": growth_analyst_agent,
+        "async_agent_func": agrowth_analyst_agent,
         "type": "analyst",
         "order": 13,
     },
@@ -147,6 +165,7 @@ ANALYST_CONFIG = {
         "description": "News Sentiment Specialist",
         "investing_style": "Analyzes news sentiment to predict market movements and identify opportunities through news analysis.",
         "agent_func": news_sentiment_agent,
+        "async_agent_func": anews_sentiment_agent,
         "type": "analyst",
         "order": 14,
     },
@@ -155,6 +174,7 @@ ANALYST_CONFIG = {
         "description": "Market Sentiment Specialist",
         "investing_style": "Gauges market sentiment and investor behavior to predict market movements and identify opportunities through behavioral analysis.",
         "agent_func": sentiment_analyst_agent,
+        "async_agent_func": asentiment_analyst_agent,
         "type": "analyst",
         "order": 15,
     },
@@ -163,6 +183,7 @@ ANALYST_CONFIG = {
         "description": "Company Valuation Specialist",
         "investing_style": "Specializes in determining the fair value of companies, using various valuation models and financial metrics for investment decisions.",
         "agent_func": valuation_analyst_agent,
+        "async_agent_func": avaluation_analyst_agent,
         "type": "analyst",
         "order": 16,
     },
@@ -173,8 +194,19 @@ ANALYST_ORDER = [(config["display_name"], key) for key, config in sorted(ANALYST
 
 
 def get_analyst_nodes():
-    """Get the mapping of analyst keys to their (node_name, agent_func) tuples."""
-    return {key: (f"{key}_agent", config["agent_func"]) for key, config in ANALYST_CONFIG.items()}
+    """Get the mapping of analyst keys to their (node_name, node) tuples; each node runs under both invoke and ainvoke."""
+    return {key: (f"{key}_agent", agent_node(f"{key}_agent", config["agent_func"], config["async_agent_func"])) for key, config in ANALYST_CONFIG.items()}
+
+
+def get_data_needs(selected_analysts: list[str] | None = None) -> list:
+    """Collect the DATA_NEEDS declared by the selected analysts' modules (all analysts when none are given)."""
+    if selected_analysts is None:
+        selected_analysts = list(ANALYST_CONFIG.keys())
+    needs = []
+    for key in selected_analysts:
+        agent_module = sys.modules[ANALYST_CONFIG[key]["agent_func"].__module__]
+        needs.extend(getattr(agent_module, "DATA_NEEDS", []))
+    return needs
 
 
 def get_agents_list():
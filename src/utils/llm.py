@@ -2,7 +2,8 @@
 
 import json
 from pydantic import BaseModel
-from src.llm.models import get_model, get_model_info
+from src.llm.cache import get_llm_cache
+from src.llm.models import get_model, get_model_info, get_structured_model
 from src.utils.progress import progress
 from src.graph.state import AgentState
 
@@ -29,7 +30,84 @@ def call_llm(
     Returns:
         An instance of the specified Pydantic model
     """
-    
+    model_name, model_provider, api_keys = _get_model_config(agent_name, state)
+
+    # An identical earlier request (same model, prompt and output schema) is answered from the cache
+    llm_cache = get_llm_cache()
+    cache_key = llm_cache.key(model_name, model_provider, prompt, pydantic_model)
+    cached_result = llm_cache.get(cache_key, pydantic_model)
+    if cached_result is not None:
+        return cached_result
+
+    llm, model_info = _get_structured_llm(pydantic_model, model_name, model_provider, api_keys)
+
+    # Call the LLM with retries
+    for attempt in range(max_retries):
+        try:
+            # Call the LLM
+            result = llm.invoke(prompt)
+
+            parsed_result = _parse_result(result, pydantic_model, model_info)
+            if parsed_result is not None:
+                llm_cache.set(cache_key, parsed_result)
+                return parsed_result
+
+        except Exception as e:
+            if agent_name:
+                progress.update_status(agent_name, None, f"Error - retry {attempt + 1}/{max_retries}")
+
+            if attempt == max_retries - 1:
+                return _failed_response(e, pydantic_model, max_retries, default_factory)
+
+    # This should never be reached due to the retry logic above
+    return create_default_response(pydantic_model)
+
+
+async def acall_llm(
+    prompt: any,
+    pydantic_model: type[BaseModel],
+    agent_name: str | None = None,
+    state: AgentState | None = None,
+    max_retries: int = 3,
+    default_factory=None,
+) -> BaseModel:
+    """
+    Async version of call_llm, with the same retries and fallbacks.
+
+    The request is awaited with llm.ainvoke rather than holding a thread, so the LLM
+    calls of every agent and ticker in a run can be in flight on one event loop.
+    """
+    model_name, model_provider, api_keys = _get_model_config(agent_name, state)
+
+    llm_cache = get_llm_cache()
+    cache_key = llm_cache.key(model_name, model_provider, prompt, pydantic_model)
+    cached_result = llm_cache.get(cache_key, pydantic_model)
+    if cached_result is not None:
+        return cached_result
+
+    llm, model_info = _get_structured_llm(pydantic_model, model_name, model_provider, api_keys)
+
+    for attempt in range(max_retries):
+        try:
+            result = await llm.ainvoke(prompt)
+
+            parsed_result = _parse_result(result, pydantic_model, model_info)
+            if parsed_result is not None:
+                llm_cache.set(cache_key, parsed_result)
+                return parsed_result
+
+        except Exception as e:
+            if agent_name:
+                progress.update_status(agent_name, None, f"Error - retry {attempt + 1}/{max_retries}")
+
+            if attempt == max_retries - 1:
+                return _failed_response(e, pydantic_model, max_retries, default_factory)
+
+    return create_default_response(pydantic_model)
+
+
+def _get_model_config(agent_name: str | None, state: AgentState | None) -> tuple[str, str, dict | None]:
+    """The agent's (model_name, model_provider, api_keys)."""
     # Extract model configuration if state is provided and agent_name is available
     if state and agent_name:
         model_name, model_provider = get_agent_model_config(state, agent_name)
@@ -44,43 +122,36 @@ def call_llm(
         request = state.get("metadata", {}).get("request")
         if request and hasattr(request, 'api_keys'):
             api_keys = request.api_keys
+    return model_name, model_provider, api_keys
+
 
+def _get_structured_llm(pydantic_model: type[BaseModel], model_name: str, model_provider: str, api_keys: dict | None):
+    """The model, set up to answer with pydantic_model where it supports JSON mode, and its model info."""
     model_info = get_model_info(model_name, model_provider)
-    llm = get_model(model_name, model_provider, api_keys)
 
     # For non-JSON support models, we can use structured output
     if not (model_info and not model_info.has_json_mode()):
-        llm = llm.with_structured_output(
-            pydantic_model,
-            method="json_mode",
-        )
-
-    # Call the LLM with retries
-    for attempt in range(max_retries):
-        try:
-            # Call the LLM
-            result = llm.invoke(prompt)
-
-            # For non-JSON support models, we need to extract and parse the JSON manually
-            if model_info and not model_info.has_json_mode():
-                parsed_result = extract_json_from_response(result.content)
-                if parsed_result:
-                    return pydantic_model(**parsed_result)
-            else:
-                return result
-
-        except Exception as e:
-            if agent_name:
-                progress.update_status(agent_name, None, f"Error - retry {attempt + 1}/{max_retries}")
-
-            if attempt == max_retries - 1:
-                print(f"Error in LLM call after {max_retries} attempts: {e}")
-                # Use default_factory if provided, otherwise create a basic default
-                if default_factory:
-                    return default_factory()
-                return create_default_response(pydantic_model)
-
-    # This should never be reached due to the retry logic above
+        return get_structured_model(model_name, model_provider, pydantic_model, api_keys, method="json_mode"), model_info
+    return get_model(model_name, model_provider, api_keys), model_info
+
+
+def _parse_result(result, pydantic_model: type[BaseModel], model_info) -> BaseModel | None:
+    """The LLM's answer as a pydantic_model instance, or None if no JSON could be extracted from it."""
+    # For non-JSON support models, we need to extract and parse the JSON manually
+    if model_info and not model_info.has_json_mode():
+        parsed_result = extract_json_from_response(result.content)
+        if parsed_result:
+            return pydantic_model(**parsed_result)
+        return None
+    return result
+
+
+def _failed_response(error: Exception, pydantic_model: type[BaseModel], max_retries: int, default_factory) -> BaseModel:
+    """The fallback answer once every attempt has failed."""
+    print(f"Error in LLM call after {max_retries} attempts: {error}")
+    # Use default_factory if provided, otherwise create a basic default
+    if default_factory:
+        return default_factory()
     return create_default_response(pydantic_model)
 
 
@@ -0,0 +1,67 @@
+"""Run an agent's per-ticker work for several tickers at once."""
+
+import asyncio
+import os
+from typing import Awaitable, Callable, Iterable, TypeVar
+
+from src.utils.progress import progress
+
+T = TypeVar("T")
+
+DEFAULT_TICKER_CONCURRENCY = 8
+
+
+def get_ticker_concurrency() -> int:
+    """How many tickers one agent works on at once (HEDGE_FUND_TICKER_CONCURRENCY, default 8)."""
+    return max(int(os.environ.get("HEDGE_FUND_TICKER_CONCURRENCY", DEFAULT_TICKER_CONCURRENCY)), 1)
+
+
+def get_ticker_timeout() -> float | None:
+    """Seconds one ticker's work may take (HEDGE_FUND_TICKER_TIMEOUT, default no limit)."""
+    value = os.environ.get("HEDGE_FUND_TICKER_TIMEOUT")
+    return float(value) if value else None
+
+
+async def amap_tickers(agent_id: str, tickers: Iterable[str], work: Callable[[str], Awaitable[T | None]], max_concurrency: int | None = None, timeout: float | None = None) -> dict[str, T]:
+    """
+    Await work(ticker) for every ticker, at most max_concurrency (default
+    get_ticker_concurrency()) at a time, and return {ticker: result} in ticker order.
+
+    This replaces an agent's serial `for ticker in tickers` loop: the fetches and LLM
+    call of each ticker overlap with those of the others on the running event loop, so
+    an agent takes about as long as its slowest ticker rather than the sum of all of
+    them. A ticker whose work returns None is left out, like a `continue` in the loop.
+    So is a ticker still running `timeout` seconds after it started, which is cancelled
+    and reported as an error, and a ticker whose work ends in a CancelledError it didn't
+    ask for (e.g. from a cancelled fetch it shared). Only cancelling the agent itself
+    cancels the map. If work raises, the first exception in ticker order is re-raised
+    once every ticker has finished.
+    """
+    tickers = list(dict.fromkeys(tickers))
+    if not tickers:
+        return {}
+    semaphore = asyncio.Semaphore(max_concurrency or get_ticker_concurrency())
+    timeout = timeout if timeout is not None else get_ticker_timeout()
+
+    async def run(ticker: str) -> T | None:
+        async with semaphore:
+            try:
+                return await asyncio.wait_for(work(ticker), timeout)
+            except asyncio.TimeoutError:
+                progress.update_status(agent_id, ticker, "Error", analysis=f"Timed out after {timeout:g}s")
+                return None
+            except asyncio.CancelledError:
+                # Cancelling the agent cancels this task too; anything else only fails the ticker
+                if asyncio.current_task().cancelling():
+                    raise
+                progress.update_status(agent_id, ticker, "Error", analysis="Cancelled")
+                return None
+            except Exception as e:
+                progress.update_status(agent_id, ticker, "Error", analysis=str(e))
+                raise
+
+    outcomes = await asyncio.gather(*(run(ticker) for ticker in tickers), return_exceptions=True)
+    for outcome in outcomes:
+        if isinstance(outcome, BaseException):
+            raise outcome
+    return {ticker: result for ticker, result in zip(tickers, outcomes) if result is not None}
@@ -1,3 +1,4 @@
+import threading
 from datetime import datetime, timezone
 from rich.console import Console
 from rich.live import Live
@@ -18,6 +19,8 @@ class AgentProgress:
         self.live = Live(self.table, console=console, refresh_per_second=4)
         self.started = False
         self.update_handlers: List[Callable[[str, Optional[str], str], None]] = []
+        # Agents running in parallel report from different threads
+        self._lock = threading.RLock()
 
     def register_handler(self, handler: Callable[[str, Optional[str], str], None]):
         """Register a handler to be called when agent status updates."""
@@ -43,6 +46,10 @@ class AgentProgress:
 
     def update_status(self, agent_name: str, ticker: Optional[str] = None, status: str = "", analysis: Optional[str] = None):
         """Update the status of an agent."""
+        with self._lock:
+            self._update_status(agent_name, ticker, status, analysis)
+
+    def _update_status(self, agent_name: str, ticker: Optional[str], status: str, analysis: Optional[str]):
         if agent_name not in self.agent_status:
             self.agent_status[agent_name] = {"status": "", "ticker": None}
 
@@ -0,0 +1,359 @@
+"""
+Unit tests for the caching and concurrency behaviour of src/tools/api.py.
+HTTP calls are replaced with canned responses; no network or API key is needed.
+"""
+import asyncio
+import datetime
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.data.cache import Cache  # noqa: E402
+from src.data.cache_backends import MemoryCacheBackend  # noqa: E402
+from src.data.models import InsiderTrade  # noqa: E402
+from src.tools import api, financial_datasets, http_client  # noqa: E402
+
+
+class FakeResponse:
+    def __init__(self, payload: dict, status_code: int = 200):
+        self._payload = payload
+        self.status_code = status_code
+
+    def json(self):
+        return self._payload
+
+
+def _bar(day: str) -> dict:
+    return {"open": 1.0, "close": 2.0, "high": 3.0, "low": 0.5, "volume": 100, "time": f"{day}T05:00:00Z"}
+
+
+@pytest.fixture
+def fresh_cache(monkeypatch):
+    cache = Cache(backend=MemoryCacheBackend())
+    monkeypatch.setattr(api, "_cache", cache)
+    return cache
+
+
+def test_get_prices_serves_sub_ranges_from_cache(fresh_cache, monkeypatch):
+    """After one wide fetch, narrower windows must not hit the API again."""
+    calls = []
+
+    async def fake_request(url, headers, **kwargs):
+        calls.append(url)
+        return FakeResponse({"ticker": "AAPL", "prices": [_bar("2024-01-02"), _bar("2024-01-03"), _bar("2024-01-04")]})
+
+    monkeypatch.setattr(financial_datasets, "_amake_api_request", fake_request)
+
+    assert len(api.get_prices("AAPL", "2024-01-01", "2024-01-05")) == 3
+    one_day = api.get_prices("AAPL", "2024-01-03", "2024-01-03")
+    assert [p.time for p in one_day] == ["2024-01-03T05:00:00Z"]
+    assert len(calls) == 1
+
+
+def test_get_prices_fetches_only_the_gap(fresh_cache, monkeypatch):
+    """A window extending past cached coverage fetches just the uncovered part."""
+    calls = []
+
+    async def fake_request(url, headers, **kwargs):
+        calls.append(url)
+        if "start_date=2024-01-01" in url:
+            return FakeResponse({"ticker": "AAPL", "prices": [_bar("2024-01-02")]})
+        return FakeResponse({"ticker": "AAPL", "prices": [_bar("2024-01-08")]})
+
+    monkeypatch.setattr(financial_datasets, "_amake_api_request", fake_request)
+
+    api.get_prices("AAPL", "2024-01-01", "2024-01-05")
+    prices = api.get_prices("AAPL", "2024-01-01", "2024-01-10")
+    assert [p.time[:10] for p in prices] == ["2024-01-02", "2024-01-08"]
+    assert "start_date=2024-01-06&end_date=2024-01-10" in calls[1]
+
+
+def test_async_variants_fetch_concurrently(fresh_cache, monkeypatch):
+    """aget_* calls for different tickers overlap instead of running back to back."""
+    in_flight = 0
+    peak = 0
+
+    async def fake_request(url, headers, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return FakeResponse({"ticker": "X", "prices": [_bar("2024-01-02")]})
+
+    monkeypatch.setattr(financial_datasets, "_amake_api_request", fake_request)
+
+    async def fetch_all():
+        return await asyncio.gather(*(api.aget_prices(t, "2024-01-01", "2024-01-05") for t in ["A", "B", "C", "D"]))
+
+    results = asyncio.run(fetch_all())
+    assert [len(r) for r in results] == [1, 1, 1, 1]
+    assert peak == 4
+
+
+def test_isolated_runs_keep_blocking_work_off_the_shared_loop():
+    clients = []
+
+    async def agent():
+        clients.append(http_client.get_async_client())
+        # CPU-bound analytics or a busy SQLite cache, as far as the loop is concerned
+        time.sleep(0.3)
+        return "done"
+
+    thread = threading.Thread(target=lambda: clients.append(http_client.run_isolated(agent())))
+    thread.start()
+    time.sleep(0.05)
+    start = time.monotonic()
+    http_client.run_sync(asyncio.sleep(0))
+    assert time.monotonic() - start < 0.2
+    thread.join()
+
+    assert clients[1] == "done"
+    assert clients[0].is_closed
+
+
+def test_search_line_items_many_batches_tickers_and_fills_cache(fresh_cache, monkeypatch):
+    """Several tickers share one search request, and single-ticker calls are then cache hits."""
+    bodies = []
+
+    async def fake_request(url, headers, method="GET", json_data=None, **kwargs):
+        bodies.append(json_data)
+        results = [
+            {"ticker": ticker, "report_period": "2024-12-31", "period": "ttm", "currency": "USD", "revenue": 1.0}
+            for ticker in json_data["tickers"]
+        ]
+        return FakeResponse({"search_results": results})
+
+    monkeypatch.setattr(financial_datasets, "_amake_api_request", fake_request)
+
+    results = api.search_line_items_many(["AAPL", "MSFT", "NVDA"], ["revenue"], "2025-01-01", limit=1)
+    assert list(results) == ["AAPL", "MSFT", "NVDA"]
+    assert [items[0].ticker for items in results.values()] == ["AAPL", "MSFT", "NVDA"]
+    assert len(bodies) == 1 and bodies[0]["tickers"] == ["AAPL", "MSFT", "NVDA"]
+
+    single = api.search_line_items("MSFT", ["revenue"], "2025-01-01", limit=1)
+    assert single[0].revenue == 1.0
+    assert len(bodies) == 1
+
+
+def test_search_line_items_fetches_only_missing_columns(fresh_cache, monkeypatch):
+    """Overlapping line-item requests reuse cached columns and fetch just the new field."""
+    bodies = []
+
+    async def fake_request(url, headers, method="GET", json_data=None, **kwargs):
+        bodies.append(json_data)
+        rows = [
+            {"ticker": "AAPL", "report_period": rp, "period": "ttm", "currency": "USD", **{name: 1.0 for name in json_data["line_items"]}}
+            for rp in ["2024-12-31", "2024-09-30"]
+        ]
+        return FakeResponse({"search_results": rows})
+
+    monkeypatch.setattr(financial_datasets, "_amake_api_request", fake_request)
+
+    api.search_line_items("AAPL", ["free_cash_flow", "revenue"], "2025-01-01", limit=5)
+    items = api.search_line_items("AAPL", ["revenue", "book_value_per_share"], "2025-01-01", limit=5)
+    assert bodies[1]["line_items"] == ["book_value_per_share"]
+    assert items[0].revenue == 1.0 and items[0].book_value_per_share == 1.0
+    assert not hasattr(items[0], "free_cash_flow")
+
+    # Same fields, earlier end date, smaller limit: answered locally
+    older = api.search_line_items("AAPL", ["revenue"], "2024-10-31", limit=1)
+    assert [item.report_period for item in older] == ["2024-09-30"]
+    assert len(bodies) == 2
+
+
+def test_failed_line_item_searches_are_remembered_per_ticker(fresh_cache, monkeypatch):
+    """Unknown tickers and unparsable answers fail the batch as provider errors, cached by kind."""
+    calls = []
+
+    async def fake_request(url, headers, method="GET", json_data=None, **kwargs):
+        calls.append(json_data)
+        if "BAD" in json_data["tickers"]:
+            return FakeResponse({"search_results": [{"ticker": "BAD"}]})
+        return FakeResponse({}, status_code=404)
+
+    monkeypatch.setattr(financial_datasets, "_amake_api_request", fake_request)
+
+    assert api.search_line_items_many(["ZZZZ", "YYYY"], ["revenue"], "2025-01-01") == {"ZZZZ": [], "YYYY": []}
+    assert fresh_cache.get_negative("line_items", "YYYY_ttm", None, "2025-01-01") == "empty"
+    assert api.search_line_items("BAD", ["revenue"], "2025-01-01") == []
+    assert fresh_cache.get_negative("line_items", "BAD_ttm", None, "2025-01-01") == "error"
+
+    api.search_line_items_many(["ZZZZ", "YYYY", "BAD"], ["revenue"], "2025-01-01")
+    assert len(calls) == 2
+
+
+def test_financial_metrics_served_from_larger_or_later_fetch(fresh_cache, monkeypatch):
+    """A limit=10 fetch answers limit=5 and earlier end dates without another request."""
+    calls = []
+    periods = ["2024-12-31", "2024-09-30", "2024-06-30", "2024-03-31", "2023-12-31", "2023-09-30", "2023-06-30", "2023-03-31", "2022-12-31", "2022-09-30"]
+    fields = {name: None for name in api.FinancialMetrics.model_fields if name not in ("ticker", "report_period", "period", "currency")}
+
+    async def fake_request(url, headers, **kwargs):
+        calls.append(url)
+        return FakeResponse({"financial_metrics": [{"ticker": "AAPL", "report_period": rp, "period": "ttm", "currency": "USD", **fields} for rp in periods]})
+
+    monkeypatch.setattr(financial_datasets, "_amake_api_request", fake_request)
+
+    assert len(api.get_financial_metrics("AAPL", "2025-01-31", limit=10)) == 10
+    assert [m.report_period for m in api.get_financial_metrics("AAPL", "2025-01-31", limit=5)] == periods[:5]
+    assert api.get_financial_metrics("AAPL", "2024-08-15", limit=5)[0].report_period == "2024-06-30"
+    assert len(calls) == 1
+
+    # Later end date: reports after 2025-01-31 are unknown, so go back to the API
+    api.get_financial_metrics("AAPL", "2025-06-30", limit=5)
+    assert len(calls) == 2
+
+
+def test_cache_hits_share_validated_immutable_models(fresh_cache, monkeypatch):
+    """Hits return the models validated at fetch time instead of validating cached rows again."""
+    fields = {name: None for name in api.FinancialMetrics.model_fields if name not in ("ticker", "report_period", "period", "currency")}
+    news = [{"ticker": "AAPL", "title": f"t{i}", "author": "a", "source": "s", "date": f"2024-06-0{i + 1}", "url": "u"} for i in range(3)]
+
+    async def fake_request(url, headers, **kwargs):
+        if "/news/" in url:
+            return FakeResponse({"news": news})
+        return FakeResponse({"financial_metrics": [{"ticker": "AAPL", "report_period": "2024-03-31", "period": "ttm", "currency": "USD", **fields}]})
+
+    monkeypatch.setattr(financial_datasets, "_amake_api_request", fake_request)
+
+    first = api.get_financial_metrics("AAPL", "2024-06-30", limit=10)
+    assert api.get_financial_metrics("AAPL", "2024-06-30", limit=10)[0] is api.get_financial_metrics("AAPL", "2024-06-30", limit=10)[0]
+    fetched_news = api.get_company_news("AAPL", "2024-06-30", limit=10)
+    cached_news = api.get_company_news("AAPL", "2024-06-30", limit=10)
+    assert cached_news == fetched_news and cached_news[0] is fetched_news[0]
+    with pytest.raises(ValidationError):
+        first[0].market_cap = 1.0
+
+
+def test_refresh_news_requests_only_items_after_the_high_water_mark(fresh_cache, monkeypatch):
+    def article(day: str, title: str) -> dict:
+        return {"ticker": "AAPL", "title": title, "author": "a", "source": "s", "date": f"{day}T09:00:00Z", "url": "https://example.com"}
+
+    published = [article("2024-06-03", "old"), article("2024-06-05", "seen")]
+    urls = []
+
+    async def fake_request(url, headers, method="GET", json_data=None, **kwargs):
+        urls.append(url)
+        params = dict(part.split("=") for part in url.split("?")[1].split("&"))
+        matching = [a for a in published if params.get("start_date", "") <= a["date"][:10] <= params["end_date"]]
+        return FakeResponse({"news": sorted(matching, key=lambda a: a["date"], reverse=True)})
+
+    monkeypatch.setattr(financial_datasets, "_amake_api_request", fake_request)
+
+    assert [a.title for a in api.refresh_company_news("AAPL", end_date="2024-06-05")] == ["seen", "old"]
+    assert "start_date" not in urls[-1]
+
+    published += [article("2024-06-05", "later that day"), article("2024-06-07", "new")]
+    new = api.refresh_company_news("AAPL", end_date="2024-06-07")
+    assert [a.title for a in new] == ["new", "later that day"]
+    assert "start_date=2024-06-05" in urls[-1]
+
+    # Queries are answered from the synced history
+    assert len(api.get_company_news("AAPL", "2024-06-07", start_date="2024-06-01")) == 4
+    assert len(urls) == 2
+
+
+def test_tickers_without_data_are_not_requested_again(fresh_cache, monkeypatch):
+    calls = []
+
+    async def fake_request(url, headers, method="GET", json_data=None, **kwargs):
+        calls.append(url)
+        if "ticker=BAD" in url:
+            return FakeResponse({}, status_code=500)
+        return FakeResponse({"insider_trades": []})
+
+    monkeypatch.setattr(financial_datasets, "_amake_api_request", fake_request)
+
+    # Every backtest day asks again; only the first request goes out
+    for day in ("2024-06-03", "2024-06-04", "2024-06-05"):
+        assert api.get_insider_trades("TINY", "2024-06-05", start_date=day) == []
+    assert len(calls) == 1
+
+    # A failure is remembered separately from "no data"
+    assert api.get_insider_trades("BAD", "2024-06-05") == []
+    assert fresh_cache.get_negative("insider_trades", "BAD", None, "2024-06-05") == "error"
+    assert fresh_cache.get_negative("insider_trades", "TINY", "2024-06-04", "2024-06-05") == "empty"
+    assert fresh_cache.stats()["insider_trades"]["requests_saved"] == 4
+
+
+def test_repeated_full_page_queries_are_served_from_cache(fresh_cache, monkeypatch):
+    calls = []
+
+    async def fake_request(url, headers, method="GET", json_data=None, **kwargs):
+        calls.append(url)
+        if "insider-trades" in url:
+            empty = dict.fromkeys(InsiderTrade.model_fields)
+            trades = [{**empty, "ticker": "AAPL", "filing_date": f"2024-06-{day:02d}"} for day in range(30, 0, -1)]
+            return FakeResponse({"insider_trades": trades[:10]})
+        articles = [{"ticker": "AAPL", "title": f"Day {day}", "author": "a", "source": "s", "date": f"2024-06-{day:02d}T09:00:00Z", "url": "https://example.com"} for day in range(30, 0, -1)]
+        return FakeResponse({"news": articles[:5]})
+
+    monkeypatch.setattr(financial_datasets, "_amake_api_request", fake_request)
+
+    # Every agent asks for the same full page; only the first asks the API
+    for _ in range(3):
+        assert len(api.get_insider_trades("AAPL", "2024-06-30", limit=10)) == 10
+        assert len(api.get_company_news("AAPL", "2024-06-30", limit=5)) == 5
+    assert len(calls) == 2
+
+
+def test_todays_market_cap_is_served_from_cached_company_facts(fresh_cache, monkeypatch):
+    calls = []
+
+    async def fake_request(url, headers, method="GET", json_data=None, **kwargs):
+        calls.append(url)
+        ticker = url.split("ticker=")[1]
+        return FakeResponse({"company_facts": {"ticker": ticker, "name": ticker, "market_cap": 1.0e12}})
+
+    monkeypatch.setattr(financial_datasets, "_amake_api_request", fake_request)
+    today = datetime.date.today().isoformat()
+
+    # Ten agents asking for the same market cap cause one request
+    for _ in range(10):
+        assert api.get_market_cap("AAPL", today) == 1.0e12
+    assert len(calls) == 1
+
+    assert api.get_market_cap_many(["AAPL", "MSFT", "NVDA"], today) == {"AAPL": 1.0e12, "MSFT": 1.0e12, "NVDA": 1.0e12}
+    assert len(calls) == 3
+
+    # The entry expires within the day (the TTL is read once per cache)
+    monkeypatch.setenv("HEDGE_FUND_CACHE_TTL_COMPANY_FACTS", "0.01")
+    api.get_market_cap("AAPL", today)
+    assert len(calls) == 3
+    monkeypatch.setattr(api, "_cache", Cache(backend=fresh_cache.backend))
+    time.sleep(0.05)
+    api.get_market_cap("AAPL", today)
+    assert len(calls) == 4
+
+
+def test_streaming_news_stops_paginating_when_the_caller_does(fresh_cache, monkeypatch):
+    articles = [{"ticker": "AAPL", "title": f"Day {day}", "author": "a", "source": "s", "date": f"2024-05-{day:02d}T09:00:00Z", "url": "https://example.com"} for day in range(1, 31)]
+    urls = []
+
+    async def fake_request(url, headers, method="GET", json_data=None, **kwargs):
+        urls.append(url)
+        params = dict(part.split("=") for part in url.split("?")[1].split("&"))
+        matching = [a for a in articles if params.get("start_date", "") <= a["date"][:10] <= params["end_date"]]
+        return FakeResponse({"news": sorted(matching, key=lambda a: a["date"], reverse=True)[: int(params["limit"])]})
+
+    monkeypatch.setattr(financial_datasets, "_amake_api_request", fake_request)
+
+    # The newest 5 articles of the month: one page, no further requests
+    first_page = next(iter(api.iter_company_news("AAPL", "2024-05-30", start_date="2024-05-01", limit=5)))
+    assert [a.title for a in first_page] == ["Day 30", "Day 29", "Day 28", "Day 27", "Day 26"]
+    assert len(urls) == 1
+
+    # The page was cached as it arrived
+    assert [a.title for a in api.get_company_news("AAPL", "2024-05-30", start_date="2024-05-27", limit=5)] == ["Day 30", "Day 29", "Day 28", "Day 27"]
+    assert len(urls) == 1
+
+    # Reading every page fetches the rest and returns each article once
+    pages = list(api.iter_company_news("AAPL", "2024-05-30", start_date="2024-05-01", limit=5))
+    assert [a.title for page in pages for a in page] == [f"Day {day}" for day in range(30, 0, -1)]
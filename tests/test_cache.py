@@ -0,0 +1,147 @@
+"""
+Unit tests for src/data/cache.py and its storage backends.
+Everything runs against temporary files; no API calls are made.
+"""
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.data.cache import Cache, merge_date_ranges, missing_date_ranges  # noqa: E402
+from src.data.cache_backends import MemoryCacheBackend, SQLiteCacheBackend  # noqa: E402
+from src.data.models import CompanyNews  # noqa: E402
+from src.data.price_frame import PriceFrame  # noqa: E402
+
+
+def _price(day: int) -> dict:
+    return {"open": 1.0, "close": 1.0, "high": 1.0, "low": 1.0, "volume": 10, "time": f"2024-01-{day:02d}"}
+
+
+def _frame(*days: int) -> PriceFrame:
+    return PriceFrame.from_records([_price(day) for day in days])
+
+
+def test_memory_cache_merges_on_time():
+    """Setting overlapping prices twice must not duplicate rows."""
+    cache = Cache(backend=MemoryCacheBackend())
+    cache.set_prices("AAPL", _frame(1, 2))
+    cache.set_prices("AAPL", _frame(2, 3))
+    assert [p.time[:10] for p in cache.get_prices("AAPL").to_prices()] == ["2024-01-01", "2024-01-02", "2024-01-03"]
+
+
+def _news(day: str, title: str = "x") -> CompanyNews:
+    return CompanyNews(ticker="AAPL", title=title, author="a", source="s", date=day, url="u")
+
+
+def test_sqlite_cache_survives_reopen(tmp_path):
+    """Data written by one backend instance must be readable by a fresh one on the same file."""
+    path = tmp_path / "cache.sqlite"
+    Cache(backend=SQLiteCacheBackend(path)).record_company_news("AAPL", [_news("2024-01-01")], "2024-01-01", "2024-01-31", 100)
+    reopened = Cache(backend=SQLiteCacheBackend(path))
+    assert reopened.get_company_news("AAPL").select("2024-01-01", "2024-01-31", 100) == [_news("2024-01-01")]
+    assert reopened.get_company_news("MSFT") is None
+
+
+def test_sqlite_cache_ttl_expires_entries(tmp_path):
+    """Entries older than the dataset TTL are treated as misses."""
+    cache = Cache(backend=SQLiteCacheBackend(tmp_path / "cache.sqlite"), ttls={"prices": 0.01})
+    cache.set_prices("AAPL", _frame(1))
+    cache.record_company_news("AAPL", [_news("2024-03-31")], None, "2024-03-31", 100)
+    time.sleep(0.05)
+    assert cache.get_prices("AAPL") is None
+    # Datasets without a TTL never expire
+    assert cache.get_company_news("AAPL") is not None
+
+
+def test_sqlite_cache_evicts_least_recently_used(tmp_path):
+    """Once over the byte budget, the entry read longest ago is dropped first."""
+    backend = SQLiteCacheBackend(tmp_path / "cache.sqlite")
+    backend.set("prices", "A", "x" * 1000)
+    backend.set("prices", "B", "x" * 1000)
+    backend.get("prices", "A")  # A is now more recently used than B
+    backend.max_bytes = 2500
+    backend.set("prices", "C", "x" * 1000)
+    assert backend.get("prices", "A") is not None
+    assert backend.get("prices", "B") is None
+    assert backend.get("prices", "C") is not None
+    assert backend.total_bytes() <= 2500
+
+
+def test_memory_cache_evicts_least_recently_used_and_counts():
+    """The in-memory cache stays under its byte ceiling and reports per-dataset counters."""
+    backend = MemoryCacheBackend(max_bytes=2500)
+    backend.set("company_news", "A", "x" * 1000)
+    backend.set("company_news", "B", "x" * 1000)
+    assert backend.get("company_news", "A") is not None  # A is now more recently used than B
+    backend.set("insider_trades", "C", "x" * 1000)
+    assert backend.get("company_news", "B") is None
+    assert backend.total_bytes() <= 2500
+
+    stats = backend.stats()
+    assert stats["company_news"]["hits"] == 1
+    assert stats["company_news"]["misses"] == 1
+    assert stats["company_news"]["evictions"] == 1
+    assert stats["company_news"]["entries"] == 1
+    assert stats["insider_trades"]["bytes"] > 1000
+
+
+def test_negative_entries_distinguish_empty_from_error_and_count_saved_requests():
+    cache = Cache(backend=MemoryCacheBackend(), negative_ttls={"empty": 60, "error": 0.05})
+    cache.record_negative("insider_trades", "TINY", "empty", None, "2024-03-01")
+    cache.record_negative("insider_trades", "TINY", "empty", "2024-03-02", "2024-06-30")
+    # Empty answers cover every query inside the ranges they were given for
+    assert cache.get_negative("insider_trades", "TINY", None, "2024-05-01") == "empty"
+    assert cache.get_negative("insider_trades", "TINY", "2024-04-01", "2024-06-30") == "empty"
+    assert cache.get_negative("insider_trades", "TINY", None, "2024-07-01") is None
+
+    # Failures answer any query for the key, but only briefly
+    cache.record_negative("company_news", "AAPL", "error", None, "2024-06-30")
+    assert cache.get_negative("company_news", "AAPL", "2020-01-01", "2030-01-01") == "error"
+    time.sleep(0.1)
+    assert cache.get_negative("company_news", "AAPL", None, "2024-06-30") is None
+
+    stats = cache.stats()
+    assert stats["insider_trades"]["requests_saved"] == 2
+    assert stats["company_news"]["requests_saved"] == 1
+
+
+def test_merge_date_ranges_joins_adjacent_and_overlapping():
+    ranges = merge_date_ranges([], ("2024-01-01", "2024-01-10"))
+    ranges = merge_date_ranges(ranges, ("2024-01-20", "2024-01-31"))
+    assert ranges == [("2024-01-01", "2024-01-10"), ("2024-01-20", "2024-01-31")]
+    ranges = merge_date_ranges(ranges, ("2024-01-11", "2024-01-19"))
+    assert ranges == [("2024-01-01", "2024-01-31")]
+
+
+def test_missing_date_ranges_returns_only_gaps():
+    ranges = [("2024-01-05", "2024-01-10"), ("2024-01-20", "2024-01-25")]
+    assert missing_date_ranges(ranges, "2024-01-06", "2024-01-09") == []
+    assert missing_date_ranges(ranges, "2024-01-01", "2024-01-31") == [
+        ("2024-01-01", "2024-01-04"),
+        ("2024-01-11", "2024-01-19"),
+        ("2024-01-26", "2024-01-31"),
+    ]
+    assert missing_date_ranges([], "2024-01-01", "2024-01-02") == [("2024-01-01", "2024-01-02")]
+
+
+def test_price_coverage_is_stored_with_rows():
+    cache = Cache(backend=MemoryCacheBackend())
+    cache.set_prices("AAPL", _frame(2), covered=("2024-01-01", "2024-01-03"))
+    cache.set_prices("AAPL", _frame(4), covered=("2024-01-04", "2024-01-05"))
+    assert cache.get_price_coverage("AAPL") == [("2024-01-01", "2024-01-05")]
+    assert len(cache.get_prices("AAPL")) == 2
+
+
+def test_price_frame_slice_and_df_share_memory():
+    """Slicing and DataFrame conversion are views over the cached arrays."""
+    frame = _frame(3, 1, 2)
+    assert frame.close.tolist() == [1.0, 1.0, 1.0]
+    sliced = frame.slice("2024-01-02", "2024-01-03")
+    assert len(sliced) == 2
+    df = sliced.to_df()
+    assert list(df.columns) == ["open", "close", "high", "low", "volume"]
+    assert str(df.index[0].date()) == "2024-01-02"
+    assert np.shares_memory(df.to_numpy(), frame.values)
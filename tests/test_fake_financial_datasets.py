@@ -0,0 +1,73 @@
+"""
+Unit tests for the synthetic Financial Datasets server in scripts/fake_financial_datasets.py.
+Requests go to the app in-process; no network or API key is needed.
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+pytest.importorskip("fastapi")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from scripts.fake_financial_datasets import FakeApiConfig, create_app  # noqa: E402
+from src.data.models import CompanyFactsResponse, CompanyNewsResponse, FinancialMetricsResponse, InsiderTradeResponse, LineItemResponse  # noqa: E402
+from src.tools import financial_datasets  # noqa: E402
+
+
+def _client(config: FakeApiConfig = None) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=create_app(config)), base_url="http://fake")
+
+
+async def _get(path: str, config: FakeApiConfig = None) -> httpx.Response:
+    async with _client(config) as client:
+        return await client.get(path)
+
+
+def test_responses_validate_against_the_client_models():
+    metrics = asyncio.run(_get("/financial-metrics/?ticker=AAPL&report_period_lte=2024-05-15&limit=6&period=quarterly")).json()
+    periods = [row.report_period for row in FinancialMetricsResponse(**metrics).financial_metrics]
+    assert periods == ["2024-03-31", "2023-12-31", "2023-09-30", "2023-06-30", "2023-03-31", "2022-12-31"]
+
+    news = CompanyNewsResponse(**asyncio.run(_get("/news/?ticker=AAPL&end_date=2024-06-30&start_date=2024-06-01&limit=1000")).json()).news
+    assert len(news) == 30 * 5
+    assert news == sorted(news, key=lambda article: article.date, reverse=True)
+    assert InsiderTradeResponse(**asyncio.run(_get("/insider-trades/?ticker=AAPL&filing_date_lte=2024-06-30&limit=7")).json()).insider_trades[0].filing_date == "2024-06-30"
+    assert CompanyFactsResponse(**asyncio.run(_get("/company/facts/?ticker=AAPL")).json()).company_facts.market_cap > 0
+
+    async def search():
+        async with _client() as client:
+            return await client.post("/financials/search/line-items", json={"tickers": ["AAPL", "MSFT"], "line_items": ["revenue"], "end_date": "2024-06-30", "period": "annual", "limit": 4})
+
+    results = LineItemResponse(**asyncio.run(search()).json()).search_results
+    assert [(item.ticker, item.report_period) for item in results] == [("AAPL", "2023-12-31"), ("AAPL", "2022-12-31"), ("MSFT", "2023-12-31"), ("MSFT", "2022-12-31")]
+
+
+def test_rate_limits_and_missing_tickers_are_injected():
+    limited = asyncio.run(_get("/company/facts/?ticker=AAPL", FakeApiConfig(rate_limit_probability=1.0, retry_after=2)))
+    assert limited.status_code == 429
+    assert limited.headers["Retry-After"] == "2"
+    assert asyncio.run(_get("/company/facts/?ticker=ZZZZ", FakeApiConfig(missing_tickers=frozenset({"ZZZZ"})))).status_code == 404
+
+
+def test_provider_paginates_against_the_fake_server(monkeypatch):
+    monkeypatch.setenv("FINANCIAL_DATASETS_BASE_URL", "http://fake/")
+    client = _client(FakeApiConfig(news_per_day=3))
+    urls = []
+
+    async def request(url, headers, method="GET", json_data=None, **kwargs):
+        urls.append(url)
+        return await client.request(method, url, headers=headers, json=json_data)
+
+    monkeypatch.setattr(financial_datasets, "_amake_api_request", request)
+
+    async def collect():
+        async with client:
+            return [page async for page in financial_datasets.FinancialDatasetsProvider().aiter_company_news("AAPL", "2024-06-01", "2024-06-30", 20)]
+
+    pages = asyncio.run(collect())
+    assert all(url.startswith("http://fake/news/") for url in urls)
+    assert len({article for page in pages for article in page}) == 30 * 3
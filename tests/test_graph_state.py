@@ -0,0 +1,50 @@
+"""
+Unit tests for the agent state reducers in src/graph/state.py.
+"""
+import asyncio
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import reduce
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("langchain_core")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.graph.state import agent_node, merge_data  # noqa: E402
+
+
+def test_parallel_analyst_updates_are_merged_per_agent():
+    initial = {"tickers": ["AAPL"], "analyst_signals": {}}
+
+    def analyst(agent_id: str) -> dict:
+        # What an agent node returns: only its own signals, never the shared state
+        return {"analyst_signals": {agent_id: {"AAPL": {"signal": "bullish", "confidence": 50}}}}
+
+    agent_ids = [f"analyst_{i}_agent" for i in range(18)]
+    with ThreadPoolExecutor(max_workers=len(agent_ids)) as pool:
+        updates = list(pool.map(analyst, agent_ids))
+
+    merged = reduce(merge_data, updates, initial)
+    assert sorted(merged["analyst_signals"]) == sorted(agent_ids)
+    assert merged["tickers"] == ["AAPL"]
+    assert initial["analyst_signals"] == {}
+
+
+def test_other_data_keys_are_replaced():
+    merged = merge_data({"analyst_signals": {"a": {}}, "current_prices": {"AAPL": 1.0}}, {"current_prices": {"AAPL": 2.0}})
+    assert merged == {"analyst_signals": {"a": {}}, "current_prices": {"AAPL": 2.0}}
+
+
+def test_agent_nodes_run_the_async_agent_under_ainvoke():
+    async def aagent(state, agent_id="test_agent"):
+        return {"data": {"analyst_signals": {agent_id: "async"}}}
+
+    def agent(state, agent_id="test_agent"):
+        return {"data": {"analyst_signals": {agent_id: "sync"}}}
+
+    node = agent_node("test_agent", agent, aagent)
+    assert node.invoke({})["data"]["analyst_signals"] == {"test_agent": "sync"}
+    assert asyncio.run(node.ainvoke({}))["data"]["analyst_signals"] == {"test_agent": "async"}
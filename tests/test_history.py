@@ -0,0 +1,99 @@
+"""
+Unit tests for src/data/history.py.
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.data.history import EventHistory, ReportHistory  # noqa: E402
+from src.data.models import InsiderTrade  # noqa: E402
+
+
+def _rows(*report_periods: str) -> list[dict]:
+    return [{"report_period": rp, "value": rp} for rp in report_periods]
+
+
+QUARTERS = ["2024-12-31", "2024-09-30", "2024-06-30", "2024-03-31"]
+
+
+def test_truncated_fetch_covers_smaller_and_earlier_queries():
+    history = ReportHistory()
+    history.record(["*"], "2025-01-15", 4, _rows(*QUARTERS))
+    assert history.covers("*", "2025-01-15", 4)
+    assert history.covers("*", "2024-10-01", 3)
+    # Only three reports on or before 2024-10-01 are known, and older ones may exist
+    assert not history.covers("*", "2024-10-01", 4)
+    # Reports after the fetch's end date are unknown
+    assert not history.covers("*", "2025-06-30", 1)
+
+
+def test_complete_fetch_covers_any_limit():
+    history = ReportHistory()
+    history.record(["*"], "2025-01-15", 10, _rows(*QUARTERS))
+    assert history.covers("*", "2024-07-01", 50)
+    assert [row["report_period"] for row in history.select("2024-07-01", 50)] == ["2024-06-30", "2024-03-31"]
+
+
+def test_fields_are_tracked_separately():
+    history = ReportHistory()
+    history.record(["revenue"], "2025-01-15", 2, [{"report_period": "2024-12-31", "revenue": 1}, {"report_period": "2024-09-30", "revenue": 2}])
+    history.record(["net_income"], "2025-01-15", 2, [{"report_period": "2024-12-31", "net_income": 3}, {"report_period": "2024-09-30", "net_income": 4}])
+    assert history.missing_fields(["revenue", "net_income", "capex"], "2025-01-15", 2) == ["capex"]
+    assert history.select("2025-01-15", 1) == [{"report_period": "2024-12-31", "revenue": 1, "net_income": 3}]
+
+
+def test_select_models_builds_each_row_once_until_it_changes():
+    history = ReportHistory()
+    history.record(["*"], "2025-01-15", 4, _rows(*QUARTERS))
+    built = []
+
+    def build(row):
+        built.append(row["report_period"])
+        return dict(row)
+
+    first = history.select_models("2025-01-15", 2, build)
+    assert history.select_models("2025-01-15", 2, build)[0] is first[0]
+    assert built == QUARTERS[:2]
+
+    # A new column for a report invalidates only that report's model
+    history.record(["extra"], "2025-01-15", 1, [{"report_period": QUARTERS[0], "extra": 1}])
+    assert history.select_models("2025-01-15", 2, build)[0]["extra"] == 1
+    assert built == QUARTERS[:2] + QUARTERS[:1]
+
+
+def _trade(filing_date: str, shares: float = 1.0) -> InsiderTrade:
+    fields = {name: None for name in InsiderTrade.model_fields}
+    return InsiderTrade(**{**fields, "ticker": "AAPL", "filing_date": filing_date, "transaction_shares": shares})
+
+
+def test_event_history_answers_as_of_queries_inside_covered_ranges():
+    history = EventHistory(date_field="filing_date")
+    trades = [_trade(f"2024-0{month}-15") for month in range(1, 7)]
+    history.record(trades, "2024-01-01", "2024-06-30", 100)
+
+    # Any date range inside the fetched window, newest first
+    assert history.select("2024-02-01", "2024-04-20", 100) == [trades[3], trades[2], trades[1]]
+    # Without a start date: the newest `limit` trades, if enough of them are known
+    assert history.select(None, "2024-05-01", 2) == [trades[3], trades[2]]
+    assert history.select(None, "2024-05-01", 10) is None
+    # Outside the window the history can't tell
+    assert history.select("2023-12-01", "2024-03-01", 100) is None
+    assert history.select(None, "2024-07-15", 1) is None
+
+
+def test_event_history_short_page_covers_everything_before():
+    history = EventHistory(date_field="filing_date")
+    trades = [_trade("2024-03-01"), _trade("2024-03-01", 2.0), _trade("2024-05-01")]
+    history.record(trades + trades[:1], None, "2024-06-30", 10)
+    assert len(history.items) == 3
+    assert history.select(None, "2024-04-01", 10) == [trades[1], trades[0]]
+    assert history.select("2020-01-01", "2024-06-30", 10) == history.select(None, "2024-06-30", 10)
+
+    # A full page only proves completeness after its oldest day
+    full = EventHistory(date_field="filing_date")
+    full.record([_trade("2024-05-01"), _trade("2024-03-01")], None, "2024-06-30", 2)
+    assert full.coverage == [("2024-03-02", "2024-06-30")]
+    # ...but still answers the query that fetched it
+    assert [t.filing_date for t in full.select(None, "2024-06-30", 2)] == ["2024-05-01", "2024-03-01"]
+    assert full.select(None, "2024-06-30", 3) is None
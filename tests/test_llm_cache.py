@@ -0,0 +1,94 @@
+"""
+Unit tests for the persistent LLM answer cache in src/llm/cache.py.
+Everything runs against temporary files; no model is called.
+"""
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from pydantic import BaseModel
+from typing_extensions import Literal
+
+pytest.importorskip("langchain_core")
+
+from langchain_core.messages import HumanMessage, SystemMessage  # noqa: E402
+from langchain_core.prompts import ChatPromptTemplate  # noqa: E402
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.data.cache_backends import SQLiteCacheBackend  # noqa: E402
+from src.llm.cache import LLMCache, cache_key  # noqa: E402
+
+
+class Signal(BaseModel):
+    signal: Literal["bullish", "bearish", "neutral"]
+    confidence: float
+    reasoning: str
+
+
+class ScoredSignal(BaseModel):
+    signal: str
+    score: float
+
+
+def _prompt(facts: str):
+    template = ChatPromptTemplate.from_messages([("system", "You are Charlie Munger."), ("human", "Facts: {facts}")])
+    return template.invoke({"facts": facts})
+
+
+def test_key_covers_model_prompt_and_schema():
+    key = cache_key("gpt-4.1", "OpenAI", _prompt('{"roic": 0.2}'), Signal)
+    # The same request built another way has the same key
+    assert cache_key("gpt-4.1", "OpenAI", [SystemMessage(content="You are Charlie Munger."), HumanMessage(content='Facts: {"roic": 0.2}')], Signal) == key
+    assert cache_key("gpt-4.1", "OpenAI", "hello", Signal) == cache_key("gpt-4.1", "OpenAI", [HumanMessage(content="hello")], Signal)
+
+    assert cache_key("gpt-4.1", "OpenAI", _prompt('{"roic": 0.3}'), Signal) != key
+    assert cache_key("gpt-4o", "OpenAI", _prompt('{"roic": 0.2}'), Signal) != key
+    assert cache_key("gpt-4.1", "Azure OpenAI", _prompt('{"roic": 0.2}'), Signal) != key
+    assert cache_key("gpt-4.1", "OpenAI", _prompt('{"roic": 0.2}'), ScoredSignal) != key
+
+
+def test_answers_survive_reopen_and_report_hit_rate(tmp_path):
+    path = tmp_path / "llm.sqlite"
+    cache = LLMCache(SQLiteCacheBackend(path))
+    key = cache.key("gpt-4.1", "OpenAI", _prompt("facts"), Signal)
+    assert cache.get(key, Signal) is None
+    cache.set(key, Signal(signal="bullish", confidence=80, reasoning="Wonderful business"))
+
+    reopened = LLMCache(SQLiteCacheBackend(path))
+    assert reopened.get(key, Signal) == Signal(signal="bullish", confidence=80, reasoning="Wonderful business")
+    assert reopened.get(key, Signal) is not None
+    assert reopened.get(cache.key("gpt-4.1", "OpenAI", _prompt("other facts"), Signal), Signal) is None
+    stats = reopened.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (2, 1, 1)
+    assert abs(stats["hit_rate"] - 2 / 3) < 1e-9
+
+
+def test_expired_stale_and_bypassed_entries_are_not_returned(tmp_path):
+    backend = SQLiteCacheBackend(tmp_path / "llm.sqlite")
+    key = cache_key("gpt-4.1", "OpenAI", "prompt", Signal)
+    LLMCache(backend).set(key, Signal(signal="neutral", confidence=50, reasoning="r"))
+
+    assert LLMCache(backend, bypass=True).get(key, Signal) is None
+    # An answer that no longer fits the output model is dropped
+    assert LLMCache(backend).get(key, ScoredSignal) is None
+    assert LLMCache(backend).get(key, Signal) is None
+
+    LLMCache(backend).set(key, Signal(signal="neutral", confidence=50, reasoning="r"))
+    time.sleep(0.05)
+    assert LLMCache(backend, ttl=0.01).get(key, Signal) is None
+
+
+def test_cache_is_off_without_its_own_directory(monkeypatch, tmp_path):
+    monkeypatch.delenv("HEDGE_FUND_LLM_CACHE_DIR", raising=False)
+    # Persisting the data cache doesn't switch the LLM cache on
+    monkeypatch.setenv("HEDGE_FUND_CACHE_DIR", str(tmp_path))
+    cache = LLMCache()
+    assert cache.key("gpt-4.1", "OpenAI", "prompt", Signal) is None
+    assert cache.get(None, Signal) is None
+    assert cache.stats()["hit_rate"] == 0.0
+    assert not list(tmp_path.iterdir())
+
+    monkeypatch.setenv("HEDGE_FUND_LLM_CACHE_DIR", str(tmp_path))
+    assert LLMCache().enabled
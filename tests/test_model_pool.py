@@ -0,0 +1,65 @@
+"""
+Unit tests for the pooled chat model construction in src/llm/models.py.
+Models are constructed but never called, so no API key needs to be valid.
+"""
+import asyncio
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from pydantic import BaseModel
+
+pytest.importorskip("langchain_anthropic")
+pytest.importorskip("langchain_openai")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.llm import models  # noqa: E402
+
+
+class Signal(BaseModel):
+    signal: str
+    confidence: float
+
+
+class Other(BaseModel):
+    value: int
+
+
+@pytest.fixture(autouse=True)
+def _fresh_pool():
+    models.clear_model_pool()
+    yield
+    models.clear_model_pool()
+
+
+def test_clients_are_reused_across_calls_and_threads():
+    api_keys = {"OPENAI_API_KEY": "sk-test"}
+    first = models.get_model("gpt-4.1", "OpenAI", api_keys)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        clients = list(pool.map(lambda _: models.get_model("gpt-4.1", models.ModelProvider.OPENAI, dict(api_keys)), range(16)))
+    assert all(client is first for client in clients)
+
+    assert models.get_model("gpt-4o", "OpenAI", api_keys) is not first
+    assert models.get_model("gpt-4.1", "OpenAI", {"OPENAI_API_KEY": "sk-other"}) is not first
+
+
+def test_structured_wrappers_are_pooled_per_output_model():
+    api_keys = {"OPENAI_API_KEY": "sk-test"}
+    structured = models.get_structured_model("gpt-4.1", "OpenAI", Signal, api_keys)
+    assert models.get_structured_model("gpt-4.1", "OpenAI", Signal, api_keys) is structured
+    assert models.get_structured_model("gpt-4.1", "OpenAI", Other, api_keys) is not structured
+
+
+def test_each_event_loop_gets_its_own_clients():
+    api_keys = {"OPENAI_API_KEY": "sk-test"}
+
+    async def get():
+        return models.get_model("gpt-4.1", "OpenAI", api_keys), models.get_model("gpt-4.1", "OpenAI", api_keys)
+
+    first, again = asyncio.run(get())
+    second, _ = asyncio.run(get())
+    assert first is again
+    assert second is not first
+    assert models.get_model("gpt-4.1", "OpenAI", api_keys) not in (first, second)
@@ -0,0 +1,66 @@
+"""
+Unit tests for the per-ticker parallel map in src/utils/parallel.py.
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# The map reports per-ticker status through src.utils.progress
+pytest.importorskip("rich")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.utils.parallel import amap_tickers  # noqa: E402
+
+
+def test_async_map_keeps_ticker_order_bounds_concurrency_and_times_out():
+    running, peak = 0, 0
+
+    async def work(ticker):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        try:
+            await asyncio.sleep(5 if ticker == "SLOW" else 0.01)
+        finally:
+            running -= 1
+        return None if ticker == "NONE" else ticker.lower()
+
+    tickers = ["SLOW", *(f"T{i}" for i in range(6)), "NONE"]
+    start = time.monotonic()
+    results = asyncio.run(amap_tickers("test_agent", tickers, work, max_concurrency=3, timeout=0.2))
+    assert list(results) == [f"T{i}" for i in range(6)]
+    assert peak == 3
+    assert time.monotonic() - start < 2
+
+
+def test_async_map_raises_the_first_error_in_ticker_order():
+    async def work(ticker):
+        await asyncio.sleep(0.01 if ticker == "A" else 0)
+        raise ValueError(ticker)
+
+    with pytest.raises(ValueError, match="A"):
+        asyncio.run(amap_tickers("test_agent", ["A", "B"], work))
+
+
+def test_async_map_drops_tickers_cancelled_from_elsewhere():
+    async def work(ticker):
+        await asyncio.sleep(0.01)
+        if ticker == "B":
+            # What a ticker sees when a call it depends on is cancelled elsewhere
+            raise asyncio.CancelledError()
+        return ticker.lower()
+
+    assert asyncio.run(amap_tickers("test_agent", ["A", "B", "C"], work)) == {"A": "a", "C": "c"}
+
+    async def cancel_agent():
+        agent = asyncio.ensure_future(amap_tickers("test_agent", ["A", "B"], lambda ticker: asyncio.sleep(5)))
+        await asyncio.sleep(0.01)
+        agent.cancel()
+        await agent
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(cancel_agent())
@@ -0,0 +1,110 @@
+"""
+Unit tests for the local Parquet data provider in src/data/parquet_provider.py.
+A tiny partitioned lake is written to a temporary directory; skipped without pyarrow.
+"""
+import asyncio
+import datetime
+import sys
+from pathlib import Path
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.data.cache import Cache  # noqa: E402
+from src.data.cache_backends import MemoryCacheBackend  # noqa: E402
+from src.data.parquet_provider import ParquetProvider  # noqa: E402
+from src.data.provider import DataProviderError  # noqa: E402
+from src.tools import api  # noqa: E402
+
+
+def _write(root: Path, dataset: str, ticker: str, rows: list[dict], schema=None) -> None:
+    partition = root / dataset / f"ticker={ticker}"
+    partition.mkdir(parents=True)
+    pq.write_table(pa.Table.from_pylist(rows, schema=schema), partition / "part-0.parquet")
+
+
+async def _pages(agen) -> list[list]:
+    return [page async for page in agen]
+
+
+@pytest.fixture
+def lake(tmp_path):
+    days = [datetime.date(2024, 1, 1) + datetime.timedelta(days=i) for i in range(10)]
+    _write(
+        tmp_path,
+        "prices",
+        "AAPL",
+        [{"time": datetime.datetime(d.year, d.month, d.day, 5, tzinfo=datetime.timezone.utc), "open": 1.0, "close": float(i), "high": 2.0, "low": 0.5, "volume": 100} for i, d in enumerate(days)],
+    )
+    _write(
+        tmp_path,
+        "line_items",
+        "AAPL",
+        [{"report_period": f"{2023 - i}-12-31", "period": "annual", "currency": "USD", "revenue": 100.0 - i, "net_income": 10.0 - i, "capital_expenditure": 1.0} for i in range(5)],
+    )
+    _write(
+        tmp_path,
+        "company_news",
+        "AAPL",
+        [{"title": f"News {i}", "author": "a", "source": "s", "date": f"2024-01-{1 + i:02d}T12:00:00Z", "url": "https://example.com"} for i in range(10)],
+    )
+    _write(tmp_path, "company_facts", "AAPL", [{"name": "Apple", "market_cap": 3.0e12}])
+    return tmp_path
+
+
+def test_parquet_provider_answers_like_the_api(lake):
+    provider = ParquetProvider(lake)
+
+    frame = asyncio.run(provider.aget_prices("AAPL", "2024-01-03", "2024-01-05"))
+    assert frame.close.tolist() == [2.0, 3.0, 4.0]
+
+    items = asyncio.run(provider.asearch_line_items(["AAPL", "MSFT"], ["revenue", "total_debt"], "2022-12-31", "annual", 2))
+    assert [item.report_period for item in items["AAPL"]] == ["2022-12-31", "2021-12-31"]
+    assert items["AAPL"][0].revenue == 99.0 and items["AAPL"][0].total_debt is None
+    assert not hasattr(items["AAPL"][0], "net_income")  # only the requested columns are read
+    assert items["MSFT"] == []
+
+    pages = asyncio.run(_pages(provider.aiter_company_news("AAPL", None, "2024-01-05", 2)))
+    assert [[n.title for n in page] for page in pages] == [["News 4", "News 3"]]
+    pages = asyncio.run(_pages(provider.aiter_company_news("AAPL", "2024-01-08", "2024-01-31", 2)))
+    assert [[n.title for n in page] for page in pages] == [["News 9", "News 8"], ["News 7"]]
+
+    assert asyncio.run(provider.aget_company_facts("AAPL")).market_cap == 3.0e12
+    with pytest.raises(DataProviderError) as error:
+        asyncio.run(provider.aget_company_facts("MSFT"))
+    assert error.value.kind == "empty"
+
+
+def test_unreadable_files_and_rows_raise_provider_errors(tmp_path):
+    # A corrupt file, a date column of the wrong type and news rows without titles
+    partition = tmp_path / "prices" / "ticker=AAPL"
+    partition.mkdir(parents=True)
+    (partition / "part-0.parquet").write_bytes(b"not parquet")
+    _write(tmp_path, "financial_metrics", "AAPL", [{"report_period": 20231231, "period": "ttm"}])
+    _write(tmp_path, "company_news", "AAPL", [{"date": "2024-01-01T12:00:00Z", "url": "https://example.com"}])
+    provider = ParquetProvider(tmp_path)
+
+    with pytest.raises(DataProviderError, match="prices: AAPL"):
+        asyncio.run(provider.aget_prices("AAPL", "2024-01-01", "2024-01-05"))
+    with pytest.raises(DataProviderError, match="financial metrics: AAPL"):
+        asyncio.run(provider.aget_financial_metrics("AAPL", "2024-01-05", "ttm", 4))
+    with pytest.raises(DataProviderError, match="company news: AAPL"):
+        asyncio.run(_pages(provider.aiter_company_news("AAPL", None, "2024-01-05", 10)))
+
+
+def test_api_serves_agents_from_the_parquet_provider(lake, monkeypatch):
+    monkeypatch.setattr(api, "_cache", Cache(backend=MemoryCacheBackend()))
+    monkeypatch.setenv("FINANCIAL_DATA_PROVIDER", "parquet")
+    monkeypatch.setenv("FINANCIAL_DATA_PARQUET_DIR", str(lake))
+    api.set_provider(None)
+    try:
+        assert isinstance(api.get_provider(), ParquetProvider)
+        assert len(api.get_prices("AAPL", "2024-01-01", "2024-01-10")) == 10
+        assert [n.title for n in api.get_company_news("AAPL", "2024-01-10", limit=3)] == ["News 9", "News 8", "News 7"]
+        assert api.get_insider_trades("AAPL", "2024-01-10") == []
+    finally:
+        api.set_provider(None)
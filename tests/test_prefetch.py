@@ -0,0 +1,150 @@
+"""
+Unit tests for the data-needs prefetch planner in src/tools/prefetch.py.
+HTTP calls are replaced with canned responses; no network or API key is needed.
+"""
+import asyncio
+import datetime
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.data.cache import Cache  # noqa: E402
+from src.data.cache_backends import MemoryCacheBackend  # noqa: E402
+from src.data.needs import CompanyNewsNeed, FinancialMetricsNeed, LineItemsNeed, MarketCapNeed, PricesNeed  # noqa: E402
+from src.tools import api, financial_datasets, prefetch  # noqa: E402
+
+
+class FakeResponse:
+    def __init__(self, payload: dict, status_code: int = 200):
+        self._payload = payload
+        self.status_code = status_code
+
+    def json(self):
+        return self._payload
+
+
+def test_plan_merges_needs_into_fewest_requests():
+    needs = [
+        FinancialMetricsNeed(period="ttm", limit=5),
+        FinancialMetricsNeed(period="ttm", limit=12),
+        FinancialMetricsNeed(period="annual", limit=10),
+        LineItemsNeed(["revenue", "net_income"], period="annual", limit=5),
+        LineItemsNeed(["net_income", "total_debt"], period="annual", limit=10),
+        CompanyNewsNeed(limit=50),
+        CompanyNewsNeed(limit=50),
+        CompanyNewsNeed(limit=250, lookback_days=365),
+        MarketCapNeed(),
+        PricesNeed(),
+    ]
+    plan = prefetch.plan_prefetch(needs, "2024-06-30")
+
+    assert plan.prices
+    assert not plan.company_facts
+    assert plan.financial_metrics == {"ttm": 12, "annual": 10}
+    assert plan.line_items == {"annual": (["revenue", "net_income", "total_debt"], 10)}
+    assert plan.company_news == prefetch.EventPlan(limit=50, lookback_days=365, lookback_limit=250)
+    assert not plan.insider_trades
+
+
+def test_todays_market_cap_is_planned_as_company_facts():
+    today = datetime.date.today().isoformat()
+    plan = prefetch.plan_prefetch([MarketCapNeed()], today)
+    assert plan.company_facts
+    assert not plan.financial_metrics
+
+
+def test_prefetch_warms_the_cache_for_agent_queries(monkeypatch):
+    monkeypatch.setattr(api, "_cache", Cache(backend=MemoryCacheBackend()))
+    calls = []
+
+    async def fake_request(url, headers, method="GET", json_data=None, **kwargs):
+        calls.append(url)
+        if "line-items" in url:
+            rows = [{"ticker": t, "report_period": f"{2023 - i}-12-31", "period": "annual", "currency": "USD", "revenue": 1.0, "net_income": 2.0} for t in json_data["tickers"] for i in range(2)]
+            return FakeResponse({"search_results": rows})
+        ticker = url.split("ticker=")[1].split("&")[0]
+        fields = {name: None for name in api.FinancialMetrics.model_fields if name not in ("ticker", "report_period", "period", "currency")}
+        rows = [{"ticker": ticker, "report_period": f"{2023 - i}-12-31", "period": "ttm", "currency": "USD", **fields} for i in range(3)]
+        return FakeResponse({"financial_metrics": rows})
+
+    monkeypatch.setattr(financial_datasets, "_amake_api_request", fake_request)
+
+    needs = [FinancialMetricsNeed(period="ttm", limit=5), LineItemsNeed(["revenue", "net_income"], period="annual", limit=5)]
+    prefetch.prefetch(needs, ["AAPL", "MSFT"], "2024-01-01", "2024-06-30")
+    assert len(calls) == 3  # metrics per ticker, line items batched
+
+    # What the agents ask for afterwards is answered from the cache
+    assert len(api.get_financial_metrics("AAPL", "2024-06-30", period="ttm", limit=5)) == 3
+    assert len(api.search_line_items("MSFT", ["net_income"], "2024-06-30", period="annual", limit=2)) == 2
+    assert len(calls) == 3
+
+
+def test_window_prefetch_answers_every_day_of_a_backtest(monkeypatch):
+    monkeypatch.setattr(api, "_cache", Cache(backend=MemoryCacheBackend()))
+    articles = [{"ticker": "AAPL", "title": f"Day {i}", "author": "a", "source": "s", "date": f"2024-{1 + i // 28:02d}-{1 + i % 28:02d}T12:00:00", "url": "https://example.com"} for i in range(6 * 28)]
+    calls = []
+
+    async def fake_request(url, headers, method="GET", json_data=None, **kwargs):
+        calls.append(url)
+        params = dict(part.split("=") for part in url.split("?")[1].split("&"))
+        matching = [a for a in articles if a["date"][:10] <= params["end_date"] and a["date"][:10] >= params.get("start_date", "")]
+        return FakeResponse({"news": sorted(matching, key=lambda a: a["date"], reverse=True)[: int(params["limit"])]})
+
+    monkeypatch.setattr(financial_datasets, "_amake_api_request", fake_request)
+
+    needs = [CompanyNewsNeed(limit=5), CompanyNewsNeed(limit=10, lookback_days=14)]
+    prefetch.prefetch(needs, ["AAPL"], "2024-03-01", "2024-05-28", first_end_date="2024-04-01")
+    fetched = len(calls)
+
+    for day in ("2024-04-01", "2024-04-15", "2024-05-28"):
+        assert len(api.get_company_news("AAPL", day, limit=5)) == 5
+        two_weeks = api.get_company_news("AAPL", day, start_date=prefetch.lookback_start_date(day, 14), limit=10)
+        assert [a.date[:10] for a in two_weeks] == sorted({a["date"][:10] for a in articles if prefetch.lookback_start_date(day, 14) <= a["date"][:10] <= day}, reverse=True)
+    assert len(calls) == fetched
+
+
+def test_agents_send_no_requests_after_prefetch(monkeypatch):
+    # The data-only analysts and the risk manager, run against the synthetic API in-process
+    pytest.importorskip("fastapi")
+    pytest.importorskip("langchain_core")
+    pytest.importorskip("rich")
+    import httpx
+
+    from scripts.fake_financial_datasets import create_app
+    from src.agents import fundamentals, growth_agent, risk_manager, sentiment, technicals, valuation
+
+    monkeypatch.setattr(api, "_cache", Cache(backend=MemoryCacheBackend()))
+    transport = httpx.ASGITransport(app=create_app())
+    urls = []
+
+    async def fake_request(url, headers, method="GET", json_data=None, **kwargs):
+        urls.append(url)
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await client.request(method, url, headers=headers, json=json_data)
+
+    monkeypatch.setattr(financial_datasets, "_amake_api_request", fake_request)
+
+    agents = [sentiment.asentiment_analyst_agent, fundamentals.afundamentals_analyst_agent, technicals.atechnical_analyst_agent, growth_agent.agrowth_analyst_agent, valuation.avaluation_analyst_agent, risk_manager.arisk_management_agent]
+    modules = [sentiment, fundamentals, technicals, growth_agent, valuation, risk_manager]
+    tickers = ["AAPL", "MSFT"]
+    prefetch.prefetch([need for module in modules for need in module.DATA_NEEDS], tickers, "2024-01-01", "2024-06-30")
+    assert urls
+    urls.clear()
+
+    state = {
+        "messages": [],
+        "data": {"tickers": tickers, "portfolio": {"cash": 100000.0, "positions": {}}, "start_date": "2024-01-01", "end_date": "2024-06-30", "analyst_signals": {}},
+        "metadata": {"show_reasoning": False},
+    }
+    for agent in agents:
+        signals = asyncio.run(agent(state))["data"]["analyst_signals"]
+        assert all(set(by_ticker) == set(tickers) for by_ticker in signals.values())
+    assert urls == []
+
+
+def test_unknown_need_is_rejected():
+    with pytest.raises(TypeError):
+        prefetch.plan_prefetch([object()], "2024-06-30")
@@ -0,0 +1,49 @@
+"""
+Unit tests for src/tools/rate_limit.py.
+"""
+import sys
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.tools.rate_limit import BACKOFF_BASE, TokenBucket, backoff_delay, parse_retry_after  # noqa: E402
+
+
+def test_token_bucket_allows_burst_then_spaces_requests():
+    """After the burst is spent, reservations are spaced one rate interval apart, in order."""
+    bucket = TokenBucket(requests_per_minute=60, burst=2)
+    waits = [bucket.reserve() for _ in range(4)]
+    assert waits[0] == 0 and waits[1] == 0
+    assert 0.9 < waits[2] <= 1.0
+    assert 1.9 < waits[3] <= 2.0
+
+
+def test_token_bucket_without_rate_only_applies_pauses():
+    bucket = TokenBucket(requests_per_minute=None)
+    assert bucket.reserve() == 0
+    bucket.pause(5)
+    assert 4.5 < bucket.reserve() <= 5
+
+
+def test_pause_pushes_back_queued_requests():
+    bucket = TokenBucket(requests_per_minute=60, burst=5)
+    bucket.pause(10)
+    first, second = bucket.reserve(), bucket.reserve()
+    assert first >= 10
+    assert second > first
+
+
+def test_parse_retry_after_seconds_and_http_date():
+    assert parse_retry_after("30") == 30
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("garbage") is None
+    in_a_minute = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=60), usegmt=True)
+    assert 55 < parse_retry_after(in_a_minute) <= 60
+
+
+def test_backoff_delay_prefers_retry_after():
+    assert backoff_delay(3, "7") == 7
+    for attempt in range(4):
+        assert BACKOFF_BASE <= backoff_delay(attempt) <= BACKOFF_BASE + BACKOFF_BASE * 2**attempt
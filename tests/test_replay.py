@@ -0,0 +1,112 @@
+"""
+Unit tests for recording and replaying Financial Datasets HTTP responses.
+The "network" is an httpx.MockTransport; nothing leaves the process.
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.data.cache import Cache  # noqa: E402
+from src.data.cache_backends import MemoryCacheBackend  # noqa: E402
+from src.tools import api, http_client  # noqa: E402
+from src.tools.replay import CassetteStore, RecordingTransport, ReplayMissError, ReplayTransport  # noqa: E402
+
+
+def _upstream(calls: list):
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(str(request.url))
+        if request.url.params.get("ticker") == "BUSY":
+            return httpx.Response(429, headers={"Retry-After": "1"})
+        return httpx.Response(200, json={"ticker": request.url.params.get("ticker"), "prices": []})
+
+    return httpx.MockTransport(handler)
+
+
+async def _get(transport, url, headers=None):
+    async with httpx.AsyncClient(transport=transport) as client:
+        return await client.get(url, headers=headers)
+
+
+def test_recorded_responses_replay_without_network(tmp_path):
+    calls = []
+    store = CassetteStore(tmp_path)
+    url = "https://api.financialdatasets.ai/prices/?ticker=AAPL&interval=day"
+
+    recorded = asyncio.run(_get(RecordingTransport(store, _upstream(calls)), url, {"X-API-KEY": "secret"}))
+    assert recorded.json()["ticker"] == "AAPL"
+    assert len(calls) == 1
+    # API keys never end up in cassettes
+    assert "secret" not in "".join(p.read_text() for p in tmp_path.iterdir())
+
+    # Same request with parameters reordered and a different key replays the recording
+    replayed = asyncio.run(_get(ReplayTransport(store), "https://api.financialdatasets.ai/prices/?interval=day&ticker=AAPL", {"X-API-KEY": "other"}))
+    assert replayed.status_code == 200
+    assert replayed.json() == recorded.json()
+    assert len(calls) == 1
+
+
+def test_replay_miss_and_rate_limits_are_not_recorded(tmp_path):
+    calls = []
+    store = CassetteStore(tmp_path)
+    url = "https://api.financialdatasets.ai/prices/?ticker=BUSY"
+
+    assert asyncio.run(_get(RecordingTransport(store, _upstream(calls)), url)).status_code == 429
+    assert list(tmp_path.iterdir()) == []
+    with pytest.raises(ReplayMissError):
+        asyncio.run(_get(ReplayTransport(store), url))
+
+
+def test_replay_misses_fail_instead_of_being_cached_as_empty(tmp_path, monkeypatch):
+    cache = Cache(backend=MemoryCacheBackend())
+    monkeypatch.setattr(api, "_cache", cache)
+    monkeypatch.setattr(api, "_provider", None)
+    monkeypatch.setattr(http_client, "_http_mode", None)
+    monkeypatch.setattr(http_client, "_cassette_dir", None)
+    http_client.set_http_mode("replay", str(tmp_path))
+    try:
+        for _ in range(2):
+            with pytest.raises(ReplayMissError):
+                api.get_financial_metrics("AAPL", "2024-06-30")
+        assert cache.get_negative("financial_metrics", "AAPL_ttm", None, "2024-06-30") is None
+    finally:
+        http_client.set_http_mode("live")
+
+
+def test_switching_mode_or_limit_closes_pooled_clients(tmp_path, monkeypatch):
+    monkeypatch.setattr(http_client, "_http_mode", None)
+    monkeypatch.setattr(http_client, "_cassette_dir", None)
+    monkeypatch.setattr(http_client, "_max_concurrency", None)
+
+    async def client():
+        return http_client.get_async_client()
+
+    # One client on the running background loop, one on an idle loop
+    idle_loop = asyncio.new_event_loop()
+    try:
+        clients = [http_client.run_sync(client()), idle_loop.run_until_complete(client())]
+        http_client.set_http_mode("replay", str(tmp_path))
+        http_client.run_sync(asyncio.sleep(0.01))
+        assert all(c.is_closed for c in clients)
+
+        replay_client = http_client.run_sync(client())
+        assert replay_client not in clients
+        http_client.set_max_concurrency(5)
+        http_client.run_sync(asyncio.sleep(0.01))
+        assert replay_client.is_closed
+    finally:
+        http_client.set_http_mode("live")
+        idle_loop.close()
+
+
+def test_post_bodies_are_part_of_the_key(tmp_path):
+    store = CassetteStore(tmp_path)
+    a = httpx.Request("POST", "https://x/financials/search/line-items", json={"tickers": ["AAPL"], "limit": 5})
+    b = httpx.Request("POST", "https://x/financials/search/line-items", json={"limit": 5, "tickers": ["AAPL"]})
+    c = httpx.Request("POST", "https://x/financials/search/line-items", json={"tickers": ["MSFT"], "limit": 5})
+    assert store.request_key(a) == store.request_key(b)
+    assert store.request_key(a) != store.request_key(c)
@@ -0,0 +1,108 @@
+"""
+Unit tests for src/tools/singleflight.py.
+"""
+import asyncio
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.tools.singleflight import SingleFlight  # noqa: E402
+
+
+def test_concurrent_coroutines_share_one_call():
+    flight = SingleFlight()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.02)
+        return "result"
+
+    async def run():
+        return await asyncio.gather(*(flight.do("key", fetch) for _ in range(5)))
+
+    assert asyncio.run(run()) == ["result"] * 5
+    assert calls == 1
+    assert flight.stats()["coalesced"] == 4
+
+
+def test_callers_on_other_threads_wait_for_the_leader():
+    flight = SingleFlight()
+    calls = 0
+    started = threading.Event()
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        started.set()
+        await asyncio.sleep(0.1)
+        return 42
+
+    results = []
+
+    def leader():
+        results.append(asyncio.run(flight.do("key", fetch)))
+
+    def follower():
+        started.wait()
+        results.append(asyncio.run(flight.do("key", fetch)))
+
+    threads = [threading.Thread(target=leader)] + [threading.Thread(target=follower) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [42] * 4
+    assert calls == 1
+
+
+def test_leader_errors_propagate_and_key_is_released():
+    flight = SingleFlight()
+
+    async def boom():
+        raise ValueError("nope")
+
+    async def ok():
+        return "ok"
+
+    with pytest.raises(ValueError):
+        asyncio.run(flight.do("key", boom))
+    assert asyncio.run(flight.do("key", ok)) == "ok"
+
+
+def test_cancelling_one_caller_does_not_fail_the_others():
+    flight = SingleFlight()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.1)
+        return "result"
+
+    async def run():
+        # The leader times out while a follower waits; the follower retries and leads
+        leader = asyncio.ensure_future(asyncio.wait_for(flight.do("key", fetch), 0.02))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.do("key", fetch))
+        outcomes = await asyncio.gather(leader, follower, return_exceptions=True)
+
+        # A cancelled follower leaves the shared call running for everyone else
+        tasks = [asyncio.ensure_future(flight.do("other", fetch)) for _ in range(3)]
+        await asyncio.sleep(0.02)
+        tasks[1].cancel()
+        return outcomes, await asyncio.gather(*tasks, return_exceptions=True)
+
+    (leader, follower), others = asyncio.run(run())
+    assert isinstance(leader, asyncio.TimeoutError)
+    assert follower == "result"
+    assert others[0] == others[2] == "result"
+    assert isinstance(others[1], asyncio.CancelledError)
+    assert calls == 3
+    assert flight.stats()["in_flight"] == 0